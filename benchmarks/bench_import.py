@@ -0,0 +1,39 @@
+"""Times a cold import of the API and checks the scraping stack isn't imported with it
+
+    python -m benchmarks.bench_import
+"""
+import re
+import subprocess
+import sys
+
+MODULE = 'fairport_run.main'
+# Only a refresh or a new history shard should bring these in
+DEFERRED = ('requests', 'numpy', 'fairport_run.yendata', 'fairport_run.purdy')
+
+
+def import_time(module=MODULE, repeat=5):
+    """Returns the best cumulative microseconds importing module took in a fresh interpreter,
+    and the modules it imported"""
+    best = None
+    modules = set()
+    for _ in range(repeat):
+        result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                                capture_output=True, text=True, check=True)
+        for line in result.stderr.splitlines():
+            match = re.match(r'import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)', line)
+            if match:
+                modules.add(match.group(4))
+                if match.group(4) == module and (best is None or int(match.group(2)) < best):
+                    best = int(match.group(2))
+    return best, modules
+
+
+def main():
+    took, modules = import_time()
+    print(f'import {MODULE}: {took / 1000:.1f}ms')
+    for module in DEFERRED:
+        print(f'  {module:<22} {"imported" if module in modules else "deferred"}')
+
+
+if __name__ == '__main__':
+    main()
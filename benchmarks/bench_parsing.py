@@ -0,0 +1,61 @@
+"""Compares the memoized parsing module against parsing every mark and event name on each call
+
+    python -m benchmarks.bench_parsing
+"""
+import random
+import timeit
+
+from fairport_run import parsing
+
+EVENT_NAMES = ['200m', '300m', '400m', '600m', '800m', '1000m', '1200m', '1500m', '1600m', '1609.34m']
+
+
+def split_time(time):
+    """What format_time cost on a string before it was memoized"""
+    time = time.split(":")
+    return int(time[0]) * 60 + float(time[1])
+
+
+def modulo_format(time):
+    """What format_time did on a float before the seconds were carried into the minutes when rounding"""
+    return f'{int(time // 60)}:{round(time % 60, 2) if time % 60 >= 10 else f"0{round(time % 60, 2)}"}'
+
+
+def char_distance(event_name):
+    """What event_to_dist cost before the event registry"""
+    nums = ""
+    for char in event_name:
+        if char.isnumeric() or char == '.':
+            nums += char
+    return float(nums)
+
+
+def main():
+    random.seed(0)
+    # A season's marks repeat a lot: every athlete of an event runs within a few seconds of each other
+    times = [round(random.uniform(22, 340), 2) for _ in range(5000)]
+    marks = [f'{int(t // 60):02}:{t % 60:05.2f}' for t in times] * 20
+    names = [random.choice(EVENT_NAMES) for _ in range(len(marks))]
+
+    assert [split_time(mark) for mark in marks] == [parsing.parse_time(mark) for mark in marks]
+    assert [char_distance(name) for name in names] == [parsing.event(name).distance for name in names]
+    # Same speed as before, but seconds that round up to 60 are carried instead of printed as 60
+    assert (modulo_format(3719.999), parsing.format_seconds(3719.999)) == ('61:60.0', '62:00.0')
+
+    cases = {
+        'parse, split per call': lambda: [split_time(mark) for mark in marks],
+        'parse, memoized': lambda: [parsing.parse_time(mark) for mark in marks],
+        'format, modulo': lambda: [modulo_format(t) for t in times],
+        'format, carried': lambda: [parsing.format_seconds(t) for t in times],
+        'distance, per char': lambda: [char_distance(name) for name in names],
+        'distance, registry': lambda: [parsing.event(name).distance for name in names],
+    }
+
+    for name, case in cases.items():
+        count = len(times) if name.startswith('format') else len(marks)
+        took = min(timeit.repeat(case, number=5, repeat=5)) / 5 / count
+        print(f'{name:<22} {took * 1e9:8.0f}ns per call')
+
+
+if __name__ == '__main__':
+    main()
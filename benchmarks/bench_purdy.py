@@ -0,0 +1,46 @@
+"""Compares converting times per call against the memoized Purdy.scoring and Purdy.timing functions
+
+    python -m benchmarks.bench_purdy
+"""
+import random
+import timeit
+
+from fairport_run.purdy import Purdy
+
+PAIRS = [(300, 200), (300, 400), (600, 400), (600, 800), (1000, 800), (1000, 1200),
+         (1600, 1200), (1500, 1600), (1600, 1609.34), (1500, 1609.34)]
+
+
+def uncached_convert(from_dist, time, to_dist):
+    """What Purdy(from_dist, time).convert(to_dist) cost before distances were memoized"""
+    adjusted_from, a_from, b_from = Purdy._constants.__wrapped__(Purdy, from_dist)
+    adjusted_to, a_to, b_to = Purdy._constants.__wrapped__(Purdy, to_dist)
+    score = a_from * (adjusted_from / time - b_from)
+    return round(adjusted_to / ((score / a_to) + b_to), 2)
+
+
+def main():
+    random.seed(0)
+    marks = []
+    for _ in range(10000):
+        from_dist, to_dist = random.choice(PAIRS)
+        marks.append((from_dist, round(from_dist / random.uniform(5, 8), 2), to_dist))
+
+    assert [uncached_convert(*mark) for mark in marks] == [Purdy(f, t).convert(to) for f, t, to in marks]
+    assert [uncached_convert(*mark) for mark in marks] == [Purdy.timing(to)(Purdy.scoring(f)(t)) for f, t, to in marks]
+
+    cases = {
+        'uncached per call': lambda: [uncached_convert(*mark) for mark in marks],
+        'Purdy().convert': lambda: [Purdy(f, t).convert(to) for f, t, to in marks],
+        'scoring/timing': lambda: [Purdy.timing(to)(Purdy.scoring(f)(t)) for f, t, to in marks],
+    }
+
+    baseline = None
+    for name, case in cases.items():
+        took = min(timeit.repeat(case, number=5, repeat=5)) / 5 / len(marks)
+        baseline = baseline or took
+        print(f'{name:<18} {took * 1e9:8.0f}ns per conversion  {baseline / took:5.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+"""Times Relay.generate_relays on synthetic 200 athlete rosters
+
+    python -m benchmarks.bench_relays
+"""
+import random
+import time
+import tracemalloc
+
+from fairport_run.model import Athlete, EventType, Performance
+from fairport_run.relays import Relay
+from fairport_run.utils import format_time
+
+EVENTS = {'200m': (22, 30), '400m': (49, 70), '800m': (115, 160), '1200m': (185, 250), '1600m': (255, 340)}
+RELAYS = {
+    '4x200': ['200m'] * 4,
+    '4x400': ['400m'] * 4,
+    '4x800': ['800m'] * 4,
+    'SMR': ['800m', '200m', '200m', '400m'],
+    'DMR': ['1200m', '400m', '800m', '1600m'],
+}
+
+
+def synthetic_roster(size, seed=0):
+    """Returns athletes that each have a mark in most events
+
+    Fast athletes are fast in every event, like on a real roster, so the fastest legs keep colliding.
+    """
+    rng = random.Random(seed)
+    athletes = {}
+    for athlete in range(size):
+        ability = rng.random()
+        performances = {}
+        for event, (fastest, slowest) in EVENTS.items():
+            if rng.random() < 0.8:
+                mark = fastest + (slowest - fastest) * min(1.0, max(0.0, ability + rng.gauss(0, 0.05)))
+                performances[event] = Performance(format_time(round(mark, 2)), None, None, EventType.TRACK, True)
+        athletes[str(athlete)] = Athlete(f'Athlete {athlete}', 'Fairport', 12, performances)
+    return athletes
+
+
+def main():
+    athletes = synthetic_roster(200)
+    for name, legs in RELAYS.items():
+        for number in (10, 100, 500):
+            relay = Relay(athletes, *legs)
+            tracemalloc.start()
+            started = time.perf_counter()
+            relay.generate_relays(number)
+            took = time.perf_counter() - started
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(f'{name:<6} K={number:<4} {len(relay.relays):>4} relays in {took * 1000:8.1f}ms, '
+                  f'peak {peak / 1024:8.1f}KiB')
+
+
+if __name__ == '__main__':
+    main()
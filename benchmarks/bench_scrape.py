@@ -0,0 +1,49 @@
+"""Times a full 2008-onward scrape against a local fake yentiming server
+
+    python -m benchmarks.bench_scrape
+"""
+import tempfile
+import time
+
+from benchmarks.fake_yentiming import FakeYentiming
+from fairport_run import archive, yendata
+from fairport_run.utils import get_current_year
+from fairport_run.yendata import YenData
+
+LATENCY = 0.02
+YEARS = range(2008, get_current_year() + 1)
+
+
+def season_records():
+    sample = YenData(season='outdoor', year=2025, testing=True).data
+    records = []
+    for year in YEARS:
+        for sex in ('m', 'f'):
+            for record in sample:
+                records.append(dict(record, sex=sex, season='outdoor', year=str(year)))
+    return records
+
+
+def scrape_all(concurrency):
+    total = 0
+    for year in YEARS:
+        for gender in ('m', 'f'):
+            total += len(YenData(season='outdoor', year=year, gender=gender, concurrency=concurrency).data)
+    return total
+
+
+def main():
+    # Every live fetch is archived, so the fake server's records go somewhere thrown away
+    with FakeYentiming(season_records(), latency=LATENCY) as fake, tempfile.TemporaryDirectory() as directory:
+        yendata.BASE_URL = fake.url
+        archive.ARCHIVE_DIR = directory
+        for concurrency in (1, 8):
+            fake.requests = 0
+            started = time.perf_counter()
+            total = scrape_all(concurrency)
+            print(f'concurrency={concurrency}: {total} records, {fake.requests} requests, '
+                  f'{time.perf_counter() - started:.2f}s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+"""Compares loading a season from a snapshot against the indent=4 JSON it replaced, and the
+memory the season takes as Athlete objects against the nested dicts they replaced
+
+    python -m benchmarks.bench_snapshot [season.json]
+"""
+import json
+import os
+import sys
+import tempfile
+import timeit
+import tracemalloc
+
+from fairport_run import model, snapshot
+from fairport_run.yendata import YenData
+
+
+def sample_season(copies=20):
+    """Returns the testing season with every athlete repeated to make it larger"""
+    yen = YenData(season='indoor', year=2025, testing=True)
+    yen.data = [dict(record, athlete_id=f'{record["athlete_id"]}{i}') for i in range(copies) for record in yen.data]
+    yen.athletes = yen.organize_data()
+    yen.add_converted()
+    return yen.athletes
+
+
+def allocated(build):
+    """Returns the bytes still allocated by what build returns"""
+    tracemalloc.start()
+    built = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del built
+    return size
+
+
+def main():
+    if len(sys.argv) > 1:
+        with open(sys.argv[1], 'r') as f:
+            athletes = model.from_dict(json.load(f))
+    else:
+        athletes = sample_season()
+
+    with tempfile.TemporaryDirectory() as directory:
+        json_path = os.path.join(directory, 'season.json')
+        snapshot_path = os.path.join(directory, 'season.frs')
+
+        with open(json_path, 'w') as f:
+            f.write(json.dumps(model.to_dict(athletes), indent=4))
+        snapshot.dump(athletes, snapshot_path)
+        assert model.to_dict(snapshot.load(snapshot_path)) == model.to_dict(athletes)
+
+        def load_json():
+            with open(json_path, 'r') as f:
+                return json.load(f)
+
+        number = 20
+        json_time = min(timeit.repeat(load_json, number=number, repeat=5)) / number
+        snapshot_time = min(timeit.repeat(lambda: snapshot.load(snapshot_path), number=number, repeat=5)) / number
+        read_time = min(timeit.repeat(lambda: snapshot.read(snapshot_path), number=number, repeat=5)) / number
+
+        print(f'{len(athletes)} athletes')
+        print(f'json:     {os.path.getsize(json_path):>9} bytes, load {json_time * 1000:.2f}ms')
+        print(f'snapshot: {os.path.getsize(snapshot_path):>9} bytes, load {snapshot_time * 1000:.2f}ms, '
+              f'map columns {read_time * 1000:.3f}ms')
+
+        dict_size = allocated(load_json)
+        model_size = allocated(lambda: snapshot.load(snapshot_path))
+        print(f'in memory: dicts {dict_size / 1024:.0f}KiB, objects {model_size / 1024:.0f}KiB '
+              f'({model_size / dict_size:.0%})')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+import json
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+
+class FakeYentiming(object):
+
+    def __init__(self, records, events=None, latency=0.0):
+        """A local stand-in for the yentiming leaderboard api
+
+        Serves /results2/getEvents and /leaderboard/get the way yentiming does, including the
+        doubly encoded leaderboard json, so YenData can be pointed at it through BASE_URL.
+
+        Args:
+            records: the leaderboard records to serve, filtered by sex, season, year and teams[]
+            events: {season: [event names]} returned from getEvents (defaults to the events in records)
+            latency: seconds each request sleeps before answering, to mimic the real server
+        """
+        self.records = records
+        self.latency = latency
+        self.requests = 0
+        # path -> how many times it was requested
+        self.paths = Counter()
+        if events is None:
+            events = {'indoor': [], 'outdoor': []}
+            for record in records:
+                season = record.get('season', 'outdoor')
+                if record['event_name'] not in events[season]:
+                    events[season].append(record['event_name'])
+        self.events = events
+        self._server = None
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._server.server_address
+        return f'http://{host}:{port}'
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def start(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                fake.requests += 1
+                if fake.latency:
+                    time.sleep(fake.latency)
+
+                request = urlparse(self.path)
+                fake.paths[request.path] += 1
+                if request.path == '/results2/getEvents':
+                    body = json.dumps({season: {name: {} for name in names} for season, names in fake.events.items()})
+                elif request.path == '/leaderboard/get':
+                    body = json.dumps(json.dumps(fake.leaderboard(parse_qs(request.query))))
+                else:
+                    self.send_error(404)
+                    return
+
+                body = body.encode()
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+    def leaderboard(self, query):
+        """Returns one page of records matching a leaderboard query"""
+        limit = int(query['limit'][0])
+        page = int(query['page'][0])
+        teams = set(query.get('teams[]', []))
+        events = set(query.get('events[]', []))
+
+        results = [
+            record for record in self.records
+            if record.get('sex', 'm') == query['sex'][0]
+            and record.get('season', 'outdoor') == query['season'][0]
+            and record.get('year', query['year'][0]) == query['year'][0]
+            and (not teams or record['team_id'] in teams)
+            and (not events or record['event_name'] in events)
+        ]
+
+        start = (page - 1) * limit
+        return {'results': results[start:start + limit], 'hasNext': start + limit < len(results)}
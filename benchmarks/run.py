@@ -0,0 +1,157 @@
+"""Runs the benchmark suite on synthetic seasons and compares it with the previous run
+
+    python -m benchmarks.run                       the import time, then every case at 50, 200, 1000 and 5000 athletes
+    python -m benchmarks.run --sizes 200 --only relays
+    python -m benchmarks.run --no-record           don't append this run to the history
+
+Every run is appended to benchmarks/results.jsonl with the commit it ran on, and each case is
+compared with the last recorded run of the same case: anything more than --threshold slower
+is flagged as a regression.
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import tempfile
+import timeit
+from datetime import datetime
+
+from benchmarks import synthetic
+from benchmarks.bench_import import import_time
+from fairport_run import parsing, scores, snapshot
+from fairport_run.index import EventIndex, Rankings
+from fairport_run.purdy import Purdy
+from fairport_run.relays import STANDARD_RELAYS, Relay, best_lineup
+from fairport_run.utils import format_time
+
+RESULTS = os.path.join(os.path.dirname(__file__), 'results.jsonl')
+SIZES = (50, 200, 1000, 5000)
+
+RELAYS = {
+    '4x400': ['400m'] * 4,
+    '4x800': ['800m'] * 4,
+    'SMR': ['800m', '200m', '200m', '400m'],
+    'DMR': ['1200m', '400m', '800m', '1600m'],
+}
+
+
+def timed(case, repeat=5):
+    """Returns the best seconds per call of case, calling it enough times to take about 0.2s"""
+    timer = timeit.Timer(case)
+    number, took = timer.autorange()
+    number = max(1, int(number * 0.2 / took)) if took else number
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def cases(size, directory):
+    """Returns name -> callable for every case at a roster size, saving snapshots in directory"""
+    records = synthetic.season(size)
+    organized = synthetic.yendata(records)
+    converted = synthetic.yendata(records)
+    converted.add_converted()
+    converted.add_scores()
+
+    marks = [performance.mark for athlete in converted.athletes.values()
+             for event, performance in athlete.performances.items() if performance.time is not None]
+    times = [parsing.parse_time(mark) for mark in marks]
+    flat = [(parsing.event(event).distance, performance.time) for athlete in converted.athletes.values()
+            for event, performance in athlete.performances.items()
+            if performance.time is not None and parsing.event(event).flat]
+
+    path = os.path.join(directory, f'{size}.frs')
+    snapshot.dump(converted.athletes, path)
+
+    def convert():
+        organized.athletes = organized.organize_data()
+        organized.add_converted()
+
+    result = {
+        'format_time/parse': lambda: [format_time(mark) for mark in marks],
+        'format_time/format': lambda: [format_time(time) for time in times],
+        'purdy/purdy_score': lambda: [Purdy(dist, time).purdy_score() for dist, time in flat],
+        'purdy/convert': lambda: [Purdy(dist, time).convert(1600) for dist, time in flat],
+        'organize_data': organized.organize_data,
+        'add_converted': convert,
+        'add_scores': lambda: scores.score(converted.athletes),
+        'rankings': lambda: Rankings(converted.athletes),
+        'snapshot/save': lambda: snapshot.dump(converted.athletes, path),
+        'snapshot/load': lambda: snapshot.load(path),
+    }
+    for name, legs in RELAYS.items():
+        result[f'relays/{name}'] = lambda legs=legs: Relay(converted.athletes, *legs).generate_relays(50)
+    index = EventIndex.from_athletes(converted.athletes)
+    result['relays/lineup'] = lambda: best_lineup(index, STANDARD_RELAYS['outdoor'])
+
+    return result
+
+
+def commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              cwd=os.path.dirname(__file__)).stdout.strip() or None
+    except OSError:
+        return None
+
+
+def previous_results(path):
+    """Returns case -> seconds from the latest recorded run of each case"""
+    latest = {}
+    try:
+        with open(path, 'r') as f:
+            for line in f:
+                if line.strip():
+                    latest.update(json.loads(line)['results'])
+    except FileNotFoundError:
+        pass
+    return latest
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=SIZES, help='roster sizes to run')
+    parser.add_argument('--only', help='only run cases whose name contains this')
+    parser.add_argument('--threshold', type=float, default=0.15, help='slowdown flagged as a regression')
+    parser.add_argument('--results', default=RESULTS, help='the history to compare with and append to')
+    parser.add_argument('--no-record', action='store_true', help="don't append this run to the history")
+    args = parser.parse_args()
+
+    previous = previous_results(args.results)
+    results = {}
+    regressions = []
+
+    def record(key, took):
+        results[key] = took
+        change = ''
+        if key in previous:
+            ratio = took / previous[key] - 1
+            change = f'{ratio:+7.1%}'
+            if ratio > args.threshold:
+                change += '  REGRESSION'
+                regressions.append(key)
+        print(f'{key:<28} {took * 1000:10.3f}ms  {change}')
+
+    if not args.only or args.only in 'import/main':
+        record('import/main', import_time()[0] / 1e6)
+
+    with tempfile.TemporaryDirectory() as directory:
+        for size in args.sizes:
+            for name, case in cases(size, directory).items():
+                if not args.only or args.only in name:
+                    record(f'{name}@{size}', timed(case))
+
+    if not args.no_record:
+        with open(args.results, 'a') as f:
+            f.write(json.dumps({
+                'time': datetime.now().isoformat(timespec='seconds'),
+                'commit': commit(),
+                'python': platform.python_version(),
+                'results': results,
+            }) + '\n')
+
+    if regressions:
+        print(f'{len(regressions)} regressions: {", ".join(regressions)}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,144 @@
+"""Seeded synthetic seasons, shaped like the records yentiming's leaderboard returns
+
+    records = season(athletes=1000, seed=1)
+    yen = yendata(records)
+
+The same arguments always give the same records. Athletes have an ability and a specialty
+(sprints, distance, jumps or throws) and enter two to five events around it, so the fastest
+athletes of one event tend to be the fastest of its neighbours too, like on a real roster.
+"""
+import random
+
+from fairport_run.yendata import YenData
+
+TRACK = 'T'
+FIELD = 'F'
+
+# event name -> (tf, event_id, best, worst) in seconds, inches or points
+EVENTS = {
+    'outdoor': {
+        '100m': (TRACK, '1', 10.6, 14.5), '200m': (TRACK, '51', 21.8, 30.0), '400m': (TRACK, '49', 48.5, 70.0),
+        '800m': (TRACK, '50', 113.0, 165.0), '1500m': (TRACK, '25', 235.0, 330.0),
+        '1600m': (TRACK, '26', 252.0, 360.0), '3200m': (TRACK, '54', 555.0, 780.0),
+        '110 Hurdles': (TRACK, '3', 14.2, 21.0), '400 Int Hurdles': (TRACK, '4', 53.0, 75.0),
+        '3000m Steeple': (TRACK, '12', 570.0, 800.0),
+        '4x100 Relay': (TRACK, '5', 42.5, 48.0), '4x400 Relay': (TRACK, '6', 200.0, 240.0),
+        '4x800 Relay': (TRACK, '7', 470.0, 560.0), '1600 SMR (8-2-2-4)': (TRACK, '9', 215.0, 255.0),
+        'High Jump': (FIELD, '30', 78.0, 54.0), 'Long Jump': (FIELD, '31', 270.0, 160.0),
+        'Triple Jump': (FIELD, '33', 560.0, 360.0), 'Pole Vault': (FIELD, '32', 180.0, 84.0),
+        'Shot Put': (FIELD, '29', 720.0, 300.0), 'Discus Throw': (FIELD, '14', 2100.0, 900.0),
+        'Pentathlon': (FIELD, '13', 3800.0, 1800.0),
+    },
+    'indoor': {
+        '55m': (TRACK, '20', 6.4, 8.2), '55m Hurdles': (TRACK, '21', 7.4, 10.5), '300m': (TRACK, '41', 34.5, 48.0),
+        '600m': (TRACK, '43', 80.0, 115.0), '1000m': (TRACK, '44', 152.0, 215.0),
+        '1600m': (TRACK, '26', 255.0, 365.0), '3200m': (TRACK, '54', 560.0, 790.0),
+        '4x200 Relay': (TRACK, '46', 90.0, 110.0), '4x400 Relay': (TRACK, '6', 205.0, 245.0),
+        '4x800 Relay': (TRACK, '7', 475.0, 570.0),
+        'High Jump': (FIELD, '30', 76.0, 54.0), 'Long Jump': (FIELD, '31', 265.0, 160.0),
+        'Triple Jump': (FIELD, '33', 550.0, 360.0), 'Pole Vault': (FIELD, '32', 174.0, 84.0),
+        'Shot Put': (FIELD, '29', 700.0, 300.0), 'Pentathlon': (FIELD, '13', 3600.0, 1800.0),
+    },
+}
+
+SPECIALTIES = {
+    'sprints': ('100m', '200m', '400m', '55m', '300m', '110 Hurdles', '55m Hurdles', '400 Int Hurdles',
+                '4x100 Relay', '4x200 Relay', '4x400 Relay', '1600 SMR (8-2-2-4)'),
+    'distance': ('400m', '600m', '800m', '1000m', '1500m', '1600m', '3200m', '3000m Steeple',
+                 '4x400 Relay', '4x800 Relay'),
+    'jumps': ('High Jump', 'Long Jump', 'Triple Jump', 'Pole Vault', '100m', '55m', 'Pentathlon'),
+    'throws': ('Shot Put', 'Discus Throw', 'Pentathlon', '100m', '55m'),
+}
+
+FIRST_NAMES = ('Aiden', 'Ben', 'Carter', 'Dylan', 'Ethan', 'Finn', 'Grace', 'Hannah', 'Isla', 'Jack',
+               'Kate', 'Liam', 'Maya', 'Noah', 'Olivia', 'Parker', 'Quinn', 'Riley', 'Sam', 'Tyler')
+LAST_NAMES = ('Adams', 'Brown', 'Clark', 'Davis', 'Evans', 'Foster', 'Garcia', 'Hill', 'Irwin', 'Jones',
+              'King', 'Lopez', 'Miller', 'Nolan', 'Ortiz', 'Price', 'Reed', 'Smith', 'Turner', 'Walsh')
+
+
+def format_track(seconds):
+    """Formats seconds the way yentiming does, '01:05.30'"""
+    minutes, seconds = divmod(round(seconds, 2), 60)
+    return f'{int(minutes):02}:{seconds:05.2f}'
+
+
+def format_field(value, event):
+    """Formats a field mark the way yentiming does, feet-inches ('019-01.50' for throws) or points"""
+    if event == 'Pentathlon':
+        return str(int(value))
+    feet, inches = divmod(round(value * 4) / 4, 12)
+    width = 3 if 'Throw' in event else 2
+    return f'{int(feet):0{width}}-{inches:05.2f}'
+
+
+def meets(rng, season, year, count=12):
+    """Returns (meet_id, name, 'mm/dd/yyyy') for a season's meets"""
+    months = ((12, year - 1), (1, year), (2, year)) if season == 'indoor' else ((4, year), (5, year), (6, year))
+    schedule = []
+    for i in range(count):
+        month, meet_year = months[i * len(months) // count]
+        date = f'{month:02}/{rng.randint(1, 28):02}/{meet_year}'
+        schedule.append((str(2000 + rng.randrange(8000)), f'Meet {i + 1}', date))
+    return schedule
+
+
+def season(athletes=200, season='outdoor', year=2025, gender='m', seed=0, team_id='85', team_name='Fairport'):
+    """Returns the leaderboard records of a synthetic season
+
+    Args:
+        athletes: the size of the roster
+        season: 'indoor' or 'outdoor'
+        year: the year of the season
+        gender: 'm' or 'f'
+        seed: the seed of the generator
+        team_id: the yentiming id of the team
+        team_name: the name of the team
+    """
+    rng = random.Random(f'{seed}-{season}-{year}-{gender}-{athletes}')
+    events = EVENTS[season]
+    schedule = meets(rng, season, year)
+
+    records = []
+    for i in range(athletes):
+        athlete_id = str(600000 + i)
+        first_name, last_name = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        graduate = str(year + rng.randint(0, 3))
+        ability = rng.betavariate(2, 3)
+        specialty = SPECIALTIES[rng.choice(tuple(SPECIALTIES))]
+        entered = [event for event in specialty if event in events]
+        rng.shuffle(entered)
+
+        for event in entered[:rng.randint(2, 5)]:
+            tf, event_id, best, worst = events[event]
+            # Slower athletes are farther from the best mark, with some spread per event
+            value = best + (worst - best) * min(1.0, max(0.0, ability + rng.gauss(0, 0.06)))
+            meet_id, meet, date = rng.choice(schedule)
+            records.append({
+                'performance': format_track(value) if tf == TRACK else format_field(value, event),
+                'event_id': event_id,
+                'classs': 'A',
+                'league': 'Monroe',
+                'meet_date': date,
+                'meet_id': meet_id,
+                'resultType': '0' if rng.random() < 0.9 else '1',
+                'meet': meet,
+                'athlete_id': athlete_id,
+                'athlete_fname': first_name,
+                'athlete_lname': last_name,
+                'graduate': graduate,
+                'event_name': event,
+                'tf': tf,
+                'team_id': team_id,
+                'team_name': team_name,
+                'qual': '',
+            })
+
+    return records
+
+
+def yendata(records, season='outdoor', year=2025, gender='m'):
+    """Returns a YenData holding synthetic records, organized but not converted"""
+    yen = YenData(season=season, year=year, gender=gender, testing=True)
+    yen.data = records
+    yen.athletes = yen.organize_data()
+    return yen
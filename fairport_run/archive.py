@@ -0,0 +1,92 @@
+"""A local archive of the raw records fetched from yentiming
+
+Every fetch of a season is kept, compressed and stored under the sha256 of its contents, so
+fetching the same records again costs nothing:
+
+    archive/objects/ab/abcdef....json.gz         the records YenData.get_array returned
+    archive/refs/{season}/{gender}/{year}.jsonl  one line per fetch: sha256, time and size
+    archive/refs/teams/{team}/...                 the same for teams other than DEFAULT_TEAM
+
+Seasons can then be rebuilt from the archive without scraping (see YenData's from_archive).
+"""
+import gzip
+import hashlib
+import json
+import os
+import pathlib
+from datetime import datetime
+
+from fairport_run.utils import DEFAULT_TEAM, atomic_write, team_key
+
+ARCHIVE_DIR = os.environ.get('FAIRPORT_ARCHIVE', 'archive')
+
+
+def _object_path(digest):
+    return pathlib.Path(ARCHIVE_DIR, 'objects', digest[:2], f'{digest}.json.gz')
+
+
+def _ref_path(year, season, gender, team=DEFAULT_TEAM):
+    team = team_key(team)
+    if team == DEFAULT_TEAM:
+        return pathlib.Path(ARCHIVE_DIR, 'refs', season, gender, f'{year}.jsonl')
+    return pathlib.Path(ARCHIVE_DIR, 'refs', 'teams', team, season, gender, f'{year}.jsonl')
+
+
+def put(year, season, gender, records, team=DEFAULT_TEAM):
+    """Archives the records of a fetch
+
+    Args:
+        year (int): The year of the season
+        season (str): 'indoor' or 'outdoor'
+        gender (str): 'm' or 'f'
+        records (list): the records YenData.get_array returned
+        team: the team, or teams, the records were fetched for (see utils.team_key)
+
+    Returns:
+        str: the sha256 the records are stored under
+    """
+    data = json.dumps(records, sort_keys=True, separators=(',', ':')).encode()
+    digest = hashlib.sha256(data).hexdigest()
+
+    path = _object_path(digest)
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write(path, gzip.compress(data, mtime=0))
+
+    ref = _ref_path(year, season, gender, team)
+    ref.parent.mkdir(parents=True, exist_ok=True)
+    with open(ref, 'a') as f:
+        f.write(json.dumps({
+            'sha256': digest,
+            'fetched': datetime.now().isoformat(timespec='seconds'),
+            'records': len(records),
+        }) + '\n')
+
+    return digest
+
+
+def history(year, season, gender, team=DEFAULT_TEAM):
+    """Returns every archived fetch of a season, oldest first"""
+    try:
+        with open(_ref_path(year, season, gender, team), 'r') as f:
+            return [json.loads(line) for line in f if line.strip()]
+    except FileNotFoundError:
+        return []
+
+
+def get(digest):
+    """Returns the records stored under a sha256"""
+    with open(_object_path(digest), 'rb') as f:
+        return json.loads(gzip.decompress(f.read()))
+
+
+def latest(year, season, gender, team=DEFAULT_TEAM):
+    """Returns the records of the latest archived fetch of a season
+
+    Raises:
+        FileNotFoundError: if the season was never archived
+    """
+    fetches = history(year, season, gender, team)
+    if not fetches:
+        raise FileNotFoundError(f'{season}/{gender}/{year} of team {team_key(team)} is not archived')
+    return get(fetches[-1]['sha256'])
@@ -0,0 +1,109 @@
+"""Builds every season from 2008 onward so no request has to scrape one lazily
+
+    python -m fairport_run.backfill --workers 8
+    python -m fairport_run.backfill --team 85,90,112    a league, saved whole and per team
+"""
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+
+from fairport_run import archive, snapshot
+from fairport_run.store import fetch_season
+from fairport_run.utils import DEFAULT_TEAM, get_current_year, is_past_season, season_path, team_key
+
+
+def build_season(year, season, gender, team=DEFAULT_TEAM, from_archive=False):
+    """Fetches (or reads from the archive), converts and saves a season
+
+    Returns:
+        tuple: the season, the number of athletes and the seconds it took
+    """
+    started = time.perf_counter()
+    yen = fetch_season(year, season, gender, team, from_archive)
+    return (year, season, gender, team), len(yen.athletes), time.perf_counter() - started
+
+
+def is_complete(year, season, gender, team=DEFAULT_TEAM):
+    """Returns whether a season is already saved and will not change anymore"""
+    if not is_past_season(year, season):
+        return False
+
+    try:
+        snapshot.read(season_path(year, season, gender, team))
+    except (OSError, ValueError):
+        return False
+    return True
+
+
+def seasons(start, end, genders=('m', 'f'), team=DEFAULT_TEAM):
+    """Returns every (year, season, gender, team) between two years"""
+    team = team_key(team)
+    return [
+        (year, season, gender, team)
+        for year in range(start, end + 1)
+        for season in ('indoor', 'outdoor')
+        for gender in genders
+    ]
+
+
+def backfill(jobs, workers=8, processes=False, force=False, from_archive=False):
+    """Builds seasons in parallel, skipping the ones that are already complete
+
+    Args:
+        jobs: the (year, season, gender, team) to build
+        workers: the number of seasons to build at once
+        processes: whether to use a process pool instead of a thread pool
+        force: whether to rebuild complete seasons too
+        from_archive: rebuild every archived season offline instead of fetching
+    """
+    if from_archive:
+        jobs = [job for job in jobs if archive.history(*job)]
+    elif not force:
+        jobs = [job for job in jobs if not is_complete(*job)]
+
+    print(f'Building {len(jobs)} seasons with {workers} {"processes" if processes else "threads"}')
+    started = time.perf_counter()
+    built = athletes = 0
+
+    executor = ProcessPoolExecutor if processes else ThreadPoolExecutor
+    with executor(max_workers=workers) as pool:
+        futures = {pool.submit(build_season, *job, from_archive): job for job in jobs}
+        for future in as_completed(futures):
+            name = os.path.splitext(season_path(*futures[future]))[0]
+            try:
+                _, count, took = future.result()
+            except Exception as e:
+                print(f'{name}: failed ({e!r})')
+                continue
+            built += 1
+            athletes += count
+            print(f'{name}: {count} athletes in {took:.2f}s')
+
+    elapsed = time.perf_counter() - started
+    print(f'Built {built}/{len(jobs)} seasons ({athletes} athletes) in {elapsed:.2f}s, '
+          f'{built / elapsed if elapsed else 0:.2f} seasons/s')
+    return built
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Builds every season from yentiming')
+    parser.add_argument('--start', type=int, default=2008, help='the first year to build')
+    parser.add_argument('--end', type=int, default=get_current_year(), help='the last year to build')
+    parser.add_argument('--gender', choices=('m', 'f'), help='only build one gender')
+    parser.add_argument('--team', default=DEFAULT_TEAM, type=team_key,
+                        help='the team, or comma-separated teams fetched together (defaults to %(default)s)')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 4, help='seasons to build at once')
+    parser.add_argument('--processes', action='store_true', help='use a process pool instead of threads')
+    parser.add_argument('--force', action='store_true', help='rebuild seasons that are already complete')
+    parser.add_argument('--from-archive', action='store_true',
+                        help='rebuild every archived season from its raw records without fetching (uses processes)')
+    args = parser.parse_args()
+
+    genders = (args.gender,) if args.gender else ('m', 'f')
+    backfill(seasons(args.start, args.end, genders, args.team), args.workers, args.processes or args.from_archive,
+             args.force, args.from_archive)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+"""The events each season's marks are converted to, as data
+
+Each rule converts an athlete's marks in its source events (and its target, if they have
+one) to the target distance with Purdy points, and adds the fastest as a converted mark if
+it didn't come from the target itself. Rules run in order, so a target can be a source of a
+later rule.
+"""
+from fairport_run.model import EventType, Performance
+from fairport_run.purdy import Purdy
+from fairport_run.utils import event_to_dist, format_time
+
+# season -> (target, (sources, ...)) in the order the rules run
+RULES = {
+    'indoor': (
+        ('200m', ('300m',)),
+        ('400m', ('300m', '600m')),
+        ('800m', ('600m', '1000m')),
+        ('1200m', ('1000m', '1600m')),
+        ('1600m', ('1500m',)),
+        ('1609.34m', ('1600m', '1500m')),
+    ),
+    'outdoor': (
+        ('1200m', ('1600m',)),
+        ('1600m', ('1500m',)),
+        ('1609.34m', ('1600m', '1500m')),
+    ),
+}
+
+
+class ConversionGraph(object):
+
+    def __init__(self, rules):
+        """Conversion rules compiled to run in one pass over each athlete
+
+        Every mark an athlete has in a source event is scored once and each target's time
+        is worked out from those scores. A mark that a rule replaces is scored again when a
+        later rule reads it.
+
+        Args:
+            rules: (target, (sources, ...)) in the order they run
+        """
+        self.rules = []
+        self.sources = set()
+        for target, sources in rules:
+            events = frozenset(sources) | {target}
+            self.rules.append((target, Purdy.timing(event_to_dist(target)), events))
+            self.sources |= events
+        self._scoring = {event: Purdy.scoring(event_to_dist(event)) for event in self.sources}
+
+    def apply(self, athletes, athlete_ids=None):
+        """Adds the converted marks of every rule to athletes
+
+        Args:
+            athletes: athlete_id -> Athlete
+            athlete_ids: only convert these athletes (defaults to all of them)
+        """
+        for athlete_id in athletes.keys() if athlete_ids is None else athlete_ids:
+            self.convert(athletes[athlete_id])
+
+    def convert(self, athlete):
+        """Adds the converted marks of every rule to a single athlete"""
+        performances = athlete.performances
+        # The athlete's marks in any source event, in their order: ties go to the first of them
+        marks = [[event, performance, None] for event, performance in performances.items()
+                 if event in self.sources and performance.time is not None]
+        if not marks:
+            return
+
+        for target, timing, events in self.rules:
+            lowest = None
+            for mark in marks:
+                if mark[0] not in events:
+                    continue
+                if mark[2] is None:
+                    mark[2] = self._scoring[mark[0]](mark[1].time)
+                converted = timing(mark[2])
+                if lowest is None or converted < lowest[0]:
+                    lowest = (converted, mark)
+
+            if lowest is None or lowest[1][0] == target:
+                continue
+
+            lowest_time, (converted_from, source, _) = lowest
+            # The time is parsed back from the mark so it matches what a reload would read
+            performance = Performance(format_time(lowest_time), None, None, EventType.TRACK, source.fat, True,
+                                      converted_from)
+            # Replacing a mark keeps its place among the athlete's marks
+            for mark in marks:
+                if mark[0] == target:
+                    mark[1:] = [performance, None]
+                    break
+            else:
+                marks.append([target, performance, None])
+            performances[target] = performance
+
+
+_graphs = {season: ConversionGraph(rules) for season, rules in RULES.items()}
+
+
+def graph(season):
+    """Returns the compiled ConversionGraph of a season, or None if it has no rules"""
+    return _graphs.get(season)
@@ -0,0 +1,200 @@
+"""An index of every athlete's marks across seasons
+
+Athlete ids are the same from one season to the next, so each saved season gets a small shard
+with every athlete's actual (not converted) marks and their Purdy points:
+
+    history/{season}/{gender}/{year}.json   {"version": ..., "athletes": {athlete_id: {...}}}
+    history/teams/{team}/...                 the same for teams other than DEFAULT_TEAM
+
+A shard is written whenever its season is saved, and remembers the version of the snapshot it
+was built from. HistoryIndex merges the shards into athlete_id -> season -> marks, and only
+reads (or rebuilds) the shards of seasons whose snapshot changed since it last looked.
+
+Only single teams have shards: a season fetched for a group of teams is also saved per team,
+and indexing the group too would list its athletes twice.
+"""
+import json
+import os
+import pathlib
+import threading
+import time
+
+from fairport_run import parsing, snapshot
+from fairport_run.utils import DEFAULT_TEAM, atomic_write, season_path, team_key
+
+HISTORY_DIR = os.environ.get('FAIRPORT_HISTORY', 'history')
+
+SEASONS = ('indoor', 'outdoor')
+GENDERS = ('m', 'f')
+
+
+def _shard_path(year, season, gender, team=DEFAULT_TEAM):
+    team = team_key(team)
+    if team == DEFAULT_TEAM:
+        return pathlib.Path(HISTORY_DIR, season, gender, f'{year}.json')
+    return pathlib.Path(HISTORY_DIR, 'teams', team, season, gender, f'{year}.json')
+
+
+def records(athletes):
+    """Returns athlete_id -> {"grade", "team", "marks": [[event, mark, date, purdy], ...]} for a season
+
+    Args:
+        athletes: athlete_id -> Athlete
+    """
+    scored = []
+    result = {}
+    for athlete_id, athlete in athletes.items():
+        marks = []
+        for event, performance in athlete.performances.items():
+            if performance.converted:
+                continue
+            mark = [event, performance.mark, performance.date, performance.purdy]
+            # Seasons are scored when they are saved, so this is only for athletes that weren't
+            distance = parsing.flat_distance(event) if performance.time is not None and performance.purdy is None else None
+            if distance is not None:
+                scored.append((mark, distance, performance.time))
+            marks.append(mark)
+        result[athlete_id] = {'grade': athlete.grade, 'team': athlete.team, 'marks': marks}
+
+    if scored:
+        # Purdy brings numpy in with it, which only building a shard needs
+        from fairport_run.purdy import Purdy
+
+        scores = Purdy.score_many([dist for _, dist, _ in scored], [time for _, _, time in scored])
+        for (mark, _, _), score in zip(scored, scores):
+            mark[3] = round(score, 2)
+    return result
+
+
+def save_shard(year, season, gender, athletes, team=DEFAULT_TEAM):
+    """Writes the shard of a season that was just saved
+
+    Args:
+        year (int): The year of the season
+        season (str): 'indoor' or 'outdoor'
+        gender (str): 'm' or 'f'
+        athletes: athlete_id -> Athlete, as saved
+        team: the team the season is for
+
+    Returns:
+        dict: the shard
+    """
+    shard = {
+        'version': snapshot.version(os.stat(season_path(year, season, gender, team))),
+        'athletes': records(athletes),
+    }
+    path = _shard_path(year, season, gender, team)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    atomic_write(path, json.dumps(shard, separators=(',', ':')))
+    return shard
+
+
+def load_shard(year, season, gender, team=DEFAULT_TEAM):
+    """Returns the shard of a season, or None if it was never written"""
+    try:
+        with open(_shard_path(year, season, gender, team), 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def saved_seasons():
+    """Returns (year, season, gender, team) -> snapshot version for every single team's season on disk"""
+    roots = {DEFAULT_TEAM: pathlib.Path('.')}
+    for root in pathlib.Path('teams').glob('*'):
+        if root.name.isdigit():
+            roots[root.name] = root
+
+    saved = {}
+    for team, root in roots.items():
+        for season in SEASONS:
+            for gender in GENDERS:
+                for path in root.joinpath(season, gender).glob('*.frs'):
+                    if path.stem.isdigit():
+                        saved[int(path.stem), season, gender, team] = snapshot.version(path.stat())
+    return saved
+
+
+class HistoryIndex(object):
+
+    def __init__(self, max_age=60):
+        """athlete_id -> every season they have marks in, merged from the season shards
+
+        Args:
+            max_age: seconds between checks for seasons that were saved since
+        """
+        self.max_age = max_age
+        self._seasons = {}
+        self._athletes = {}
+        self._synced = None
+        self._lock = threading.Lock()
+
+    def get(self, athlete_id):
+        """Returns an athlete's seasons, oldest first, or None if they have none
+
+        Each season is {"year", "season", "gender", "team_id", "grade", "team", "marks":
+        [{"event", "mark", "date", "purdy"}, ...]}.
+        """
+        if self._synced is None or time.time() - self._synced > self.max_age:
+            self.sync()
+
+        # sync() changes these dicts in place, so they are copied while it can't be running
+        with self._lock:
+            seasons = dict(self._athletes.get(athlete_id, {}))
+        if not seasons:
+            return None
+
+        history = []
+        # Indoor seasons end in the spring of their year, before its outdoor season
+        for (year, season, gender, team), record in sorted(seasons.items(),
+                                                           key=lambda item: (item[0][0], SEASONS.index(item[0][1]))):
+            history.append({
+                'year': year,
+                'season': season,
+                'gender': gender,
+                'team_id': team,
+                'grade': record['grade'],
+                'team': record['team'],
+                'marks': [{'event': event, 'mark': mark, 'date': date, 'purdy': purdy}
+                          for event, mark, date, purdy in record['marks']],
+            })
+        return history
+
+    def sync(self):
+        """Picks up the seasons saved, changed or removed since the last sync
+
+        Shards that are missing or older than their snapshot are rebuilt from it.
+        """
+        with self._lock:
+            saved = saved_seasons()
+            for key in self._seasons.keys() - saved.keys():
+                self._update(key, None, {})
+
+            for key, version in saved.items():
+                if self._seasons.get(key, (None,))[0] == version:
+                    continue
+                year, season, gender, team = key
+                shard = load_shard(*key)
+                if shard is None or shard['version'] != version:
+                    try:
+                        shard = save_shard(year, season, gender, snapshot.load(season_path(*key)), team)
+                    except (OSError, ValueError):
+                        continue
+                self._update(key, shard['version'], shard['athletes'])
+
+            self._synced = time.time()
+
+    def _update(self, key, version, athletes):
+        """Swaps a season's records in, dropping athletes who are no longer in it"""
+        _, previous = self._seasons.pop(key, (None, set()))
+        for athlete_id in previous - athletes.keys():
+            seasons = self._athletes[athlete_id]
+            seasons.pop(key, None)
+            if not seasons:
+                del self._athletes[athlete_id]
+
+        for athlete_id, record in athletes.items():
+            self._athletes.setdefault(athlete_id, {})[key] = record
+
+        if version is not None:
+            self._seasons[key] = (version, set(athletes))
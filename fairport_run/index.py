@@ -0,0 +1,229 @@
+import math
+
+from fairport_run.parsing import EventType, parse_field
+from fairport_run.snapshot import ATHLETE_FIELDS, PERFORMANCE_FIELDS
+
+
+class EventIndex(object):
+
+    def __init__(self, marks):
+        """Every track event's marks in a season, sorted fastest first
+
+        Athletes with the same mark are all kept.
+
+        Args:
+            marks: event -> [(time, athlete_id), ...] in any order
+        """
+        self.marks = marks
+        for event_marks in marks.values():
+            event_marks.sort()
+
+    @classmethod
+    def from_athletes(cls, athletes):
+        """Builds the index from athlete_id -> Athlete, whose track marks are already parsed"""
+        marks = {}
+        for athlete_id, athlete in athletes.items():
+            for event, performance in athlete.performances.items():
+                if performance.time is not None:
+                    marks.setdefault(event, []).append((performance.time, athlete_id))
+        return cls(marks)
+
+    @classmethod
+    def from_snapshot(cls, season):
+        """Builds the index from a Snapshot's columns, whose times are already parsed"""
+        strings = season.strings
+        athlete_ids = [strings[season.athletes[i]] for i in range(0, len(season.athletes), ATHLETE_FIELDS)]
+        performances = season.performances
+        times = season.times
+
+        marks = {}
+        for row in range(season.n_performances):
+            time = times[row]
+            if math.isnan(time):
+                continue
+            i = row * PERFORMANCE_FIELDS
+            marks.setdefault(strings[performances[i + 1]], []).append((time, athlete_ids[performances[i]]))
+        return cls(marks)
+
+    def top(self, event, n=None):
+        """Returns the fastest n (time, athlete_id) marks of an event, or all of them"""
+        marks = self.marks.get(event, [])
+        return marks if n is None else marks[:n]
+
+
+def mark_key(performance):
+    """Sorts performances best first: fastest times, then farthest or highest scoring field marks
+
+    Marks that can't be parsed sort last.
+    """
+    if performance.kind is EventType.TRACK:
+        return math.inf if performance.time is None else performance.time
+    try:
+        return -parse_field(performance.mark)
+    except ValueError:
+        return math.inf
+
+
+class Leaderboard(object):
+    SORTS = ('mark', 'name', 'grade')
+
+    def __init__(self, athletes):
+        """A season's athletes in the orders leaderboard queries ask for, sorted once per load
+
+        Every event's marks are sorted best first when the leaderboard is built; other orders
+        are sorted the first time they are asked for and kept.
+
+        Args:
+            athletes: athlete_id -> Athlete
+        """
+        self.athletes = athletes
+        events = {}
+        for athlete_id, athlete in athletes.items():
+            for event, performance in athlete.performances.items():
+                events.setdefault(event, []).append((mark_key(performance), athlete_id))
+
+        self._orders = {}
+        for event, marks in events.items():
+            marks.sort()
+            self._orders[event, 'mark'] = [athlete_id for _, athlete_id in marks]
+
+    def order(self, event, sort):
+        """Returns the ids of the athletes with a mark in event (any event if None) in a sort order
+
+        Args:
+            event: the event, or None for every athlete
+            sort: 'mark', 'name' or 'grade', best or first first (ties are by name)
+        """
+        key = (event, sort)
+        order = self._orders.get(key)
+        if order is None:
+            if sort == 'mark':
+                return []
+            ids = self.athletes if event is None else self._orders.get((event, 'mark'), [])
+            if sort == 'name':
+                order = sorted(ids, key=lambda athlete_id: self.athletes[athlete_id].name)
+            else:
+                order = sorted(ids, key=lambda athlete_id: (self.athletes[athlete_id].grade,
+                                                           self.athletes[athlete_id].name))
+            self._orders[key] = order
+        return order
+
+    def query(self, event=None, grade=None, converted=None, fat=None, sort=None, descending=False):
+        """Returns the ids of the athletes a leaderboard query matches, in order
+
+        Without an event, an athlete matches if any of their performances match the flags (or
+        no flags are given); with one, if their performance in that event does.
+
+        Args:
+            event: only athletes with a mark in this event
+            grade: only athletes in this grade
+            converted: only converted (True) or only actual (False) performances
+            fat: only fully automatic (True) or only hand (False) times
+            sort: 'mark' (needs an event), 'name' or 'grade' (defaults to mark with an event, else name)
+            descending: reverse the sort
+
+        Returns:
+            list: the athlete ids, in order
+        """
+        sort = sort or ('mark' if event is not None else 'name')
+        if sort not in self.SORTS or (sort == 'mark' and event is None):
+            raise ValueError(f'Can\'t sort by {sort} here')
+
+        order = self.order(event, sort)
+        ids = []
+        for athlete_id in reversed(order) if descending else order:
+            athlete = self.athletes[athlete_id]
+            if grade is not None and athlete.grade != grade:
+                continue
+
+            if event is not None:
+                if self._matches(athlete.performances[event], converted, fat):
+                    ids.append(athlete_id)
+            elif (converted is None and fat is None) or \
+                    any(self._matches(performance, converted, fat) for performance in athlete.performances.values()):
+                ids.append(athlete_id)
+
+        return ids
+
+    def rows(self, ids, event=None, converted=None, fat=None):
+        """Returns the rows of athletes from query, with the same event and flags
+
+        Without an event, a row is an athlete with the performances that match the flags;
+        with one, a row is an athlete's performance in that event.
+        """
+        rows = []
+        for athlete_id in ids:
+            athlete = self.athletes[athlete_id]
+            row = {'athlete_id': athlete_id, 'name': athlete.name, 'team': athlete.team, 'grade': athlete.grade}
+            if event is not None:
+                row['event'] = event
+                row.update(athlete.performances[event].to_dict())
+            else:
+                row['performances'] = {name: performance.to_dict() for name, performance in athlete.performances.items()
+                                       if self._matches(performance, converted, fat)}
+            rows.append(row)
+        return rows
+
+    def page(self, event=None, grade=None, converted=None, fat=None, sort=None, descending=False, offset=0,
+             limit=None):
+        """Returns the total and a page of rows of a leaderboard query (see query and rows)
+
+        Only the rows of the page are built, however many athletes match.
+        """
+        ids = self.query(event, grade, converted, fat, sort, descending)
+        return len(ids), self.rows(ids[offset:offset + limit if limit is not None else None], event, converted, fat)
+
+    @staticmethod
+    def _matches(performance, converted, fat):
+        return (converted is None or performance.converted == converted) and (fat is None or performance.fat == fat)
+
+
+class Rankings(object):
+
+    def __init__(self, athletes):
+        """A season's athletes ranked across events by their best Purdy score
+
+        Only actual (not converted) flat races count, as scored at ingestion. The ranking is
+        sorted once per load; rankings within a grade are filtered from it when first asked for.
+
+        Args:
+            athletes: athlete_id -> Athlete, scored (see fairport_run.scores)
+        """
+        self.athletes = athletes
+        best = []
+        for athlete_id, athlete in athletes.items():
+            top = None
+            for event, performance in athlete.performances.items():
+                if performance.purdy is not None and not performance.converted and \
+                        (top is None or performance.purdy > top[0]):
+                    top = (performance.purdy, event)
+            if top is not None:
+                best.append((-top[0], athlete.name, athlete_id, top[1]))
+
+        best.sort()
+        self._orders = {None: [(athlete_id, event) for _, _, athlete_id, event in best]}
+
+    def order(self, grade=None):
+        """Returns (athlete_id, event of their best score) best first, only for a grade if given"""
+        order = self._orders.get(grade)
+        if order is None:
+            order = self._orders[grade] = [(athlete_id, event) for athlete_id, event in self._orders[None]
+                                           if self.athletes[athlete_id].grade == grade]
+        return order
+
+    def page(self, grade=None, offset=0, limit=None):
+        """Returns the total and a page of ranking rows
+
+        Each row is {"rank", "athlete_id", "name", "team", "grade", "event", "performance",
+        "purdy"}, ranked within the grade if one is given.
+        """
+        order = self.order(grade)
+        rows = []
+        for rank, (athlete_id, event) in enumerate(order[offset:offset + limit if limit is not None else None],
+                                                   offset + 1):
+            athlete = self.athletes[athlete_id]
+            performance = athlete.performances[event]
+            rows.append({'rank': rank, 'athlete_id': athlete_id, 'name': athlete.name, 'team': athlete.team,
+                         'grade': athlete.grade, 'event': event, 'performance': performance.mark,
+                         'purdy': performance.purdy})
+        return len(order), rows
@@ -1,18 +1,58 @@
-import json
+import asyncio
+import hashlib
 import os
+from contextlib import asynccontextmanager
 from datetime import datetime
 from enum import Enum
-from typing import List
+from typing import Dict, List, Optional, Union
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
-from fairport_run.relays import Relay
-from fairport_run.utils import get_current_season, get_current_year, get_file_age
-from fairport_run.yendata import YenData
+from fairport_run import metrics, model
+from fairport_run.history import GENDERS, SEASONS, HistoryIndex
+from fairport_run.relays import STANDARD_RELAYS
+from fairport_run.responses import cached_json, encode
+from fairport_run.scheduler import RefreshScheduler
+from fairport_run.store import store
+from fairport_run.workers import RelayPool, Saturated, WorkerDied
+from fairport_run.utils import DEFAULT_TEAM, get_current_year, is_past_season, season_path, team_key
 
-app = FastAPI()
+scheduler = RefreshScheduler(store)
+history_index = HistoryIndex()
+relay_pool = RelayPool()
+
+# The teams and groups of teams that can be queried: DEFAULT_TEAM, the ones the scheduler refreshes
+# and the space-separated keys in $FAIRPORT_TEAMS (e.g. '90 85,90,112'). Any other one would be
+# scraped and saved under teams/ just for being asked for.
+TEAMS = ({DEFAULT_TEAM} | set(scheduler.teams)
+         | {team_key(team) for team in os.environ.get('FAIRPORT_TEAMS', '').split()})
+
+# The most relay results memoized per season
+RELAY_CACHE_SIZE = 256
+
+# The most relays one /relays/batch request can ask for
+MAX_BATCH_RELAYS = 16
+
+# The parameters of /athletes that ask for a page of rows instead of the whole season
+ATHLETE_QUERY = ('event', 'grade', 'converted', 'fat', 'fields', 'sort', 'limit', 'offset')
+
+# The keys of athlete query rows that fields can pick (athlete_id is always kept)
+ATHLETE_FIELDS = ('name', 'team', 'grade', 'performances', 'event', 'performance', 'date', 'meet', 'type',
+                  'fat', 'converted', 'converted_from', 'purdy')
+
+
+@asynccontextmanager
+async def lifespan(app):
+    scheduler.start()
+    relay_pool.start()
+    yield
+    await scheduler.stop()
+    relay_pool.stop()
+
+
+app = FastAPI(lifespan=lifespan)
 
 origins = [
     "https://alpha.fairport.run",
@@ -33,69 +73,314 @@ class RelayRequest(BaseModel):
     season: str
     gender: str
     legs: List[str]
+    count: int = Field(10, ge=1, le=500)
+    roster: Optional[int] = Field(None, ge=1)
+    team: Union[int, str] = DEFAULT_TEAM
+
+class RelayBatchRequest(BaseModel):
+    year: int
+    season: str
+    gender: str
+    relays: Optional[Dict[str, List[str]]] = None
+    count: int = Field(10, ge=1, le=500)
+    roster: Optional[int] = Field(None, ge=1)
+    team: Union[int, str] = DEFAULT_TEAM
+    parallel: bool = False
+    lineup: bool = False
+
+def parse_team(team):
+    """Returns the key of a team query parameter, or raises a 400 if it isn't one of TEAMS"""
+    try:
+        key = team_key(team)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if key not in TEAMS:
+        raise HTTPException(status_code=400, detail=f'Unknown team {key!r}, use one of: {", ".join(sorted(TEAMS))}')
+    return key
+
+def season_entry(year, season, gender, team=DEFAULT_TEAM):
+    """Returns a season from the store, or raises a 404 if it can't exist"""
+    # season and gender come from the URL and end up in paths, so nothing touches the disk before this
+    if season not in SEASONS or gender not in GENDERS:
+        raise HTTPException(status_code=404)
+
+    if not os.path.exists(season_path(year, season, gender, team)):
+        now = datetime.now()
+
+        if year < 2008 or year > now.year + 1:
+            raise HTTPException(status_code=404)
+
+    return store.entry(year, season, gender, team)
+
+def encode_season(entry):
+    """Encodes a whole season the way /athletes returns it"""
+    with metrics.span('encode'):
+        return encode(model.to_dict(entry.athletes))
+
+def query_athletes(entry, event, grade, converted, fat, fields, sort, limit, offset):
+    """Runs an athlete query against a season's Leaderboard and returns the encoded page"""
+    descending = sort is not None and sort.startswith('-')
+    try:
+        total, page = entry.leaderboard.page(event, grade, converted, fat, sort and sort.removeprefix('-'), descending,
+                                             offset, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if fields is not None:
+        keep = {field.strip() for field in fields.split(',') if field.strip()}
+        unknown = keep.difference(ATHLETE_FIELDS)
+        if unknown:
+            raise HTTPException(status_code=400, detail=f'Unknown fields: {", ".join(sorted(unknown))}')
+        keep.add('athlete_id')
+        page = [{key: value for key, value in row.items() if key in keep} for row in page]
+
+    end = offset + len(page)
+    return encode({
+        'total': total,
+        'offset': offset,
+        'next': end if end < total else None,
+        'athletes': page,
+    })
+
+def season_etag(entry, year, season, gender, team, request=None):
+    """Returns the ETag of a response from a season, which also depends on the request's query if given"""
+    tag = f'{year}-{season}-{gender}-{team}-{entry.version}'
+    if request is not None:
+        tag += '-' + hashlib.sha1(str(request.query_params).encode()).hexdigest()[:16]
+    return f'"{tag}"'
+
+async def cached_relays(entry, key, search):
+    """Returns the encoded results of a relay search, memoized on the season's entry
+
+    Args:
+        entry: the SeasonEntry searched
+        key: what the results are memoized under
+        search: an async function running the search in relay_pool and returning what to encode
+
+    Raises a 503 if too many searches are running or the worker died, a 504 if it took too long.
+    """
+    body = entry.relays.get(key)
+    if body is not None:
+        metrics.inc('fairport_cache_hits_total', cache='relays')
+        return body
+
+    metrics.inc('fairport_cache_misses_total', cache='relays')
+    try:
+        results = await search()
+    except Saturated:
+        raise HTTPException(status_code=503, detail='Too many relay searches are running, try again shortly')
+    except WorkerDied:
+        raise HTTPException(status_code=503, detail='The relay search failed, try again shortly')
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=504, detail='The relay search took too long')
+
+    body = encode(results)
+    if len(entry.relays) >= RELAY_CACHE_SIZE:
+        entry.relays.pop(next(iter(entry.relays)), None)
+    entry.relays[key] = body
+    return body
 
 @app.get("/")
 def read_root():
     return {"Info": "This is the root directory of the Fairport.run API. View /docs for more information."}
 
+@app.get("/athletes/{athlete_id}/history")
+async def athlete_history(athlete_id: str):
+    """## Returns an athlete's marks in every season, oldest first
+
+    Each season has the athlete's grade, team and team_id and their actual (not converted)
+    marks, with Purdy points for flat races.
+
+    Args:\n
+        athlete_id (str): The yentiming id of the athlete
+    """
+
+    seasons = await asyncio.to_thread(history_index.get, athlete_id)
+    if seasons is None:
+        raise HTTPException(status_code=404)
+    return Response(content=encode(seasons), media_type='application/json')
+
 @app.get("/athletes/{year}/{season}/{gender}")
-def read_athletes(year: int, season: str, gender: str):
+async def read_athletes(year: int, season: str, gender: str, request: Request,
+                        event: Optional[str] = None, grade: Optional[int] = None,
+                        converted: Optional[bool] = None, fat: Optional[bool] = None,
+                        fields: Optional[str] = None, sort: Optional[str] = None,
+                        limit: Optional[int] = Query(None, ge=1, le=1000), offset: int = Query(0, ge=0),
+                        team: str = DEFAULT_TEAM):
     """## Returns a list of athletes and their top performance in each event
 
+    Responses carry an ETag, and past seasons can be cached by the client.
+
+    Without any of the parameters below (other than team) the whole season is returned. With
+    any of them, a page of rows is:
+    one per athlete, or one per performance when an event is given, as
+    {"total", "offset", "next", "athletes": [...]}.
+
     Args:\n
         year (int): The year of the season\n
         season (str): The season of track 'indoor' or 'outdoor'
         gender (str): The gender 'm' or 'f'
+        event (str): Only athletes with a mark in this event, one row per mark
+        grade (int): Only athletes in this grade
+        converted (bool): Only converted (true) or only actual (false) performances
+        fat (bool): Only fully automatic (true) or only hand (false) times
+        fields (str): Comma-separated row keys to return, e.g. 'name,performance'
+        sort (str): 'mark' (with an event), 'name' or 'grade', prefixed with '-' to reverse
+        limit (int): The most rows to return, at most 1000
+        offset (int): How many rows to skip, the previous page's "next"
+        team (str): The yentiming id of the team, 85 by default, or several ('85,90,112') to
+            rank a league's athletes together
     """
 
-    if os.path.exists(f'{season}/{gender}/{year}.json'):
-        if season == get_current_season() and year == get_current_year() and get_file_age(f'{season}/{gender}/{year}.json') > 60 * 60 * 12:
-            get_athletes(year, season, gender)
-            return read_athletes(year, season, gender)
+    team = parse_team(team)
+    entry = await asyncio.to_thread(season_entry, year, season, gender, team)
+    closed = is_past_season(year, season)
 
+    # Parameters that aren't the query's, like a cache buster, still get the whole season
+    if request.query_params.keys() & set(ATHLETE_QUERY):
+        body = await asyncio.to_thread(query_athletes, entry, event, grade, converted, fat, fields, sort,
+                                       limit, offset)
+        return cached_json(request, body, season_etag(entry, year, season, gender, team, request), closed)
 
-        with open(f'{season}/{gender}/{year}.json', 'r') as f:
-            return json.load(f)
+    if entry.body is None:
+        metrics.inc('fairport_cache_misses_total', cache='body')
+        entry.body = await asyncio.to_thread(encode_season, entry)
     else:
-        now = datetime.now()
+        metrics.inc('fairport_cache_hits_total', cache='body')
 
-        if year < 2008 or year > now.year + 1:
-            raise HTTPException(status_code=404)
+    return cached_json(request, entry.body, season_etag(entry, year, season, gender, team), closed)
+
+@app.get("/leaderboard/{year}/{season}/{gender}")
+async def leaderboard(year: int, season: str, gender: str, request: Request, teams: str, event: str,
+                      grade: Optional[int] = None, converted: Optional[bool] = None, fat: Optional[bool] = None,
+                      limit: int = Query(50, ge=1, le=1000), offset: int = Query(0, ge=0)):
+    """## Returns the best marks in an event across a league
+
+    The teams are fetched together and ranked in one index, so this is a lookup however many
+    teams there are. Rows are the same as /athletes with an event.
+
+    Args:\n
+        year (int): The year of the season\n
+        season (str): The season of track 'indoor' or 'outdoor'
+        gender (str): The gender 'm' or 'f'
+        teams (str): The yentiming ids of the league's teams, e.g. '85,90,112'
+        event (str): The event to rank
+        grade (int): Only athletes in this grade
+        converted (bool): Only converted (true) or only actual (false) performances
+        fat (bool): Only fully automatic (true) or only hand (false) times
+        limit (int): The most rows to return, at most 1000 (50 by default)
+        offset (int): How many rows to skip, the previous page's "next"
+    """
+
+    teams = parse_team(teams)
+    entry = await asyncio.to_thread(season_entry, year, season, gender, teams)
+    body = await asyncio.to_thread(query_athletes, entry, event, grade, converted, fat, None, 'mark', limit, offset)
+    return cached_json(request, body, season_etag(entry, year, season, gender, teams, request),
+                       is_past_season(year, season))
+
+@app.get("/rankings/{year}/{season}/{gender}")
+async def rankings(year: int, season: str, gender: str, request: Request, grade: Optional[int] = None,
+                   limit: int = Query(50, ge=1, le=1000), offset: int = Query(0, ge=0), team: str = DEFAULT_TEAM):
+    """## Returns athletes ranked across events by their best Purdy score
+
+    Only actual (not converted) flat races count. Returns {"total", "offset", "next", "athletes":
+    [{"rank", "athlete_id", "name", "team", "grade", "event", "performance", "purdy"}, ...]}.
+
+    Args:\n
+        year (int): The year of the season\n
+        season (str): The season of track 'indoor' or 'outdoor'
+        gender (str): The gender 'm' or 'f'
+        grade (int): Only rank athletes in this grade
+        limit (int): The most rows to return, at most 1000 (50 by default)
+        offset (int): How many rows to skip, the previous page's "next"
+        team (str): The yentiming id of the team, 85 by default, or several ('85,90,112') to
+            rank a league together
+    """
 
-        get_athletes(year, season, gender)
-        return read_athletes(year, season, gender)
+    team = parse_team(team)
+    entry = await asyncio.to_thread(season_entry, year, season, gender, team)
+    total, rows = entry.rankings.page(grade, offset, limit)
+    end = offset + len(rows)
+    body = encode({'total': total, 'offset': offset, 'next': end if end < total else None, 'athletes': rows})
+    return cached_json(request, body, season_etag(entry, year, season, gender, team, request),
+                       is_past_season(year, season))
 
 @app.post("/relays")
-def relays(request: RelayRequest):
-    """Returns a list of the 10 fastest possible relays in a given year
+async def relays(request: RelayRequest):
+    """Returns a list of the fastest possible relays in a given year
 
     Args:\n
         year (int): The year of the season
         season (str): The season of track
         legs (tuple): The legs of the race
         gender (str): The gender 'm' or 'f'
+        count (int): How many relays to return, at most 500 (10 by default)
+        roster (int): Only consider the fastest this many athletes in each event
+        team (str): The yentiming id of the team, 85 by default
+
+    Searches run in a separate process pool. A 503 means too many are already queued (or
+    the worker running this one died), a 504 that this one took too long.
+    """
+
+    entry = await asyncio.to_thread(season_entry, request.year, request.season, request.gender,
+                                    parse_team(request.team))
+    key = (tuple(request.legs), request.count, request.roster)
+    body = await cached_relays(entry, key, lambda: relay_pool.generate_relays(entry.index, request.legs,
+                                                                                request.count, request.roster))
+    return Response(content=body, media_type='application/json')
+
+@app.post("/relays/batch")
+async def relays_batch(request: RelayBatchRequest):
+    """Returns the fastest relays of several kinds from a single load of the season
+
+    Returns {"relays": {name: [relay, ...]}, "lineup": {name: relay or null} or null}.
+
+    Args:\n
+        year (int): The year of the season
+        season (str): The season of track
+        gender (str): The gender 'm' or 'f'
+        relays (dict): name -> the legs of the relay, the season's standard relays (4x100,
+            4x200, 4x400, 4x800, SMR and DMR outdoors) by default
+        count (int): How many of each relay to return, at most 500 (10 by default)
+        roster (int): Only consider the fastest this many athletes in each event
+        team (str): The yentiming id of the team, 85 by default
+        parallel (bool): Search each relay in a worker process of its own, or in one if not enough are free
+        lineup (bool): Also return a lineup in which no athlete runs two of the relays. It is
+            approximate: a good lineup from each relay's fastest few, not always the best one
+
+    A 503 means too many searches are already queued (or a worker died), a 504 that these
+    took too long.
     """
 
-    athletes = read_athletes(request.year, request.season, request.gender)
-    relay = Relay(athletes, *request.legs)
-    relay.generate_relays(10)
-    return relay.relays
+    relays = request.relays if request.relays is not None else STANDARD_RELAYS.get(request.season)
+    if not relays or len(relays) > MAX_BATCH_RELAYS or not all(relays.values()):
+        raise HTTPException(status_code=400,
+                            detail=f'Give between 1 and {MAX_BATCH_RELAYS} relays, each with at least one leg')
+
+    entry = await asyncio.to_thread(season_entry, request.year, request.season, request.gender,
+                                    parse_team(request.team))
+    key = ('batch', tuple((name, tuple(legs)) for name, legs in relays.items()), request.count, request.roster,
+           request.lineup)
+
+    async def search():
+        results, lineup = await relay_pool.generate_batch(entry.index, relays, request.count, request.roster,
+                                                          request.parallel, request.lineup)
+        return {'relays': results, 'lineup': lineup}
+
+    body = await cached_relays(entry, key, search)
+    return Response(content=body, media_type='application/json')
 
 @app.get("/years")
 def years():
     """Returns a list of all possible years"""
     return list(range(2008, get_current_year() + 1))
 
+@app.get("/metrics")
+def read_metrics():
+    """Returns the API's counters and stage timings in the Prometheus text format"""
+    return Response(content=metrics.render(), media_type='text/plain; version=0.0.4')
 
-
-
-def get_athletes(year, season, gender):
-    """Fetches the results of the season from yentiming and then saves them
-
-    Args:
-        year (int): The year of the season.
-        season (str): The season, 'indoor' or 'outdoor'.
-    """
-    yen = YenData(year=year, season=season, gender=gender)
-    yen.add_converted()
-    yen.save_athletes()
\ No newline at end of file
+@app.get("/status")
+def status():
+    """Returns when each season was last refreshed in the background and how long it took"""
+    return scheduler.status
@@ -0,0 +1,105 @@
+"""Counters and timings of the pipeline, exported in the Prometheus text format at /metrics
+
+Recording is a dict update under a lock; nothing is formatted until /metrics is scraped.
+
+    with metrics.span('organize_data'):
+        ...
+    metrics.inc('fairport_cache_hits_total', cache='season')
+
+Metrics are per process: the API exports its own, and relay searches report theirs back to it.
+"""
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+
+_SECONDS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+COUNTERS = {
+    'fairport_upstream_requests_total': 'Requests made to yentiming',
+    'fairport_cache_hits_total': 'Lookups answered from a cache',
+    'fairport_cache_misses_total': 'Lookups a cache could not answer',
+    'fairport_relay_heap_pops_total': 'Relays taken off the relay search heap',
+    'fairport_relay_subproblems_total': 'Subproblems the relay search solved',
+    'fairport_relay_pool_restarts_total': 'Times the relay pool was replaced after a worker died',
+}
+
+HISTOGRAMS = {
+    'fairport_stage_seconds': ('Seconds spent in each stage of the pipeline', _SECONDS),
+    'fairport_relay_peak_heap': ('Most subproblems queued at once during a relay search',
+                                 (1, 10, 100, 1000, 10000, 100000)),
+}
+
+_lock = threading.Lock()
+_counters = {}
+_histograms = {}
+
+
+def _key(name, labels):
+    return name, tuple(sorted(labels.items()))
+
+
+def inc(name, amount=1, **labels):
+    """Adds to a counter from COUNTERS"""
+    key = _key(name, labels)
+    with _lock:
+        _counters[key] = _counters.get(key, 0) + amount
+
+
+def observe(name, value, **labels):
+    """Records a value in a histogram from HISTOGRAMS"""
+    key = _key(name, labels)
+    buckets = HISTOGRAMS[name][1]
+    with _lock:
+        histogram = _histograms.get(key)
+        if histogram is None:
+            # One count per bucket plus +Inf, then the sum
+            histogram = _histograms[key] = [0] * (len(buckets) + 1) + [0.0]
+        histogram[bisect.bisect_left(buckets, value)] += 1
+        histogram[-1] += value
+
+
+@contextmanager
+def span(stage, **labels):
+    """Times a stage of the pipeline into fairport_stage_seconds"""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe('fairport_stage_seconds', time.perf_counter() - started, stage=stage, **labels)
+
+
+def _labels(labels, extra=()):
+    pairs = list(labels) + list(extra)
+    if not pairs:
+        return ''
+    escaped = (str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') for _, value in pairs)
+    return '{' + ','.join(f'{name}="{value}"' for (name, _), value in zip(pairs, escaped)) + '}'
+
+
+def render():
+    """Returns every metric in the Prometheus text exposition format"""
+    with _lock:
+        counters = dict(_counters)
+        histograms = {key: list(value) for key, value in _histograms.items()}
+
+    lines = []
+    for name, help_text in COUNTERS.items():
+        lines += [f'# HELP {name} {help_text}', f'# TYPE {name} counter']
+        for (metric, labels), value in sorted(counters.items()):
+            if metric == name:
+                lines.append(f'{name}{_labels(labels)} {value}')
+
+    for name, (help_text, buckets) in HISTOGRAMS.items():
+        lines += [f'# HELP {name} {help_text}', f'# TYPE {name} histogram']
+        for (metric, labels), histogram in sorted(histograms.items()):
+            if metric != name:
+                continue
+            cumulative = 0
+            for bound, count in zip(list(buckets) + ['+Inf'], histogram):
+                cumulative += count
+                lines.append(f'{name}_bucket{_labels(labels, [("le", bound)])} {cumulative}')
+            lines.append(f'{name}_sum{_labels(labels)} {histogram[-1]}')
+            lines.append(f'{name}_count{_labels(labels)} {cumulative}')
+
+    return '\n'.join(lines) + '\n'
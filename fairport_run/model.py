@@ -0,0 +1,125 @@
+"""The in-memory model of a season
+
+Athletes and performances are slotted objects rather than dicts: times are parsed to floats
+once, event, meet, team and date strings are interned so a season shares one copy of each,
+and the event type is an enum. Purdy scores are set once the season is scored (see
+fairport_run.scores). They only become the JSON shape the API serves in to_dict.
+"""
+import sys
+
+from fairport_run.parsing import EventType, parse_time as _parse_time
+
+
+def intern(string):
+    """Interns a string, passing None through"""
+    return None if string is None else sys.intern(string)
+
+
+def parse_time(mark, kind=EventType.TRACK):
+    """Returns a track mark in seconds, or None for field marks and marks that aren't times"""
+    if kind is not EventType.TRACK:
+        return None
+    try:
+        return _parse_time(mark)
+    except ValueError:
+        return None
+
+
+class Performance(object):
+    __slots__ = ('mark', 'time', 'date', 'meet', 'kind', 'fat', 'converted', 'converted_from', 'purdy')
+
+    # Worked out from the mark, so they don't make two performances different
+    DERIVED = ('time', 'purdy')
+
+    def __init__(self, mark, date, meet, kind, fat, converted=False, converted_from=None, time=None, purdy=None):
+        """An athlete's best performance in an event
+
+        Args:
+            mark: the performance as yentiming writes it (e.g. '02:01.35' or '18-02.00')
+            date: the date of the meet (None for converted performances)
+            meet: the name of the meet (None for converted performances)
+            kind: the EventType of the event
+            fat: whether the time was fully automatic
+            converted: whether the performance was converted from another event
+            converted_from: the event it was converted from
+            time: the mark in seconds, parsed from the mark if not given
+            purdy: the Purdy score of a flat race, None until the season is scored
+        """
+        self.mark = mark
+        self.date = intern(date)
+        self.meet = intern(meet)
+        self.kind = kind
+        self.fat = fat
+        self.converted = converted
+        self.converted_from = intern(converted_from)
+        self.time = time if time is not None else parse_time(mark, kind)
+        self.purdy = purdy
+
+    def __eq__(self, other):
+        if not isinstance(other, Performance):
+            return NotImplemented
+        return all(getattr(self, slot) == getattr(other, slot) for slot in self.__slots__ if slot not in self.DERIVED)
+
+    def to_dict(self):
+        return {
+            'performance': self.mark,
+            'date': self.date,
+            'meet': self.meet,
+            'type': self.kind.value,
+            'fat': self.fat,
+            'converted': self.converted,
+            'converted_from': self.converted_from,
+            'purdy': self.purdy
+        }
+
+    @classmethod
+    def from_dict(cls, performance):
+        return cls(performance['performance'], performance['date'], performance['meet'],
+                   EventType(performance['type']), performance['fat'], performance['converted'],
+                   performance['converted_from'], purdy=performance.get('purdy'))
+
+
+class Athlete(object):
+    __slots__ = ('name', 'team', 'grade', 'performances')
+
+    def __init__(self, name, team, grade, performances=None):
+        """An athlete and their best performance in each event
+
+        Args:
+            name: the athlete's full name
+            team: the name of the athlete's team
+            grade: the athlete's grade during the season
+            performances: event name -> Performance
+        """
+        self.name = name
+        self.team = intern(team)
+        self.grade = grade
+        self.performances = performances if performances is not None else {}
+
+    def same_athlete(self, other):
+        """Returns whether two athletes have the same name, team and grade"""
+        return (self.name, self.team, self.grade) == (other.name, other.team, other.grade)
+
+    def to_dict(self):
+        return {
+            'name': self.name,
+            'team': self.team,
+            'grade': self.grade,
+            'performances': {event: performance.to_dict() for event, performance in self.performances.items()}
+        }
+
+    @classmethod
+    def from_dict(cls, athlete):
+        return cls(athlete['name'], athlete['team'], athlete['grade'], {
+            intern(event): Performance.from_dict(performance) for event, performance in athlete['performances'].items()
+        })
+
+
+def to_dict(athletes):
+    """Returns athlete_id -> Athlete in the JSON shape the API serves"""
+    return {athlete_id: athlete.to_dict() for athlete_id, athlete in athletes.items()}
+
+
+def from_dict(athletes):
+    """Returns athlete_id -> Athlete from the JSON shape the API serves"""
+    return {athlete_id: Athlete.from_dict(athlete) for athlete_id, athlete in athletes.items()}
@@ -0,0 +1,164 @@
+"""Parsing and formatting of yentiming events and marks
+
+Every event name is looked up in the registry once and every mark is parsed once: both are
+memoized, since the same few hundred names and marks come up again and again across seasons.
+
+    event('1600m')            Event('1600m', 1600.0, track, 's')
+    parse_time('1:02:03.5')   3723.5
+    parse_field('13-10.50')   166.5 (inches)
+    format_seconds(125.1)     '2:05.1'
+"""
+import re
+from enum import Enum
+from functools import lru_cache
+
+
+class EventType(Enum):
+    TRACK = 'track'
+    FIELD = 'field'
+
+
+SECONDS = 's'
+INCHES = 'in'
+POINTS = 'pts'
+
+MILE = 1609.34
+
+
+class Event(object):
+    __slots__ = ('name', 'distance', 'kind', 'unit', 'flat')
+
+    def __init__(self, name, distance, kind, unit, flat=False):
+        """An event and how its marks are measured
+
+        Args:
+            name: the event name yentiming uses
+            distance: the distance in meters (the full distance for relays, None for field events)
+            kind: the EventType of the event
+            unit: SECONDS, INCHES or POINTS
+            flat: whether it is an individual race without hurdles, which Purdy points can score
+        """
+        self.name = name
+        self.distance = distance
+        self.kind = kind
+        self.unit = unit
+        self.flat = flat
+
+    def __repr__(self):
+        return f'Event({self.name!r}, {self.distance!r}, {self.kind.value}, {self.unit!r})'
+
+
+def _track(name, distance, flat=False):
+    return name, Event(name, float(distance), EventType.TRACK, SECONDS, flat)
+
+
+def _flat(name, distance):
+    return _track(name, distance, True)
+
+
+def _field(name, unit=INCHES):
+    return name, Event(name, None, EventType.FIELD, unit)
+
+
+# The events yentiming has, by the names it uses for them
+EVENTS = dict([
+    _flat('55m', 55), _track('55m Hurdles', 55), _flat('100m', 100), _track('110 Hurdles', 110),
+    _track('100 Hurdles', 100), _flat('200m', 200), _flat('300m', 300), _track('300 Int Hurdles', 300),
+    _flat('400m', 400), _track('400 Int Hurdles', 400), _flat('500m', 500), _flat('600m', 600),
+    _flat('800m', 800), _flat('1000m', 1000), _flat('1200m', 1200), _flat('1500m', 1500),
+    _flat('1600m', 1600), _flat('1609.34m', MILE), _flat('Mile', MILE), _track('2000m Steeple', 2000),
+    _flat('3000m', 3000), _track('3000m Steeple', 3000), _flat('3200m', 3200),
+    _track('4x100 Relay', 400), _track('4x200 Relay', 800), _track('4x400 Relay', 1600),
+    _track('4x800 Relay', 3200), _track('1600 SMR (8-2-2-4)', 1600), _track('800 SMR (1-1-2-4)', 800),
+    _track('4000 DMR (12-4-8-16)', 4000),
+    _field('High Jump'), _field('Long Jump'), _field('Triple Jump'), _field('Pole Vault'),
+    _field('Shot Put'), _field('Discus Throw'), _field('Javelin Throw'), _field('Weight Throw'),
+    _field('Pentathlon', POINTS), _field('Heptathlon', POINTS), _field('Decathlon', POINTS),
+])
+
+_RELAY = re.compile(r'(\d+)\s*x\s*(\d+)')
+_DISTANCE = re.compile(r'(\d+(?:\.\d+)?)\s*(m\b|mile)?', re.IGNORECASE)
+_FIELD = re.compile(r'jump|vault|put|throw|discus|javelin|hammer', re.IGNORECASE)
+_MULTI = re.compile(r'athlon', re.IGNORECASE)
+_NOT_FLAT = re.compile(r'hurdle|steeple|relay|smr|dmr', re.IGNORECASE)
+
+
+@lru_cache(maxsize=None)
+def event(name):
+    """Returns the Event of an event name, working it out from the name if it isn't in EVENTS"""
+    known = EVENTS.get(name)
+    if known is not None:
+        return known
+
+    if _MULTI.search(name):
+        return Event(name, None, EventType.FIELD, POINTS)
+    if _FIELD.search(name):
+        return Event(name, None, EventType.FIELD, INCHES)
+
+    relay = _RELAY.search(name)
+    if relay:
+        return Event(name, float(int(relay.group(1)) * int(relay.group(2))), EventType.TRACK, SECONDS)
+
+    flat = not _NOT_FLAT.search(name)
+    distance = _DISTANCE.search(name)
+    if distance:
+        meters = float(distance.group(1))
+        if (distance.group(2) or '').lower() == 'mile':
+            meters *= MILE
+        return Event(name, meters, EventType.TRACK, SECONDS, flat)
+    if 'mile' in name.lower():
+        return Event(name, MILE, EventType.TRACK, SECONDS, flat)
+
+    raise ValueError(f'Unknown event {name!r}')
+
+
+def flat_distance(name):
+    """Returns the distance in meters of a flat race, or None for every other event
+
+    Events that aren't known and can't be worked out from their name count as not flat, so
+    one odd event never stops a season from being scored.
+    """
+    try:
+        info = event(name)
+    except ValueError:
+        return None
+    return info.distance if info.flat else None
+
+
+@lru_cache(maxsize=1 << 16)
+def parse_time(mark):
+    """Parses 'SS.ss', 'MM:SS.ss' or 'H:MM:SS.ss' into seconds
+
+    Raises:
+        ValueError: if the mark isn't a time
+    """
+    parts = mark.split(':')
+    if len(parts) > 3:
+        raise ValueError(f'Not a time: {mark!r}')
+
+    minutes = 0
+    for part in parts[:-1]:
+        minutes = minutes * 60 + int(part)
+    return minutes * 60 + float(parts[-1])
+
+
+@lru_cache(maxsize=1 << 14)
+def parse_field(mark):
+    """Parses a field mark, 'FF-II.ii' into inches or a points total into points
+
+    Raises:
+        ValueError: if the mark isn't a field mark
+    """
+    feet, dash, inches = mark.partition('-')
+    if not dash:
+        return float(feet)
+    return int(feet) * 12 + float(inches)
+
+
+def format_seconds(seconds):
+    """Formats seconds as 'M:SS.ss', with the seconds rounded to hundredths"""
+    minutes, seconds = divmod(seconds, 60)
+    seconds = round(seconds, 2)
+    if seconds >= 60:
+        minutes, seconds = minutes + 1, 0.0
+    return f'{int(minutes)}:{seconds}' if seconds >= 10 else f'{int(minutes)}:0{seconds}'
@@ -1,4 +1,11 @@
 # Taken from https://web.archive.org/web/20070406100645/http://www.cs.uml.edu/~phoffman/xcinfo3.html
+from bisect import bisect_left
+from functools import lru_cache
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 class Purdy(object):
     # Purdy table: [distance, standard_pace, distance, standard_pace, … , -1.0, 0.0]
@@ -19,6 +26,8 @@ class Purdy(object):
         30000.0, 5.29298, 35000.0, 5.23538, 40000.0, 5.18263, 50000.0, 5.08615,
         60000.0, 4.99762, 80000.0, 4.83617, 100000.0, 4.68988, -1.0, 0.0
     ]
+    # Just the distances, for bisecting
+    table_distances = pace_table[0:-2:2]
 
     def __init__(self, dist, time):
         """A class to score and convert running performances between distances
@@ -31,21 +40,19 @@ class Purdy(object):
         # self.score = self.score()
 
 
-    def _fractional_lap_factor(self, distance=None):
+    @staticmethod
+    def _fractional_lap_factor(distance):
         """
         Compute the fraction of a 400m lap represented by the given distance,
         mapped onto a 200m scale.  This accounts for partial laps beyond
         400m segments to approximate pacing adjustments.
 
         Args:
-            distance (float, optional): distance in meters; defaults to self.distance_m
+            distance (float): distance in meters
 
         Returns:
             float: (scaled_meters) / distance
         """
-        if distance is None:
-            distance = self.dist
-
         # No meaningful fraction for distances under 110m
         if distance < 110:
             return 0.0
@@ -72,51 +79,43 @@ class Purdy(object):
         # Fractional lap factor
         return scaled_meters / distance
 
-    def purdy_score(self, dist=None, time=None):
+    @classmethod
+    @lru_cache(maxsize=1024)
+    def _constants(cls, dist):
         """
-        Compute the Purdy Points for a performance.
+        Compute everything about a distance that does not depend on the time run.
+        Memoized, so each distance is only ever interpolated once.
 
         Purdy tables give a standard pace for each distance; this routine
-        interpolates the “standard” time, applies fatigue constants, and
-        scales the athlete’s performance against that standard.
+        interpolates the “standard” time and applies fatigue constants to get
+        the adjusted time and the a/b factors a performance is scaled by.
 
         Args:
-            dist (float, optional): distance in meters; defaults to self.distance_m
-            time (float, optional): performance time in seconds; defaults to self.time_s
+            dist (float): distance in meters
 
         Returns:
-            float: Purdy point score
+            tuple: (adjusted_time, a_factor, b_parameter), or None if the
+            distance is beyond the table
         """
-        if dist is None:
-            dist = self.dist
-        if time is None:
-            time = self.time
-
         # Fatigue constants
         fatigue_const_1 = 0.2
         fatigue_const_2 = 0.08
         fatigue_const_3 = 0.0065
 
-        # Find the segment in the pace table that brackets our distance
-        idx = 0
-        # d_temp holds the table distance at current index
-        d_temp = self.pace_table[idx]
-
-        # Advance through table until d_temp >= distance
-        while d_temp > 0 and dist > d_temp:
-            idx += 2
-            d_temp = self.pace_table[idx]
+        # Find the segment in the pace table that brackets our distance,
+        # the first table distance >= dist
+        idx = 2 * bisect_left(cls.table_distances, dist)
 
         # If beyond table range, no score
-        if d_temp < 0:
-            return 0.0
+        if cls.pace_table[idx] < 0:
+            return None
 
         # Step back to get lower and upper bracketing entries
         upper_idx = idx
         lower_idx = idx - 2
 
-        d_lower, pace_lower = self.pace_table[lower_idx], self.pace_table[lower_idx + 1]
-        d_upper, pace_upper = self.pace_table[upper_idx], self.pace_table[upper_idx + 1]
+        d_lower, pace_lower = cls.pace_table[lower_idx], cls.pace_table[lower_idx + 1]
+        d_upper, pace_upper = cls.pace_table[upper_idx], cls.pace_table[upper_idx + 1]
 
         # Compute “standard” times at those bracket distances
         time_lower = d_lower / pace_lower
@@ -136,7 +135,7 @@ class Purdy(object):
             standard_time
             + fatigue_const_1
             + fatigue_const_2 * avg_velocity
-            + fatigue_const_3 * self._fractional_lap_factor(dist) * avg_velocity**2
+            + fatigue_const_3 * cls._fractional_lap_factor(dist) * avg_velocity**2
         )
 
         # Compute scaling parameters
@@ -144,6 +143,33 @@ class Purdy(object):
         a_factor = 85.0 / k_factor
         b_parameter = 1.0 - 950.0 / a_factor
 
+        return adjusted_time, a_factor, b_parameter
+
+    def purdy_score(self, dist=None, time=None):
+        """
+        Compute the Purdy Points for a performance.
+
+        Scales the athlete’s performance against the standard time for the
+        distance (see _constants).
+
+        Args:
+            dist (float, optional): distance in meters; defaults to self.distance_m
+            time (float, optional): performance time in seconds; defaults to self.time_s
+
+        Returns:
+            float: Purdy point score
+        """
+        if dist is None:
+            dist = self.dist
+        if time is None:
+            time = self.time
+
+        constants = self._constants(dist)
+        if constants is None:
+            return 0.0
+
+        adjusted_time, a_factor, b_parameter = constants
+
         # Final Purdy point score
         purdy_points = a_factor * (adjusted_time / time - b_parameter)
 
@@ -166,77 +192,103 @@ class Purdy(object):
         if not score:
             score = self.purdy_score()
 
+        constants = self._constants(dist)
+        if constants is None:
+            return 0.0
 
-        # Fatigue constants (same as in purdy_score)
-        fatigue_c1 = 0.20
-        fatigue_c2 = 0.08
-        fatigue_c3 = 0.0065
+        adjusted_time, a_factor, b_parameter = constants
 
-        # --- Locate the bracketing segment in pace_table ---
-        idx = 0
-        table_distance = self.pace_table[idx]
+        # Invert: target_score = a_factor * (adjusted_time / t_sec - b_parameter)
+        # => t_sec = adjusted_time / ((target_score / a_factor) + b_parameter)
+        return round(adjusted_time / ((score / a_factor) + b_parameter), 2)
 
-        # Advance until we find the first table_distance >= distance_m
-        while table_distance > 0 and dist > table_distance:
-            idx += 2
-            table_distance = self.pace_table[idx]
+    @classmethod
+    def _constant_columns(cls, dists):
+        """Returns the adjusted time, a and b columns for an array of distances, and which are valid"""
+        if numpy is not None:
+            unique, inverse = numpy.unique(numpy.asarray(dists, dtype=float), return_inverse=True)
+            table = [cls._constants(dist) for dist in unique.tolist()]
+            valid = numpy.array([constants is not None for constants in table], dtype=bool)
+            columns = numpy.array([constants or (0.0, 1.0, 0.0) for constants in table], dtype=float).reshape(-1, 3)
+            return columns[inverse, 0], columns[inverse, 1], columns[inverse, 2], valid[inverse]
+
+        table = {dist: cls._constants(dist) for dist in set(dists)}
+        constants = [table[dist] or (0.0, 1.0, 0.0) for dist in dists]
+        return ([c[0] for c in constants], [c[1] for c in constants], [c[2] for c in constants],
+                [table[dist] is not None for dist in dists])
+
+    @classmethod
+    def score_many(cls, dists, times):
+        """
+        Compute the Purdy Points for many performances at once.
 
-        # If we ran off the end (table_distance <= 0), invalid
-        if table_distance <= 0:
-            return 0.0
+        Gives exactly what purdy_score gives for each performance, but
+        interpolates each distinct distance only once and scores the rest as
+        a single column (with NumPy when it is installed).
 
-        # Step back to get lower and upper bracket entries
-        upper_idx = idx
-        lower_idx = idx - 2
-        d_lower, pace_lower = self.pace_table[lower_idx], self.pace_table[lower_idx + 1]
-        d_upper, pace_upper = self.pace_table[upper_idx], self.pace_table[upper_idx + 1]
+        Args:
+            dists: distances in meters
+            times: performance times in seconds
 
-        # --- Compute the “standard” time via linear interpolation ---
-        time_lower = d_lower / pace_lower
-        time_upper = d_upper / pace_upper
-        standard_time = (
-                time_lower
-                + (time_upper - time_lower) * (dist - d_lower) / (d_upper - d_lower)
-        )
+        Returns:
+            list: Purdy point scores
+        """
+        adjusted_time, a_factor, b_parameter, valid = cls._constant_columns(dists)
 
-        # Athlete’s average velocity (m/s) over the “standard” time
-        avg_velocity = dist / standard_time
+        if numpy is not None:
+            times = numpy.asarray(times, dtype=float)
+            with numpy.errstate(divide='ignore', invalid='ignore'):
+                scores = a_factor * (adjusted_time / times - b_parameter)
+            return numpy.where(valid, scores, 0.0).tolist()
 
-        # Compute the fractional lap factor exactly as in Performance._fractional_lap_factor
-        def _lap_fraction_factor(dist):
-            if dist < 110:
-                return 0.0
-            full_laps = dist // 400
-            leftover = dist - full_laps * 400
-            if leftover <= 50:
-                part = 0
-            elif leftover <= 150:
-                part = leftover - 50
-            elif leftover <= 250:
-                part = 100
-            elif leftover <= 350:
-                part = 100 + (leftover - 250)
-            else:
-                part = 200
-            scaled = full_laps * 200 + part
-            return scaled / dist
-
-        lap_factor = _lap_fraction_factor(dist)
-
-        # Adjust “virtual” time with fatigue corrections
-        adjusted_time = (
-                standard_time
-                + fatigue_c1
-                + fatigue_c2 * avg_velocity
-                + fatigue_c3 * lap_factor * avg_velocity ** 2
-        )
+        return [a * (adj / t - b) if ok else 0.0
+                for adj, a, b, ok, t in zip(adjusted_time, a_factor, b_parameter, valid, times)]
 
-        # Compute scaling parameters for inversion
-        k_factor = 0.0654 - 0.00258 * avg_velocity
-        a_factor = 85.0 / k_factor
-        b_parameter = 1.0 - 950.0 / a_factor
+    @classmethod
+    @lru_cache(maxsize=256)
+    def scoring(cls, dist):
+        """
+        Build a function scoring times at a distance.
+
+        Gives exactly what Purdy(dist, time).purdy_score() gives.
+
+        Args:
+            dist (float): distance of the performances in meters
+
+        Returns:
+            function: takes a time in seconds and returns its Purdy points
+        """
+        constants = cls._constants(dist)
+        if constants is None:
+            return lambda time: 0.0
+
+        adjusted_time, a_factor, b_parameter = constants
+        return lambda time: a_factor * (adjusted_time / time - b_parameter)
+
+    @classmethod
+    @lru_cache(maxsize=256)
+    def timing(cls, dist):
+        """
+        Build a function giving the time that scores some Purdy points at a distance.
+
+        timing(to_dist)(scoring(from_dist)(time)) gives exactly what
+        Purdy(from_dist, time).convert(to_dist) gives, so a mark converted to several
+        distances only needs scoring once.
+
+        Args:
+            dist (float): distance to convert to in meters
+
+        Returns:
+            function: takes Purdy points and returns the time in seconds, rounded to 0.01
+        """
+        constants = cls._constants(dist)
+        if constants is None:
+            return lambda score: 0.0
+
+        adjusted_time, a_factor, b_parameter = constants
+        return lambda score: round(adjusted_time / ((score / a_factor) + b_parameter), 2)
 
-        # Invert: target_score = a_factor * (adjusted_time / t_sec - b_parameter)
-        # => t_sec = adjusted_time / ((target_score / a_factor) + b_parameter)
-        return round(adjusted_time / ((score / a_factor) + b_parameter), 2)
 
+# The distances we convert between, interpolated up front
+for _dist in (200, 300, 400, 600, 800, 1000, 1200, 1500, 1600, 1609.34):
+    Purdy._constants(_dist)
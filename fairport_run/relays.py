@@ -1,97 +1,237 @@
 import heapq
+from collections import Counter
+from itertools import count
 
+from fairport_run.index import EventIndex
 from fairport_run.utils import format_time
 
+# The relays run in each season, as the individual events their legs are run from
+STANDARD_RELAYS = {
+    'outdoor': {
+        '4x100': ['100m'] * 4,
+        '4x200': ['200m'] * 4,
+        '4x400': ['400m'] * 4,
+        '4x800': ['800m'] * 4,
+        'SMR': ['800m', '200m', '200m', '400m'],
+        'DMR': ['1200m', '400m', '800m', '1600m'],
+    },
+    'indoor': {
+        '4x200': ['200m'] * 4,
+        '4x400': ['400m'] * 4,
+        '4x800': ['800m'] * 4,
+        'SMR': ['800m', '200m', '200m', '400m'],
+        'DMR': ['1200m', '400m', '800m', '1600m'],
+    },
+}
+
+# How many relays of each kind best_lineup tries for every choice of the ones before it (more is
+# slower but misses fewer of the best lineups)
+LINEUP_BRANCHING = 3
+
 
 class Relay(object):
     relays = []
+    stats = {}
 
     def __init__(self, athletes, *events):
         """
-        athletes: dict mapping athlete_id -> { ..., "performances": { event: {"performance": raw_time}, ... } }
+        athletes: the season's EventIndex, or athlete_id -> Athlete (see fairport_run.model)
         events: sequence of event names (may contain duplicates, e.g. ("200m","200m","800m","400m"))
         """
-        self.athletes = athletes
+        if not isinstance(athletes, EventIndex):
+            athletes = EventIndex.from_athletes(athletes)
+        self.index = athletes
         self.events = list(events)
-        # dedupe for building top_marks
-        diff_events = set(events)
-
-        # build sorted mapping event -> { time (float) -> athlete_id }
-        top = {}
-        for ev in diff_events:
-            marks = {}
-            for athid, data in athletes.items():
-                perf = data["performances"].get(ev)
-                if perf is not None:
-                    t = format_time(perf["performance"])
-                    marks[t] = athid
-            # sort by time ascending
-            top[ev] = dict(sorted(marks.items()))
-        self.top_marks = top
-
-    def generate_relays(self, number):
-        n = len(self.events)
-        legs_lists = [list(self.top_marks[e].items()) for e in self.events]
-
-        # Failsafe: ensure enough entries per event
-        from collections import Counter
-        event_counts = Counter(self.events)
-        for ev, count in event_counts.items():
-            available_athletes = len(self.top_marks.get(ev, {}))
-            if available_athletes < count:
-                self.relays =  []  # Not enough unique athletes for this event
-
-        # Additional check: make sure all legs_lists are non-empty
-        if any(len(leg_list) == 0 for leg_list in legs_lists):
-            self.relays = []
-
-        event_groups = {
-            ev: [i for i, e in enumerate(self.events) if e == ev]
-            for ev in set(self.events)
-        }
-
-        def is_sorted_for_duplicates(idx_tuple, dim):
-            ev = self.events[dim]
-            grp = event_groups[ev]
-            vals = [idx_tuple[i] for i in grp]
-            return all(vals[i] <= vals[i + 1] for i in range(len(vals) - 1))
-
-        start = (0,) * n
-        heap = []
-        visited = {start}
-        t0 = sum(legs_lists[i][0][0] for i in range(n))
-        heapq.heappush(heap, (t0, start))
+
+        # event -> [(time, athlete_id), ...] sorted by time
+        self.top_marks = {ev: self.index.top(ev) for ev in set(events)}
+
+    def generate_relays(self, number, roster=None):
+        """Finds the fastest relays with a different athlete on every leg
+
+        Uses Lawler's partitioning (Murty's algorithm): after the best relay of a
+        subproblem is taken, the subproblem is split into disjoint ones that each
+        exclude one more of its (event, athlete) pairs, and the best relay of each is
+        queued. Every relay is therefore found exactly once, in order, and the queue
+        never holds more than number * legs subproblems.
+
+        Args:
+            number: how many relays to return
+            roster: only consider the fastest this many athletes in each event
+        """
+        candidates = {ev: self.index.top(ev, roster) for ev in self.top_marks}
+        need = Counter(self.events)
 
         results = []
+        heap = []
+        counter = count()
+        subproblems = 1
+        peak_heap = 0
+
+        best = self._best_relay(candidates, need, (), frozenset())
+        if best is not None:
+            heapq.heappush(heap, (best[0], next(counter), (), frozenset(), best[1]))
+
         while heap and len(results) < number:
-            total, idx = heapq.heappop(heap)
-            athlete_ids = [legs_lists[i][idx[i]][1] for i in range(n)]
-            if len(set(athlete_ids)) == n:
-                legs = [
-                    {
-                        "event": self.events[i],
-                        "athlete_id": athlete_ids[i],
-                        "time": legs_lists[i][idx[i]][0],
-                    }
-                    for i in range(n)
-                ]
-                results.append({"time": format_time(round(total, 2)), "legs": legs})
-
-            for d in range(n):
-                i2 = idx[d] + 1
-                if i2 < len(legs_lists[d]):
-                    new_idx = list(idx)
-                    new_idx[d] = i2
-                    new_idx = tuple(new_idx)
-                    if new_idx in visited:
-                        continue
-                    if not is_sorted_for_duplicates(new_idx, d):
-                        continue
-                    new_total = total - legs_lists[d][idx[d]][0] + legs_lists[d][i2][0]
-                    visited.add(new_idx)
-                    heapq.heappush(heap, (new_total, new_idx))
+            peak_heap = max(peak_heap, len(heap))
+            total, _, include, exclude, legs = heapq.heappop(heap)
+            results.append(self._format(total, legs))
+
+            for leg in legs[len(include):]:
+                split = self._best_relay(candidates, need, include, exclude | {leg[:2]})
+                subproblems += 1
+                if split is not None:
+                    heapq.heappush(heap, (split[0], next(counter), include, exclude | {leg[:2]}, split[1]))
+                include = include + (leg,)
 
         self.relays = results
+        # Every subproblem is disjoint, so the search needs no visited set: these are what it costs
+        self.stats = {'heap_pops': len(results), 'subproblems': subproblems, 'peak_heap': peak_heap}
 
+    @staticmethod
+    def _best_relay(candidates, need, include, exclude):
+        """Returns the fastest relay that runs every included leg and no excluded one
 
+        Args:
+            candidates: event -> [(time, athlete_id), ...] sorted by time
+            need: event -> how many legs of it the relay has
+            include: (event, athlete_id, time) legs the relay must have
+            exclude: (event, athlete_id) pairs the relay can't have
 
+        Returns:
+            tuple: (total time, legs with the included ones first) or None if there is no such relay
+        """
+        used = {leg[1] for leg in include}
+        remaining = need.copy()
+        remaining.subtract(leg[0] for leg in include)
+        slots = [ev for ev, n in remaining.items() for _ in range(n)]
+
+        # Some fastest relay only uses each event's fastest len(slots) athletes that are still allowed:
+        # any slower athlete could be swapped for one of those that no other leg is using
+        options = {}
+        for ev in set(slots):
+            allowed = []
+            for time, athlete_id in candidates.get(ev, ()):
+                if athlete_id not in used and (ev, athlete_id) not in exclude:
+                    allowed.append((time, athlete_id))
+                    if len(allowed) == len(slots):
+                        break
+            if len(allowed) < remaining[ev]:
+                return None
+            options[ev] = allowed
+
+        best_total = None
+        best_legs = None
+        taken = set()
+        chosen = []
+
+        def search(slot, first, total):
+            nonlocal best_total, best_legs
+            if best_total is not None and total >= best_total:
+                return
+            if slot == len(slots):
+                best_total, best_legs = total, list(chosen)
+                return
+
+            ev = slots[slot]
+            allowed = options[ev]
+            for i in range(first, len(allowed)):
+                time, athlete_id = allowed[i]
+                if athlete_id in taken:
+                    continue
+                taken.add(athlete_id)
+                chosen.append((ev, athlete_id, time))
+                # Legs of the same event are interchangeable, so their athletes are picked in order
+                following = i + 1 if slot + 1 < len(slots) and slots[slot + 1] == ev else 0
+                search(slot + 1, following, total + time)
+                chosen.pop()
+                taken.discard(athlete_id)
+
+        search(0, 0, 0)
+        if best_legs is None:
+            return None
+
+        legs = include + tuple(best_legs)
+        return sum(leg[2] for leg in legs), legs
+
+    def _format(self, total, legs):
+        by_event = {}
+        for ev, athlete_id, time in sorted(legs, key=lambda leg: leg[2]):
+            by_event.setdefault(ev, []).append((athlete_id, time))
+
+        formatted = []
+        for ev in self.events:
+            athlete_id, time = by_event[ev].pop(0)
+            formatted.append({"event": ev, "athlete_id": athlete_id, "time": time})
+
+        return {"time": format_time(round(total, 2)), "legs": formatted}
+
+
+def best_lineup(index, relays, branching=LINEUP_BRANCHING):
+    """Picks one relay of each kind so that nobody runs in two of them
+
+    The lineup fills as many of the relays as it can and then is as close as it can get to each
+    relay's fastest time. Relays count as their time over their fastest one, so a second lost
+    in the 4x100 weighs more than one lost in the 4x800.
+
+    Relays are picked in order by branch and bound: each one tries its fastest few relays among
+    the athletes that the ones before it left free. With enough branching that is every lineup;
+    with less it is the best of the lineups tried, which always fills a relay if it still can be.
+    The default branching makes this a heuristic: it is fast, but can miss a faster lineup.
+
+    Args:
+        index: the season's EventIndex
+        relays: name -> the legs of the relay
+        branching: how many relays of each kind to try for every choice of the ones before
+
+    Returns:
+        dict: name -> the relay in the lineup, as generate_relays formats it, or None if it
+        can't be run alongside the others
+    """
+    def options(name, used):
+        events = relays[name]
+        marks = {event: [mark for mark in index.top(event) if mark[1] not in used] for event in set(events)}
+        relay = Relay(EventIndex(marks), *events)
+        relay.generate_relays(branching)
+        return relay.relays
+
+    def total(relay):
+        return sum(leg['time'] for leg in relay['legs'])
+
+    fastest = {}
+    for name in relays:
+        found = options(name, frozenset())
+        if found:
+            fastest[name] = total(found[0])
+    names = list(fastest)
+
+    # (relays left out, slowdown, picks) of the best lineup so far
+    best = [len(names) + 1, 0.0, None]
+    picks = []
+
+    def search(i, used, missing, slowdown):
+        # Every relay still to pick adds at least 1 to the slowdown, or leaves one more out
+        if missing > best[0] or (missing == best[0] and slowdown + len(names) - i >= best[1]):
+            return
+        if i == len(names):
+            best[:] = [missing, slowdown, list(picks)]
+            return
+
+        found = options(names[i], used)
+        for relay in found:
+            ratio = total(relay) / fastest[names[i]]
+            if missing == best[0] and slowdown + ratio + len(names) - i - 1 >= best[1]:
+                break
+            picks.append(relay)
+            search(i + 1, used | {leg['athlete_id'] for leg in relay['legs']}, missing, slowdown + ratio)
+            picks.pop()
+
+        # Leaving a relay out can free its athletes for two of the ones after it
+        picks.append(None)
+        search(i + 1, used, missing + 1, slowdown)
+        picks.pop()
+
+    search(0, frozenset(), 0, 0.0)
+    lineup = dict.fromkeys(relays)
+    lineup.update(zip(names, best[2]))
+    return lineup
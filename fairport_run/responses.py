@@ -0,0 +1,46 @@
+import json
+
+from fastapi import Response
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# How long browsers and proxies can keep a finished season before asking again
+CLOSED_SEASON_MAX_AGE = 60 * 60 * 24 * 7
+
+
+def encode(content):
+    """Encodes content to JSON bytes, with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(content)
+    return json.dumps(content, separators=(',', ':')).encode()
+
+
+def not_modified(request, etag):
+    """Returns whether a request's If-None-Match already matches an ETag"""
+    header = request.headers.get('if-none-match')
+    if not header:
+        return False
+    if header.strip() == '*':
+        return True
+    return etag in (tag.strip().removeprefix('W/') for tag in header.split(','))
+
+
+def cached_json(request, body, etag, closed):
+    """Returns pre-encoded JSON with caching headers, or a 304 if the client already has it
+
+    Args:
+        request: the incoming request
+        body: the encoded JSON
+        etag: the strong ETag of the body, quotes included
+        closed: whether the data can't change anymore (a past season)
+    """
+    headers = {
+        'ETag': etag,
+        'Cache-Control': f'public, max-age={CLOSED_SEASON_MAX_AGE}' if closed else 'no-cache',
+    }
+    if not_modified(request, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type='application/json', headers=headers)
@@ -0,0 +1,108 @@
+import asyncio
+import os
+import random
+import time
+from datetime import datetime
+
+from fairport_run.utils import DEFAULT_TEAM, get_current_season, get_current_year, team_key
+
+
+class RefreshScheduler(object):
+
+    def __init__(self, store, interval=None, jitter=None, backoff=60, genders=('m', 'f'), teams=None):
+        """Keeps the current season warm by re-scraping it in the background
+
+        Args:
+            store: the SeasonStore to refresh
+            interval: seconds between refreshes (defaults to $FAIRPORT_REFRESH_INTERVAL or 12 hours)
+            jitter: fraction of the interval to randomly add or remove (defaults to $FAIRPORT_REFRESH_JITTER or 0.1)
+            backoff: seconds to wait after the first failed refresh, doubled on each failure up to the interval
+            genders: the genders to refresh
+            teams: the teams, or groups of teams fetched together, to refresh (defaults to the
+                space-separated keys in $FAIRPORT_REFRESH_TEAMS, e.g. '85 85,90,112', or DEFAULT_TEAM)
+        """
+        self.store = store
+        self.interval = interval if interval is not None else float(os.environ.get('FAIRPORT_REFRESH_INTERVAL', 60 * 60 * 12))
+        self.jitter = jitter if jitter is not None else float(os.environ.get('FAIRPORT_REFRESH_JITTER', 0.1))
+        self.backoff = backoff
+        self.genders = genders
+        if teams is None:
+            teams = os.environ.get('FAIRPORT_REFRESH_TEAMS', DEFAULT_TEAM).split()
+        self.teams = [team_key(team) for team in teams]
+        self.failures = 0
+        self.status = {}
+        self._task = None
+
+    def start(self):
+        """Starts refreshing on the running event loop"""
+        if self._task is None and self.interval > 0:
+            # Only the seasons refreshed here stop expiring, every other team's still does
+            self.store.scheduled.update(self.owned())
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stops refreshing, waiting for the loop to exit"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+            self.store.scheduled.difference_update(self.owned())
+
+    def owned(self):
+        """Returns the (gender, team) pairs whose current season this refreshes"""
+        return {(gender, team) for team in self.teams for gender in self.genders}
+
+    async def _run(self):
+        while True:
+            ok = True
+            for team in self.teams:
+                for gender in self.genders:
+                    ok = await asyncio.to_thread(self.refresh, get_current_year(), get_current_season(), gender,
+                                                 team) and ok
+
+            self.failures = 0 if ok else self.failures + 1
+            await asyncio.sleep(self.next_delay())
+
+    def next_delay(self):
+        """Returns how long to wait before the next refresh"""
+        if self.failures:
+            return min(self.interval, self.backoff * 2 ** (self.failures - 1))
+
+        return self.interval + self.interval * self.jitter * random.uniform(-1, 1)
+
+    def refresh(self, year, season, gender, team=DEFAULT_TEAM):
+        """Refreshes a single season and records how it went
+
+        Seasons of teams other than DEFAULT_TEAM are recorded as year/season/gender/team.
+
+        Returns:
+            bool: whether the refresh succeeded
+        """
+        started = time.perf_counter()
+        team = team_key(team)
+        name = f'{year}/{season}/{gender}' if team == DEFAULT_TEAM else f'{year}/{season}/{gender}/{team}'
+        status = self.status.setdefault(name, {
+            'last_refresh': None,
+            'duration': None,
+            'changed': None,
+            'watermark': None,
+            'error': None,
+        })
+
+        try:
+            # Another worker that refreshed recently (or is refreshing now) saves us the scrape
+            yen, changed = self.store.refresh(year, season, gender, team, min_age=self.interval / 2)
+        except Exception as e:
+            status['error'] = repr(e)
+            return False
+
+        status['last_refresh'] = datetime.now().isoformat(timespec='seconds')
+        status['duration'] = round(time.perf_counter() - started, 3)
+        status['changed'] = len(changed)
+        if yen is not None:
+            status['watermark'] = yen.watermark
+        status['error'] = None
+        return True
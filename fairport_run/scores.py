@@ -0,0 +1,31 @@
+"""Purdy scores of every flat race, worked out when a season is ingested
+
+Scores are stored with the performances in the snapshot (see fairport_run.snapshot), so ranking
+athletes across events never has to run the Purdy math when a season is served.
+"""
+from fairport_run import parsing
+from fairport_run.purdy import Purdy
+
+
+def score(athletes, athlete_ids=None):
+    """Sets the Purdy score of every flat race, rounded to 0.01, and None on every other mark
+
+    Converted marks are scored too, from the time they were converted to.
+
+    Args:
+        athletes: athlete_id -> Athlete
+        athlete_ids: only score these athletes (defaults to all of them)
+    """
+    scored = []
+    for athlete_id in athletes.keys() if athlete_ids is None else athlete_ids:
+        for event, performance in athletes[athlete_id].performances.items():
+            performance.purdy = None
+            if performance.time is not None:
+                distance = parsing.flat_distance(event)
+                if distance is not None:
+                    scored.append((performance, distance))
+
+    if scored:
+        scores = Purdy.score_many([dist for _, dist in scored], [performance.time for performance, _ in scored])
+        for (performance, _), value in zip(scored, scores):
+            performance.purdy = round(value, 2)
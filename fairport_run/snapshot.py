@@ -0,0 +1,241 @@
+"""A compact binary format for saved seasons
+
+A snapshot is a small header followed by five sections:
+
+    strings       every distinct string in the season once, utf-8 and separated by NUL
+    athletes      int32 columns: id, name, team, grade
+    performances  int32 columns: athlete, event, performance, date, meet, converted_from, flags
+    times         float64 column: the performance in seconds (NaN for field marks)
+    scores        float64 column: the Purdy score (NaN for marks that aren't flat races)
+
+Version 1 snapshots, which have no scores, are still read.
+
+Strings are referred to by their index in the string table (-1 for None) so event, meet, team
+and date names are only stored once. All numbers are little endian. The file is read through
+mmap, so the columns are never copied before they are used.
+"""
+import json
+import math
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+from fairport_run import metrics, model
+from fairport_run.model import Athlete, EventType, Performance
+from fairport_run.utils import atomic_write
+
+MAGIC = b'FRSN'
+VERSION = 2
+
+_HEADER = struct.Struct('<4sHxxIIII')
+ATHLETE_FIELDS = 4
+PERFORMANCE_FIELDS = 7
+
+FIELD = 1
+FAT = 2
+CONVERTED = 4
+
+
+def _pad(length):
+    return -length % 8
+
+
+class _Strings(object):
+
+    def __init__(self):
+        self.index = {}
+        self.strings = []
+
+    def __call__(self, string):
+        if string is None:
+            return -1
+        sid = self.index.get(string)
+        if sid is None:
+            sid = self.index[string] = len(self.strings)
+            self.strings.append(string)
+        return sid
+
+
+def dumps(athletes):
+    """Encodes a season's athletes into a snapshot
+
+    Args:
+        athletes: athlete_id -> Athlete, as built by YenData.organize_data
+    """
+    strings = _Strings()
+    athlete_columns = array('i')
+    performance_columns = array('i')
+    times = array('d')
+    scores = array('d')
+
+    for athlete_idx, (athlete_id, athlete) in enumerate(athletes.items()):
+        athlete_columns.extend((strings(athlete_id), strings(athlete.name), strings(athlete.team), athlete.grade))
+        for event, performance in athlete.performances.items():
+            flags = (FIELD if performance.kind is EventType.FIELD else 0) \
+                | (FAT if performance.fat else 0) \
+                | (CONVERTED if performance.converted else 0)
+            performance_columns.extend((
+                athlete_idx,
+                strings(event),
+                strings(performance.mark),
+                strings(performance.date),
+                strings(performance.meet),
+                strings(performance.converted_from),
+                flags,
+            ))
+            times.append(math.nan if performance.time is None else performance.time)
+            scores.append(math.nan if performance.purdy is None else performance.purdy)
+
+    if sys.byteorder != 'little':
+        for column in (athlete_columns, performance_columns, times, scores):
+            column.byteswap()
+
+    string_bytes = '\0'.join(strings.strings).encode()
+    parts = [
+        _HEADER.pack(MAGIC, VERSION, len(strings.strings), len(string_bytes),
+                     len(athlete_columns) // ATHLETE_FIELDS, len(times)),
+        string_bytes, b'\0' * _pad(len(string_bytes)),
+        athlete_columns.tobytes(),
+        performance_columns.tobytes(), b'\0' * _pad(len(performance_columns) * 4),
+        times.tobytes(),
+        scores.tobytes(),
+    ]
+    return b''.join(parts)
+
+
+def dump(athletes, path):
+    """Writes a season's athletes to a snapshot file, atomically"""
+    with metrics.span('snapshot_save'):
+        atomic_write(path, dumps(athletes))
+
+
+class Snapshot(object):
+
+    def __init__(self, buffer):
+        """A season read from a snapshot, with its columns left in place
+
+        Args:
+            buffer: the bytes (or mmap) of the snapshot
+        """
+        if len(buffer) < _HEADER.size:
+            raise ValueError('Truncated snapshot')
+
+        magic, version, n_strings, string_bytes, n_athletes, n_performances = _HEADER.unpack_from(buffer)
+        if magic != MAGIC:
+            raise ValueError('Not a season snapshot')
+        if version not in (1, VERSION):
+            raise ValueError(f'Unsupported snapshot version {version}')
+
+        view = memoryview(buffer)
+        offset = _HEADER.size
+        self.strings = str(view[offset:offset + string_bytes], 'utf-8').split('\0') if n_strings else []
+        offset += string_bytes + _pad(string_bytes)
+
+        if len(buffer) < offset + (n_athletes * ATHLETE_FIELDS + n_performances * PERFORMANCE_FIELDS) * 4:
+            raise ValueError('Truncated snapshot')
+        self.athletes = self._column(view, offset, 'i', n_athletes * ATHLETE_FIELDS)
+        offset += n_athletes * ATHLETE_FIELDS * 4
+        self.performances = self._column(view, offset, 'i', n_performances * PERFORMANCE_FIELDS)
+        offset += n_performances * PERFORMANCE_FIELDS * 4
+        offset += _pad(offset)
+        columns = 2 if version >= 2 else 1
+        if len(buffer) < offset + n_performances * 8 * columns:
+            raise ValueError('Truncated snapshot')
+        self.times = self._column(view, offset, 'd', n_performances)
+        offset += n_performances * 8
+        # None for version 1 snapshots, whose athletes need scoring once they are loaded
+        self.scores = self._column(view, offset, 'd', n_performances) if version >= 2 else None
+
+        self.n_athletes = n_athletes
+        self.n_performances = n_performances
+
+    @staticmethod
+    def _column(view, offset, typecode, length):
+        size = array(typecode).itemsize * length
+        if sys.byteorder == 'little':
+            return view[offset:offset + size].cast(typecode)
+
+        column = array(typecode, view[offset:offset + size])
+        column.byteswap()
+        return column
+
+    def to_athletes(self):
+        """Returns the athletes as YenData.organize_data builds them, athlete_id -> Athlete"""
+        # Interning the table interns every string the athletes share
+        strings = [sys.intern(string) for string in self.strings] + [None]
+        athletes = self.athletes
+        performances = self.performances
+        times = self.times
+        scores = self.scores
+
+        organized = []
+        for i in range(0, self.n_athletes * ATHLETE_FIELDS, ATHLETE_FIELDS):
+            organized.append((strings[athletes[i]], Athlete(strings[athletes[i + 1]], strings[athletes[i + 2]], athletes[i + 3])))
+
+        for row in range(self.n_performances):
+            i = row * PERFORMANCE_FIELDS
+            flags = performances[i + 6]
+            time = times[row]
+            purdy = math.nan if scores is None else scores[row]
+            organized[performances[i]][1].performances[strings[performances[i + 1]]] = Performance(
+                strings[performances[i + 2]],
+                strings[performances[i + 3]],
+                strings[performances[i + 4]],
+                EventType.FIELD if flags & FIELD else EventType.TRACK,
+                bool(flags & FAT),
+                bool(flags & CONVERTED),
+                strings[performances[i + 5]],
+                None if math.isnan(time) else time,
+                None if math.isnan(purdy) else purdy,
+            )
+
+        return dict(organized)
+
+    def to_dict(self):
+        """Returns the athletes in the JSON shape the API serves"""
+        return model.to_dict(self.to_athletes())
+
+
+def read(path):
+    """Maps a snapshot file into memory
+
+    Returns:
+        Snapshot: the season, backed by the mapped file
+    """
+    with open(path, 'rb') as f:
+        stat = os.fstat(f.fileno())
+        if stat.st_size == 0:
+            raise ValueError('Empty snapshot')
+        season = Snapshot(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    # The stat of the file that was actually mapped, even if it has been replaced since
+    season.stat = stat
+    return season
+
+
+def version(stat):
+    """Identifies a snapshot file's contents from its stat, for ETags and derived indexes"""
+    return f'{VERSION}.{stat.st_mtime_ns:x}'
+
+
+def load(path):
+    """Reads a season's athletes from a snapshot file, athlete_id -> Athlete"""
+    return read(path).to_athletes()
+
+
+def export_json(path, json_path):
+    """Writes a snapshot out as the JSON the API used to save seasons as"""
+    atomic_write(json_path, json.dumps(read(path).to_dict(), indent=4))
+
+
+def migrate(json_path, path):
+    """Converts a season saved as JSON into a snapshot, scoring it on the way"""
+    # Seasons were only saved as JSON before scores were stored, and Purdy is only imported for them
+    from fairport_run import scores
+
+    with open(json_path, 'r') as f:
+        athletes = model.from_dict(json.load(f))
+    scores.score(athletes)
+    dump(athletes, path)
@@ -0,0 +1,286 @@
+import os
+import pathlib
+import threading
+import time
+
+from fairport_run import history, metrics, snapshot
+from fairport_run.index import EventIndex, Leaderboard, Rankings
+from fairport_run.utils import DEFAULT_TEAM, file_lock, is_current_season, season_path, team_ids, team_key
+
+
+class SeasonEntry(object):
+    __slots__ = ('athletes', 'index', 'leaderboard', 'rankings', 'mtime', 'version', 'loaded_at', 'body', 'relays')
+
+    def __init__(self, athletes, index, leaderboard, rankings, mtime, version):
+        """A parsed season held in memory
+
+        Everything derived from the season (its encoded body, memoized relays) lives on the
+        entry, so it goes away with it when the season is refreshed.
+
+        Args:
+            athletes: athlete_id -> Athlete, conversions included
+            index: the season's EventIndex, shared by every relay request
+            leaderboard: the season's Leaderboard, shared by every athlete query
+            rankings: the season's Rankings across events
+            mtime: the modification time of the file the athletes were read from
+            version: identifies the file's contents, for ETags
+        """
+        self.athletes = athletes
+        self.index = index
+        self.leaderboard = leaderboard
+        self.rankings = rankings
+        self.mtime = mtime
+        self.version = version
+        self.loaded_at = time.time()
+        self.body = None
+        self.relays = {}
+
+
+class SeasonStore(object):
+
+    def __init__(self, ttl=60 * 60 * 12):
+        """A process-wide cache of seasons keyed by (year, season, gender, team)
+
+        Seasons are parsed once and reused until their file changes on disk or, for the
+        current season, until they are older than the ttl. Only one caller rebuilds a
+        stale season; everyone else keeps getting the last good copy in the meantime.
+
+        The ttl doesn't apply to the (gender, team) pairs in scheduled, whose current season
+        is kept up to date with refresh() (see scheduler.RefreshScheduler).
+
+        Args:
+            ttl: seconds before the current season is fetched from yentiming again, None
+                to leave refreshing every current season to refresh()
+        """
+        self.ttl = ttl
+        self.scheduled = set()
+        self._entries = {}
+        self._locks = {}
+        self._locks_lock = threading.Lock()
+
+    def get(self, year, season, gender, team=DEFAULT_TEAM):
+        """Returns the athletes of a season, loading or refreshing it if needed
+
+        Args:
+            year (int): The year of the season
+            season (str): 'indoor' or 'outdoor'
+            gender (str): 'm' or 'f'
+            team: the team, or group of teams, the season is for (see utils.team_key)
+        """
+        return self.entry(year, season, gender, team).athletes
+
+    def entry(self, year, season, gender, team=DEFAULT_TEAM):
+        """Returns the SeasonEntry of a season, loading or refreshing it if needed
+
+        A group of teams is one entry, so its Leaderboard ranks every team's athletes together.
+
+        Args:
+            year (int): The year of the season
+            season (str): 'indoor' or 'outdoor'
+            gender (str): 'm' or 'f'
+            team: the team, or group of teams, the season is for (see utils.team_key)
+        """
+        key = (year, season, gender, team_key(team))
+        entry = self._entries.get(key)
+        if entry is not None and not self._is_stale(key, entry):
+            metrics.inc('fairport_cache_hits_total', cache='season')
+            return entry
+
+        metrics.inc('fairport_cache_misses_total', cache='season')
+        lock = self._lock(key)
+        if entry is not None:
+            # Somebody is already rebuilding this season, serve the copy we have
+            if not lock.acquire(blocking=False):
+                return entry
+        else:
+            lock.acquire()
+
+        try:
+            entry = self._entries.get(key)
+            if entry is None or self._is_stale(key, entry):
+                try:
+                    entry = self._load(key)
+                except Exception:
+                    if entry is None:
+                        raise
+            return entry
+        finally:
+            lock.release()
+
+    def refresh(self, year, season, gender, team=DEFAULT_TEAM, min_age=0):
+        """Syncs a season with yentiming and swaps it in once it is fully loaded
+
+        Readers keep getting the previous copy until the new one is ready. If nothing
+        changed the saved season and the copy in memory are left alone.
+
+        Only one process syncs a season at a time. If another one is already syncing it,
+        or synced it less than min_age seconds ago, nothing is fetched; readers pick the
+        other process's snapshot up as soon as it is saved. When a sync ends, {path}.synced
+        is touched even if nothing changed. The snapshot is only rewritten when something
+        changed, so its own mtime can't tell workers that the season was just synced.
+
+        Args:
+            year (int): The year of the season
+            season (str): 'indoor' or 'outdoor'
+            gender (str): 'm' or 'f'
+            team: the team, or group of teams, the season is for (see utils.team_key)
+            min_age: seconds a synced season is left alone for
+
+        Returns:
+            tuple: the synced YenData and the ids of the athletes that changed, or
+            (None, set()) if another process took care of it
+        """
+        key = (year, season, gender, team_key(team))
+        path = season_path(*key)
+        synced = f'{path}.synced'
+        with self._lock(key), file_lock(path, blocking=False) as locked:
+            mtime = self._mtime(synced)
+            if not locked or (mtime is not None and time.time() - mtime < min_age):
+                return None, set()
+
+            yen, changed = sync_season(*key)
+            pathlib.Path(synced).touch()
+            if changed or key not in self._entries:
+                self._read(key)
+            return yen, changed
+
+    def _lock(self, key):
+        with self._locks_lock:
+            lock = self._locks.get(key)
+            if lock is None:
+                lock = self._locks[key] = threading.Lock()
+            return lock
+
+    def _is_expired(self, key, mtime):
+        year, season, gender, team = key
+        if self.ttl is None or (gender, team) in self.scheduled:
+            return False
+        return is_current_season(year, season) and time.time() - mtime > self.ttl
+
+    @staticmethod
+    def _mtime(path):
+        try:
+            return os.stat(path).st_mtime
+        except FileNotFoundError:
+            return None
+
+    def _is_stale(self, key, entry):
+        mtime = self._mtime(season_path(*key))
+        if mtime is None:
+            return True
+        return mtime != entry.mtime or self._is_expired(key, mtime)
+
+    def _load(self, key):
+        path = season_path(*key)
+        json_path = season_path(*key, extension='json')
+        if not os.path.exists(path) and os.path.exists(json_path):
+            # Seasons saved before snapshots existed only need converting, not scraping again
+            snapshot.migrate(json_path, path)
+
+        mtime = self._mtime(path)
+        if mtime is None or self._is_expired(key, mtime):
+            with file_lock(path):
+                # Another process may have fetched it while we were waiting for the lock
+                mtime = self._mtime(path)
+                if mtime is None or self._is_expired(key, mtime):
+                    fetch_season(*key)
+
+        return self._read(key)
+
+    def _read(self, key):
+        with metrics.span('snapshot_load'):
+            season = snapshot.read(season_path(*key))
+            stat = season.stat
+            athletes = season.to_athletes()
+            if season.scores is None:
+                # Snapshots saved before scores were stored; Purdy is only imported for them
+                from fairport_run import scores
+
+                scores.score(athletes)
+            entry = SeasonEntry(athletes, EventIndex.from_snapshot(season), Leaderboard(athletes),
+                                Rankings(athletes), stat.st_mtime, snapshot.version(stat))
+        self._entries[key] = entry
+        return entry
+
+
+def save_season(yen):
+    """Saves a fetched season and the history shard of every team in it
+
+    A season fetched for a group of teams is saved whole, for queries across the teams, and
+    once per team, so each team's own season is there without fetching it again.
+
+    Args:
+        yen (YenData): the season, conversions included
+    """
+    yen.save_athletes()
+    if len(team_ids(yen.team)) == 1:
+        history.save_shard(yen.year, yen.season, yen.gender, yen.athletes, yen.team)
+        return
+
+    for team, athletes in yen.by_team().items():
+        path = season_path(yen.year, yen.season, yen.gender, team)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        snapshot.dump(athletes, path)
+        history.save_shard(yen.year, yen.season, yen.gender, athletes, team)
+
+
+def fetch_season(year, season, gender, team=DEFAULT_TEAM, from_archive=False):
+    """Fetches the results of the season from yentiming and then saves them
+
+    Args:
+        year (int): The year of the season.
+        season (str): The season, 'indoor' or 'outdoor'.
+        gender (str): The gender 'm' or 'f'.
+        team: The team, or group of teams fetched together (see utils.team_key).
+        from_archive (bool): Rebuild from the archived records instead of fetching.
+
+    Returns:
+        YenData: the saved season
+    """
+    # The scraping stack is only imported once a season actually has to be fetched
+    from fairport_run.yendata import YenData
+
+    yen = YenData(year=year, season=season, gender=gender, team=team, from_archive=from_archive)
+    yen.add_converted()
+    yen.add_scores()
+    save_season(yen)
+    return yen
+
+
+def sync_season(year, season, gender, team=DEFAULT_TEAM):
+    """Brings a saved season up to date, converting only the athletes whose marks changed
+
+    Seasons that haven't been saved yet are fetched in full.
+
+    Args:
+        year (int): The year of the season.
+        season (str): The season, 'indoor' or 'outdoor'.
+        gender (str): The gender 'm' or 'f'.
+        team: The team, or group of teams fetched together (see utils.team_key).
+
+    Returns:
+        tuple: the synced YenData and the ids of the athletes that were added, changed or
+        removed, empty if the season was already up to date
+    """
+    path = season_path(year, season, gender, team)
+    try:
+        previous = snapshot.load(path)
+    except (OSError, ValueError):
+        yen = fetch_season(year, season, gender, team)
+        return yen, set(yen.athletes)
+
+    from fairport_run.yendata import YenData
+
+    yen = YenData(year=year, season=season, gender=gender, team=team)
+    changed = yen.merge(previous)
+    removed = previous.keys() - yen.athletes.keys()
+    if changed or removed:
+        yen.add_converted(changed)
+        # Athletes kept from a snapshot without scores need them as well, and scoring is cheap
+        yen.add_scores()
+        save_season(yen)
+
+    return yen, changed | removed
+
+
+store = SeasonStore()
@@ -1,33 +1,39 @@
 import os
+import tempfile
+from contextlib import contextmanager
 from datetime import datetime
 import time
 
+from fairport_run import parsing
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
 def format_time(time):
     """Formats floats into time strings and time strings into floats.
     Args:
-        time (float or str): Time in seconds or a string in the format "MM:SS" or "MM:SS.sss".
+        time (float or str): Time in seconds or a string in the format "SS.ss", "MM:SS.ss" or "H:MM:SS.ss".
     """
 
     if isinstance(time, str):
-        time = time.split(":")
-        minutes = int(time[0])
-        seconds = float(time[1])
-        return minutes * 60 + seconds
+        return parsing.parse_time(time)
 
-    return f'{int(time // 60)}:{round(time % 60, 2) if time % 60 >= 10 else f"0{round(time % 60, 2)}"}'
+    return parsing.format_seconds(time)
 
 def compare_greater(time1, time2):
     """Compares two times regardless of format.
     Args:
-        time1 (float or str): Time in seconds or a string in the format "MM:SS" or "MM:SS.sss".
-        time2 (float or str): Time in seconds or a string in the format "MM:SS" or "MM:SS.sss".
+        time1 (float or str): Time in seconds or a string in the format "SS.ss", "MM:SS.ss" or "H:MM:SS.ss".
+        time2 (float or str): Time in seconds or a string in the format "SS.ss", "MM:SS.ss" or "H:MM:SS.ss".
     """
 
     if isinstance(time1, str):
-        time1 = format_time(time1)
+        time1 = parsing.parse_time(time1)
 
     if isinstance(time2, str):
-        time2 = format_time(time2)
+        time2 = parsing.parse_time(time2)
 
     return time1 > time2
 
@@ -36,14 +42,12 @@ def event_to_dist(event_name):
 
     Args:
         event_name (str): Name of the event.
-    """
 
-    nums = ""
-    for char in event_name:
-        if char.isnumeric() or char == '.':
-            nums += char
+    Returns:
+        float: The distance in meters, or None for field events.
+    """
 
-    return float(nums)
+    return parsing.event(event_name).distance
 
 def get_current_season():
     """Returns the current season.
@@ -87,4 +91,125 @@ def get_file_age(file_path):
     file_age = time.time() - modification_timestamp
     return file_age
 
+# The team whose seasons are saved at the top of the tree
+DEFAULT_TEAM = '85'
+
+def team_key(team):
+    """Returns the key a team, or a group of teams fetched together, is stored under.
+
+    Args:
+        team (int, str or list): A yentiming team id, several of them ('85,90', '85+90' or a
+            list), or a key this returned.
+
+    Returns:
+        str: The ids in ascending order joined by '+', e.g. '85' or '85+90+112'.
+
+    Raises:
+        ValueError: If an id isn't a number.
+    """
+    if isinstance(team, int):
+        return str(team)
+    if isinstance(team, str) and team.isdigit():
+        return team
+
+    ids = {str(team_id).strip() for team_id in (team.replace('+', ',').split(',') if isinstance(team, str) else team)}
+    if not ids or not all(team_id.isdigit() for team_id in ids):
+        raise ValueError(f'Not a team id: {team!r}')
+    return '+'.join(sorted(ids, key=int))
+
+def team_ids(team):
+    """Returns the ids of the teams in a team key.
+
+    Args:
+        team (int, str or list): Anything team_key accepts.
+    """
+    return team_key(team).split('+')
+
+def season_path(year, season, gender, team=DEFAULT_TEAM, extension='frs'):
+    """Returns the path a season's athletes are saved to.
+
+    Seasons of DEFAULT_TEAM are saved at {season}/{gender}/{year}, every other team (or group
+    of teams) at teams/{team}/{season}/{gender}/{year}.
 
+    Args:
+        year (int): The year of the season.
+        season (str): 'indoor' or 'outdoor'.
+        gender (str): 'm' or 'f'.
+        team (int, str or list): The team, or teams, the season is for (see team_key).
+        extension (str): 'frs' for the snapshot or 'json' for the JSON export.
+    """
+    team = team_key(team)
+    if team == DEFAULT_TEAM:
+        return f'{season}/{gender}/{year}.{extension}'
+    return f'teams/{team}/{season}/{gender}/{year}.{extension}'
+
+def is_current_season(year, season):
+    """Returns whether a season is the one currently in progress.
+
+    Args:
+        year (int): The year of the season.
+        season (str): 'indoor' or 'outdoor'.
+    """
+    return season == get_current_season() and year == get_current_year()
+
+def is_past_season(year, season):
+    """Returns whether a season ended before the current one, so its results can't change anymore.
+
+    Within a year the indoor season comes first, so the current season and every later one
+    are still open.
+
+    Args:
+        year (int): The year of the season.
+        season (str): 'indoor' or 'outdoor'.
+    """
+    order = ('indoor', 'outdoor')
+    return (year, order.index(season)) < (get_current_year(), order.index(get_current_season()))
+
+def atomic_write(path, data):
+    """Writes a file so readers only ever see the old or the new contents, never part of them.
+
+    Args:
+        path (str or Path): The path to write to.
+        data (bytes or str): The contents.
+    """
+    path = os.fspath(path)
+    fd, temp = tempfile.mkstemp(dir=os.path.dirname(path) or '.', prefix=f'.{os.path.basename(path)}.')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data.encode() if isinstance(data, str) else data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(temp, 0o644)
+        os.replace(temp, path)
+    except BaseException:
+        os.unlink(temp)
+        raise
+
+@contextmanager
+def file_lock(path, blocking=True):
+    """Holds an exclusive lock on path + '.lock' across processes.
+
+    Args:
+        path (str or Path): The file to lock.
+        blocking (bool): Whether to wait for the lock or give up straight away.
+
+    Yields:
+        bool: Whether the lock was acquired (always True when blocking).
+    """
+    if fcntl is None:
+        yield True
+        return
+
+    lock_path = f'{os.fspath(path)}.lock'
+    os.makedirs(os.path.dirname(lock_path) or '.', exist_ok=True)
+    with open(lock_path, 'a') as f:
+        try:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX | (0 if blocking else fcntl.LOCK_NB))
+        except BlockingIOError:
+            yield False
+            return
+
+        try:
+            yield True
+        finally:
+            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
@@ -0,0 +1,209 @@
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from fairport_run import metrics
+from fairport_run.index import EventIndex
+from fairport_run.relays import Relay, best_lineup
+
+
+class Saturated(Exception):
+    """Raised when too many relay searches are already queued"""
+
+
+class WorkerDied(Exception):
+    """Raised when a worker process died during a search and the pool was replaced"""
+
+
+def generate_relays(marks, events, number):
+    """Runs a relay search in a worker process
+
+    Args:
+        marks: event -> [(time, athlete_id), ...], only the events of the relay
+        events: the legs of the relay
+        number: how many relays to return
+
+    Returns:
+        tuple: the relays and the search's stats, which the parent process records
+    """
+    relay = Relay(EventIndex(marks), *events)
+    relay.generate_relays(number)
+    return relay.relays, relay.stats
+
+
+def generate_batch(marks, relays, number):
+    """Runs several relay searches in a worker process, over one index
+
+    Args:
+        marks: event -> [(time, athlete_id), ...], the events of every relay
+        relays: name -> the legs of the relay
+        number: how many of each relay to return
+
+    Returns:
+        tuple: name -> relays, and the stats of every search
+    """
+    index = EventIndex(marks)
+    results = {}
+    stats = []
+    for name, events in relays.items():
+        relay = Relay(index, *events)
+        relay.generate_relays(number)
+        results[name] = relay.relays
+        stats.append(relay.stats)
+    return results, stats
+
+
+def pick_lineup(marks, relays):
+    """Picks a lineup across relays in a worker process (see relays.best_lineup)
+
+    Args:
+        marks: event -> [(time, athlete_id), ...], the events of every relay
+        relays: name -> the legs of the relay
+    """
+    return best_lineup(EventIndex(marks), relays)
+
+
+class RelayPool(object):
+
+    def __init__(self, workers=None, max_pending=None, timeout=None):
+        """A bounded process pool for relay searches
+
+        Searches run away from the event loop and its threads, so slow ones can't hold up
+        athlete reads. Past max_pending queued or running searches new ones are turned
+        away instead of piling up.
+
+        Args:
+            workers: processes to run searches in (defaults to $FAIRPORT_RELAY_WORKERS or 2)
+            max_pending: most searches queued or running at once (defaults to $FAIRPORT_RELAY_QUEUE or 4 per worker)
+            timeout: seconds a request waits for its search (defaults to $FAIRPORT_RELAY_TIMEOUT or 10)
+        """
+        self.workers = workers or int(os.environ.get('FAIRPORT_RELAY_WORKERS', 2))
+        self.max_pending = max_pending or int(os.environ.get('FAIRPORT_RELAY_QUEUE', self.workers * 4))
+        self.timeout = timeout or float(os.environ.get('FAIRPORT_RELAY_TIMEOUT', 10))
+        self.pending = 0
+        self._pool = None
+
+    def start(self):
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(self.workers, mp_context=multiprocessing.get_context('spawn'))
+
+    def stop(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    async def generate_relays(self, index, events, number, roster=None):
+        """Finds the fastest relays in a worker process
+
+        Args:
+            index: the season's EventIndex
+            events: the legs of the relay
+            number: how many relays to return
+            roster: only consider the fastest this many athletes in each event
+
+        Raises:
+            Saturated: if max_pending searches are already queued or running
+            asyncio.TimeoutError: if the search took longer than the timeout, in which case
+                it is cancelled if it hadn't started yet
+        """
+        marks = {event: index.top(event, roster) for event in set(events)}
+        (relays, stats), = await self._run('generate_relays', [(generate_relays, marks, list(events), number)])
+        self._record([stats])
+        return relays
+
+    async def generate_batch(self, index, relays, number, roster=None, parallel=False, lineup=False):
+        """Finds the fastest relays of several kinds, and optionally a lineup across them
+
+        The marks of every relay are taken from the index once. By default one worker runs
+        every search; with parallel each relay gets a worker of its own, which is faster when
+        workers are free but takes as many of the max_pending slots as there are relays. When
+        fewer slots than that are free the searches fall back to one worker. The lineup is
+        picked in a worker of its own, alongside the searches.
+
+        Args:
+            index: the season's EventIndex
+            relays: name -> the legs of the relay
+            number: how many of each relay to return
+            roster: only consider the fastest this many athletes in each event
+            parallel: search the relays in separate workers
+            lineup: also pick a lineup in which nobody runs two of the relays (approximate, see relays.best_lineup)
+
+        Returns:
+            tuple: name -> relays fastest first, and name -> the lineup's relay (None without lineup)
+
+        Raises:
+            Saturated: if fewer than the slots of one worker's searches (and the lineup's) are free
+            asyncio.TimeoutError: if the searches took longer than the timeout
+        """
+        relays = {name: list(events) for name, events in relays.items()}
+        marks = {event: index.top(event, roster) for events in relays.values() for event in events}
+        if parallel and len(relays) + lineup <= self.max_pending - self.pending:
+            tasks = [(generate_batch, {event: marks[event] for event in events}, {name: events}, number)
+                     for name, events in relays.items()]
+        else:
+            tasks = [(generate_batch, marks, relays, number)]
+        if lineup:
+            tasks.append((pick_lineup, marks, relays))
+
+        done = await self._run('generate_relays', tasks)
+        chosen = done.pop() if lineup else None
+
+        found = {}
+        stats = []
+        for results, searched in done:
+            found.update(results)
+            stats += searched
+        self._record(stats)
+        return {name: found[name] for name in relays}, chosen
+
+    async def _run(self, stage, tasks):
+        """Runs (function, *args) tasks in the pool and returns their results in order
+
+        Raises:
+            Saturated: if the tasks would take the pool past max_pending
+            WorkerDied: if a worker died (out of memory, a crash), in which case the pool is
+                replaced so later searches run again
+            asyncio.TimeoutError: if they took longer than the timeout, in which case the ones
+                that hadn't started yet are cancelled
+        """
+        if self.pending + len(tasks) > self.max_pending:
+            raise Saturated()
+
+        self.start()
+        pool = self._pool
+        # A task that timed out may still be running, so it only stops counting once it is done
+        loop = asyncio.get_running_loop()
+        futures = []
+        try:
+            for function, *args in tasks:
+                future = pool.submit(function, *args)
+                self.pending += 1
+                future.add_done_callback(lambda _: loop.call_soon_threadsafe(self._done))
+                futures.append(future)
+
+            with metrics.span(stage):
+                return await asyncio.wait_for(asyncio.gather(*map(asyncio.wrap_future, futures)), self.timeout)
+        except asyncio.TimeoutError:
+            for future in futures:
+                future.cancel()
+            raise
+        except BrokenProcessPool:
+            # A broken pool fails every search from then on. Requests that were in it together
+            # all land here, and only the first replaces it.
+            if self._pool is pool:
+                metrics.inc('fairport_relay_pool_restarts_total')
+                self.stop()
+                self.start()
+            raise WorkerDied()
+
+    @staticmethod
+    def _record(stats):
+        for search in stats:
+            metrics.inc('fairport_relay_heap_pops_total', search['heap_pops'])
+            metrics.inc('fairport_relay_subproblems_total', search['subproblems'])
+            metrics.observe('fairport_relay_peak_heap', search['peak_heap'])
+
+    def _done(self):
+        self.pending -= 1
@@ -1,22 +1,112 @@
 import datetime
-import pathlib
-
-import requests
 import json
+import os
+import pathlib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+from fairport_run import archive, conversions, metrics, model, scores, snapshot
+from fairport_run.model import Athlete, EventType, Performance
+from fairport_run.utils import atomic_write, season_path, team_ids, team_key
+
+BASE_URL = os.environ.get('YENTIMING_URL', 'https://www.yentiming.com')
+
+# The season YenData(testing=True) uses instead of fetching one
+SAMPLE_PATH = pathlib.Path(__file__).parent / 'data' / 'sample.json'
+
+_session = None
+_session_lock = threading.Lock()
+_events = {}
+_events_lock = threading.Lock()
+
+
+def get_session():
+    """Returns the session every request to yentiming goes through
+
+    It is pooled so pages reuse keep-alive connections instead of opening a new one each.
+    requests is only imported the first time something is fetched, so processes that only
+    serve saved seasons never load it.
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+
+                session = requests.Session()
+                session.mount('http://', HTTPAdapter(pool_connections=4, pool_maxsize=32))
+                session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=32))
+                _session = session
+    return _session
+
+
+@lru_cache(maxsize=None)
+def _sample():
+    with open(SAMPLE_PATH, 'r') as f:
+        return json.load(f)
+
+
+def sample_records():
+    """Returns the records of the sample season, read from SAMPLE_PATH the first time"""
+    return [dict(record) for record in _sample()]
+
+
+def get_events(season, ttl=60 * 60 * 24):
+    """Returns the names of every event yentiming has for a season, cached for a day
+
+    Every season and team shares the one list, and fetches that miss it at the same time
+    wait for a single request instead of each making their own.
+
+    Args:
+        season: 'indoor' or 'outdoor'
+        ttl: seconds to keep the event list before asking for it again
+    """
+    cached = _events.get(season)
+    if cached is None or time.time() - cached[0] > ttl:
+        with _events_lock:
+            cached = _events.get(season)
+            if cached is None or time.time() - cached[0] > ttl:
+                metrics.inc('fairport_cache_misses_total', cache='events')
+                metrics.inc('fairport_upstream_requests_total', endpoint='getEvents')
+                events = json.loads(get_session().get(f'{BASE_URL}/results2/getEvents').text)
+                fetched = time.time()
+                for key, value in events.items():
+                    _events[key] = (fetched, list(value.keys()))
+                return _events[season][1]
+
+    metrics.inc('fairport_cache_hits_total', cache='events')
+    return cached[1]
+
+
+def get_page(url, page):
+    """Returns a single page of a leaderboard
+
+    Args:
+        url: the leaderboard url without the page
+        page: the page number, starting at 1
+    """
+    metrics.inc('fairport_upstream_requests_total', endpoint='leaderboard')
+    with metrics.span('get_page'):
+        response = get_session().get(f'{url}&page={page}').text
+        return json.loads(json.loads(response))
 
-from fairport_run.purdy import Purdy
-from fairport_run.utils import format_time, event_to_dist
 
 class YenData(object):
 
-    def __init__(self, season='', year=0, gender='m', team=85, testing=False):
+    def __init__(self, season='', year=0, gender='m', team=85, testing=False, concurrency=8, from_archive=False):
         """A class to collect, organize and save running data from yentiming.com
 
         Args:
             season: 'indoor' or 'outdoor'
             year: the year of the season
             gender: 'm' or 'f'
-            team: the id of the team (can be obtained from https://www.yentiming.com/results2/getTeams)
+            team: the id of the team (can be obtained from https://www.yentiming.com/results2/getTeams), or
+                several of them ('85,90' or a list) to fetch a whole league in the same requests
+            concurrency: the most leaderboard pages to request at once
+            from_archive: rebuild from the latest archived fetch instead of scraping (see fairport_run.archive)
         """
 
         now = datetime.datetime.now()
@@ -27,133 +117,191 @@ class YenData(object):
         # If year is not defined, we choose the current year if the month is before November and the next year otherwise (because the season is indoor)
         self.year = year if year else (now.year if month < 11 else now.year + 1)
         self.gender = gender
-        self.team = team
+        self.team = team_key(team)
+        self.concurrency = concurrency
         if testing:
-            self.data = [{'performance': '00:10.90', 'event_id': '1', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '628873', 'athlete_fname': 'Frank', 'athlete_lname': "D'Angelo", 'graduate': '2025', 'event_name': '100m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '00:11.17', 'event_id': '1', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '628875', 'athlete_fname': 'Bailey', 'athlete_lname': 'Frank', 'graduate': '2025', 'event_name': '100m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '00:11.38', 'event_id': '1', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '639973', 'athlete_fname': 'Jared', 'athlete_lname': 'Mulley', 'graduate': '2027', 'event_name': '100m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '00:11.44', 'event_id': '1', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/11/2025', 'meet_id': '0', 'resultType': '1', 'meet': 'Penfield', 'athlete_id': '639977', 'athlete_fname': 'Leith', 'athlete_lname': 'Steele', 'graduate': '2027', 'event_name': '100m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '00:11.45', 'event_id': '1', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '647018', 'athlete_fname': 'Austin', 'athlete_lname': 'Corwin', 'graduate': '2027', 'event_name': '100m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '00:11.70', 'event_id': '1', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '647025', 'athlete_fname': 'Nathan', 'athlete_lname': 'Supersad', 'graduate': '2028', 'event_name': '100m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '00:11.74', 'event_id': '1', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/11/2025', 'meet_id': '0', 'resultType': '1', 'meet': 'Penfield', 'athlete_id': '648736', 'athlete_fname': 'Sir Joshuah', 'athlete_lname': 'Craddock', 'graduate': '2028', 'event_name': '100m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '00:11.99', 'event_id': '1', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '647020', 'athlete_fname': 'Remington', 'athlete_lname': 'Kayser', 'graduate': '2028', 'event_name': '100m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '00:12.04', 'event_id': '1', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/11/2025', 'meet_id': '0', 'resultType': '1', 'meet': 'Penfield', 'athlete_id': '633907', 'athlete_fname': 'Peter', 'athlete_lname': 'Huang', 'graduate': '2026', 'event_name': '100m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '00:12.07', 'event_id': '1', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '634897', 'athlete_fname': 'Kaleb', 'athlete_lname': 'Casiano', 'graduate': '2026', 'event_name': '100m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '00:12.15', 'event_id': '1', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '639968', 'athlete_fname': 'Anthony', 'athlete_lname': 'Bowen', 'graduate': '2027', 'event_name': '100m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '00:12.21', 'event_id': '1', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '647024', 'athlete_fname': 'Jayden', 'athlete_lname': 'Stafford', 'graduate': '2027', 'event_name': '100m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '00:12.24', 'event_id': '1', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/11/2025', 'meet_id': '0', 'resultType': '1', 'meet': 'Penfield', 'athlete_id': '641778', 'athlete_fname': 'Ethan', 'athlete_lname': 'Torres', 'graduate': '2027', 'event_name': '100m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '00:12.30', 'event_id': '1', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '647016', 'athlete_fname': 'Amare', 'athlete_lname': 'Bordley', 'graduate': '2028', 'event_name': '100m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '00:12.38', 'event_id': '1', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '641760', 'athlete_fname': 'James', 'athlete_lname': 'Carter III', 'graduate': '2027', 'event_name': '100m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '00:12.54', 'event_id': '1', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '626260', 'athlete_fname': 'Jaki', 'athlete_lname': 'Huang', 'graduate': '2026', 'event_name': '100m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '00:12.55', 'event_id': '1', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '647031', 'athlete_fname': 'Nico', 'athlete_lname': 'Zukaitis', 'graduate': '2028', 'event_name': '100m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '00:12.65', 'event_id': '1', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '641775', 'athlete_fname': 'Souksanh', 'athlete_lname': 'Sirimongkhoun', 'graduate': '2027', 'event_name': '100m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '00:12.74', 'event_id': '1', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/11/2025', 'meet_id': '0', 'resultType': '1', 'meet': 'Penfield', 'athlete_id': '641779', 'athlete_fname': 'Arthur', 'athlete_lname': 'Woyciesjes', 'graduate': '2027', 'event_name': '100m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '00:12.84', 'event_id': '1', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/11/2025', 'meet_id': '0', 'resultType': '1', 'meet': 'Penfield', 'athlete_id': '647029', 'athlete_fname': 'Brandon', 'athlete_lname': 'Wildrick', 'graduate': '2026', 'event_name': '100m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '00:12.84', 'event_id': '1', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/11/2025', 'meet_id': '0', 'resultType': '1', 'meet': 'Penfield', 'athlete_id': '643385', 'athlete_fname': 'Jayden', 'athlete_lname': 'Quinones', 'graduate': '2027', 'event_name': '100m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '00:12.96', 'event_id': '1', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '648735', 'athlete_fname': 'Torstan', 'athlete_lname': 'Cardinal', 'graduate': '2026', 'event_name': '100m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '00:13.04', 'event_id': '1', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/11/2025', 'meet_id': '0', 'resultType': '1', 'meet': 'Penfield', 'athlete_id': '648732', 'athlete_fname': 'Ryan', 'athlete_lname': 'Bayley', 'graduate': '2028', 'event_name': '100m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '00:13.04', 'event_id': '1', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/11/2025', 'meet_id': '0', 'resultType': '1', 'meet': 'Penfield', 'athlete_id': '648750', 'athlete_fname': 'Cole', 'athlete_lname': 'Yarbrough', 'graduate': '2028', 'event_name': '100m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '00:13.30', 'event_id': '1', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '648742', 'athlete_fname': 'Atticus', 'athlete_lname': 'Holzhacker', 'graduate': '2027', 'event_name': '100m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '00:13.31', 'event_id': '1', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '641758', 'athlete_fname': 'Ethan', 'athlete_lname': 'Betz', 'graduate': '2027', 'event_name': '100m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '00:13.53', 'event_id': '1', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '648743', 'athlete_fname': "Tae'lor", 'athlete_lname': 'Lloyd', 'graduate': '2028', 'event_name': '100m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '00:13.54', 'event_id': '1', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/11/2025', 'meet_id': '0', 'resultType': '1', 'meet': 'Penfield', 'athlete_id': '648747', 'athlete_fname': 'Troy', 'athlete_lname': 'Sanchez', 'graduate': '2027', 'event_name': '100m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '00:13.69', 'event_id': '1', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '641769', 'athlete_fname': 'Chase', 'athlete_lname': 'Mirando', 'graduate': '2027', 'event_name': '100m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '00:13.74', 'event_id': '1', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/11/2025', 'meet_id': '0', 'resultType': '1', 'meet': 'Penfield', 'athlete_id': '648734', 'athlete_fname': 'Caden', 'athlete_lname': 'Browne', 'graduate': '2028', 'event_name': '100m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '00:14.24', 'event_id': '1', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/11/2025', 'meet_id': '0', 'resultType': '1', 'meet': 'Penfield', 'athlete_id': '648748', 'athlete_fname': 'Gabriel', 'athlete_lname': 'Vantucci', 'graduate': '2028', 'event_name': '100m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '00:14.64', 'event_id': '1', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '648741', 'athlete_fname': 'Eli', 'athlete_lname': 'Harrison', 'graduate': '2027', 'event_name': '100m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '00:14.81', 'event_id': '1', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '641764', 'athlete_fname': 'Carson', 'athlete_lname': 'Gould', 'graduate': '2027', 'event_name': '100m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '00:15.34', 'event_id': '1', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/11/2025', 'meet_id': '0', 'resultType': '1', 'meet': 'Penfield', 'athlete_id': '634900', 'athlete_fname': 'Logan', 'athlete_lname': 'Fasy', 'graduate': '2026', 'event_name': '100m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '00:15.44', 'event_id': '1', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/11/2025', 'meet_id': '0', 'resultType': '1', 'meet': 'Penfield', 'athlete_id': '641759', 'athlete_fname': 'SaVon', 'athlete_lname': 'Bryant', 'graduate': '2026', 'event_name': '100m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '00:18.03', 'event_id': '3', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/26/2025', 'meet_id': '2048', 'resultType': '0', 'meet': 'His & Her Invitational', 'athlete_id': '641778', 'athlete_fname': 'Ethan', 'athlete_lname': 'Torres', 'graduate': '2027', 'event_name': '110 Hurdles', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '00:18.43', 'event_id': '3', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/04/2025', 'meet_id': '2051', 'resultType': '0', 'meet': 'Victor Pent / Steeple Invit', 'athlete_id': '628873', 'athlete_fname': 'Frank', 'athlete_lname': "D'Angelo", 'graduate': '2025', 'event_name': '110 Hurdles', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '00:19.04', 'event_id': '3', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/04/2025', 'meet_id': '2051', 'resultType': '0', 'meet': 'Victor Pent / Steeple Invit', 'athlete_id': '639977', 'athlete_fname': 'Leith', 'athlete_lname': 'Steele', 'graduate': '2027', 'event_name': '110 Hurdles', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '00:20.10', 'event_id': '3', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/04/2025', 'meet_id': '2051', 'resultType': '0', 'meet': 'Victor Pent / Steeple Invit', 'athlete_id': '639973', 'athlete_fname': 'Jared', 'athlete_lname': 'Mulley', 'graduate': '2027', 'event_name': '110 Hurdles', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '00:20.69', 'event_id': '3', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '648738', 'athlete_fname': 'Colin', 'athlete_lname': 'Deuel', 'graduate': '2028', 'event_name': '110 Hurdles', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '00:20.91', 'event_id': '3', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '648743', 'athlete_fname': "Tae'lor", 'athlete_lname': 'Lloyd', 'graduate': '2028', 'event_name': '110 Hurdles', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '00:22.09', 'event_id': '3', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/26/2025', 'meet_id': '2048', 'resultType': '0', 'meet': 'His & Her Invitational', 'athlete_id': '650942', 'athlete_fname': 'Daryl', 'athlete_lname': 'Dutko', 'graduate': '2027', 'event_name': '110 Hurdles', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '00:22.82', 'event_id': '51', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '628873', 'athlete_fname': 'Frank', 'athlete_lname': "D'Angelo", 'graduate': '2025', 'event_name': '200m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '00:23.64', 'event_id': '51', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '639977', 'athlete_fname': 'Leith', 'athlete_lname': 'Steele', 'graduate': '2027', 'event_name': '200m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '00:23.65', 'event_id': '51', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '647018', 'athlete_fname': 'Austin', 'athlete_lname': 'Corwin', 'graduate': '2027', 'event_name': '200m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '00:24.44', 'event_id': '51', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/11/2025', 'meet_id': '0', 'resultType': '1', 'meet': 'Penfield', 'athlete_id': '628875', 'athlete_fname': 'Bailey', 'athlete_lname': 'Frank', 'graduate': '2025', 'event_name': '200m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '00:24.66', 'event_id': '51', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '639968', 'athlete_fname': 'Anthony', 'athlete_lname': 'Bowen', 'graduate': '2027', 'event_name': '200m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '00:24.84', 'event_id': '51', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '647020', 'athlete_fname': 'Remington', 'athlete_lname': 'Kayser', 'graduate': '2028', 'event_name': '200m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '00:25.27', 'event_id': '51', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '647025', 'athlete_fname': 'Nathan', 'athlete_lname': 'Supersad', 'graduate': '2028', 'event_name': '200m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '00:25.41', 'event_id': '51', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '647024', 'athlete_fname': 'Jayden', 'athlete_lname': 'Stafford', 'graduate': '2027', 'event_name': '200m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '00:25.41', 'event_id': '51', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '647024', 'athlete_fname': 'Jayden', 'athlete_lname': 'Stafford', 'graduate': '2027', 'event_name': '200m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '00:25.52', 'event_id': '51', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '647016', 'athlete_fname': 'Amare', 'athlete_lname': 'Bordley', 'graduate': '2028', 'event_name': '200m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '00:25.55', 'event_id': '51', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '634897', 'athlete_fname': 'Kaleb', 'athlete_lname': 'Casiano', 'graduate': '2026', 'event_name': '200m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '00:25.55', 'event_id': '51', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '647031', 'athlete_fname': 'Nico', 'athlete_lname': 'Zukaitis', 'graduate': '2028', 'event_name': '200m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '00:25.71', 'event_id': '51', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '648738', 'athlete_fname': 'Colin', 'athlete_lname': 'Deuel', 'graduate': '2028', 'event_name': '200m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '00:25.74', 'event_id': '51', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/11/2025', 'meet_id': '0', 'resultType': '1', 'meet': 'Penfield', 'athlete_id': '647029', 'athlete_fname': 'Brandon', 'athlete_lname': 'Wildrick', 'graduate': '2026', 'event_name': '200m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '00:25.90', 'event_id': '51', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '641760', 'athlete_fname': 'James', 'athlete_lname': 'Carter III', 'graduate': '2027', 'event_name': '200m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '00:26.08', 'event_id': '51', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '633907', 'athlete_fname': 'Peter', 'athlete_lname': 'Huang', 'graduate': '2026', 'event_name': '200m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '00:26.27', 'event_id': '51', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '641775', 'athlete_fname': 'Souksanh', 'athlete_lname': 'Sirimongkhoun', 'graduate': '2027', 'event_name': '200m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '00:26.44', 'event_id': '51', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/11/2025', 'meet_id': '0', 'resultType': '1', 'meet': 'Penfield', 'athlete_id': '641779', 'athlete_fname': 'Arthur', 'athlete_lname': 'Woyciesjes', 'graduate': '2027', 'event_name': '200m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '00:26.74', 'event_id': '51', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/11/2025', 'meet_id': '0', 'resultType': '1', 'meet': 'Penfield', 'athlete_id': '643385', 'athlete_fname': 'Jayden', 'athlete_lname': 'Quinones', 'graduate': '2027', 'event_name': '200m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '00:26.77', 'event_id': '51', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '641763', 'athlete_fname': 'Griffin', 'athlete_lname': 'Foster', 'graduate': '2027', 'event_name': '200m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '00:27.07', 'event_id': '51', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '648750', 'athlete_fname': 'Cole', 'athlete_lname': 'Yarbrough', 'graduate': '2028', 'event_name': '200m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '00:27.09', 'event_id': '51', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '646089', 'athlete_fname': 'Zach', 'athlete_lname': 'King', 'graduate': '2028', 'event_name': '200m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '00:27.37', 'event_id': '51', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '648732', 'athlete_fname': 'Ryan', 'athlete_lname': 'Bayley', 'graduate': '2028', 'event_name': '200m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '00:28.18', 'event_id': '51', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '648734', 'athlete_fname': 'Caden', 'athlete_lname': 'Browne', 'graduate': '2028', 'event_name': '200m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '00:28.64', 'event_id': '51', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/11/2025', 'meet_id': '0', 'resultType': '1', 'meet': 'Penfield', 'athlete_id': '648735', 'athlete_fname': 'Torstan', 'athlete_lname': 'Cardinal', 'graduate': '2026', 'event_name': '200m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '00:31.90', 'event_id': '51', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '646088', 'athlete_fname': 'Joey', 'athlete_lname': 'Kanada', 'graduate': '2028', 'event_name': '200m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '00:32.70', 'event_id': '51', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '650769', 'athlete_fname': 'Dominik', 'athlete_lname': 'Conley', 'graduate': '2027', 'event_name': '200m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '00:33.59', 'event_id': '51', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '641759', 'athlete_fname': 'SaVon', 'athlete_lname': 'Bryant', 'graduate': '2026', 'event_name': '200m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '00:44.31', 'event_id': '5', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/19/2025', 'meet_id': '2043', 'resultType': '0', 'meet': 'Webster Invitational', 'athlete_id': '11578', 'athlete_fname': 'A', 'athlete_lname': 'Relay Team', 'graduate': '9999', 'event_name': '4x100 Relay', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '00:51.54', 'event_id': '49', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/11/2025', 'meet_id': '0', 'resultType': '1', 'meet': 'Penfield', 'athlete_id': '628873', 'athlete_fname': 'Frank', 'athlete_lname': "D'Angelo", 'graduate': '2025', 'event_name': '400m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '00:53.14', 'event_id': '49', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/11/2025', 'meet_id': '0', 'resultType': '1', 'meet': 'Penfield', 'athlete_id': '647022', 'athlete_fname': 'Sam', 'athlete_lname': 'Newburge', 'graduate': '2026', 'event_name': '400m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '00:53.44', 'event_id': '49', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/11/2025', 'meet_id': '0', 'resultType': '1', 'meet': 'Penfield', 'athlete_id': '626265', 'athlete_fname': 'Jackson', 'athlete_lname': 'Hickey', 'graduate': '2026', 'event_name': '400m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '00:55.91', 'event_id': '49', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/19/2025', 'meet_id': '2043', 'resultType': '0', 'meet': 'Webster Invitational', 'athlete_id': '626248', 'athlete_fname': 'David', 'athlete_lname': 'Blodgett', 'graduate': '2026', 'event_name': '400m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '00:56.18', 'event_id': '49', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '633923', 'athlete_fname': 'Brayden', 'athlete_lname': 'Schlicker', 'graduate': '2026', 'event_name': '400m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '00:56.38', 'event_id': '49', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '626252', 'athlete_fname': 'Andrew', 'athlete_lname': 'Hain', 'graduate': '2026', 'event_name': '400m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '00:57.58', 'event_id': '49', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/19/2025', 'meet_id': '2043', 'resultType': '0', 'meet': 'Webster Invitational', 'athlete_id': '647020', 'athlete_fname': 'Remington', 'athlete_lname': 'Kayser', 'graduate': '2028', 'event_name': '400m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '00:57.68', 'event_id': '49', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '632845', 'athlete_fname': 'T. J.', 'athlete_lname': 'Pasley', 'graduate': '2028', 'event_name': '400m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '00:58.30', 'event_id': '49', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '647015', 'athlete_fname': 'Ryan', 'athlete_lname': 'Balsamo', 'graduate': '2028', 'event_name': '400m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '00:58.74', 'event_id': '49', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/11/2025', 'meet_id': '0', 'resultType': '1', 'meet': 'Penfield', 'athlete_id': '648737', 'athlete_fname': 'Benjamin', 'athlete_lname': 'Crelley', 'graduate': '2027', 'event_name': '400m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '00:59.71', 'event_id': '49', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '647029', 'athlete_fname': 'Brandon', 'athlete_lname': 'Wildrick', 'graduate': '2026', 'event_name': '400m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '01:00.54', 'event_id': '49', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/11/2025', 'meet_id': '0', 'resultType': '1', 'meet': 'Penfield', 'athlete_id': '635726', 'athlete_fname': 'Andrew', 'athlete_lname': 'Kelly', 'graduate': '2025', 'event_name': '400m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '01:03.15', 'event_id': '49', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '648744', 'athlete_fname': 'Elijah', 'athlete_lname': 'Pasley', 'graduate': '2028', 'event_name': '400m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '01:04.44', 'event_id': '4', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/11/2025', 'meet_id': '0', 'resultType': '1', 'meet': 'Penfield', 'athlete_id': '626248', 'athlete_fname': 'David', 'athlete_lname': 'Blodgett', 'graduate': '2026', 'event_name': '400 Int Hurdles', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '01:05.47', 'event_id': '49', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '632851', 'athlete_fname': 'Roscoe', 'athlete_lname': 'Broadbent', 'graduate': '2028', 'event_name': '400m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '01:06.34', 'event_id': '4', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/11/2025', 'meet_id': '0', 'resultType': '1', 'meet': 'Penfield', 'athlete_id': '631950', 'athlete_fname': 'Jacob', 'athlete_lname': 'Kolson', 'graduate': '2026', 'event_name': '400 Int Hurdles', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '01:10.74', 'event_id': '4', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/11/2025', 'meet_id': '0', 'resultType': '1', 'meet': 'Penfield', 'athlete_id': '638365', 'athlete_fname': 'Ethan', 'athlete_lname': 'Burns', 'graduate': '2027', 'event_name': '400 Int Hurdles', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '01:12.70', 'event_id': '4', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/26/2025', 'meet_id': '2048', 'resultType': '0', 'meet': 'His & Her Invitational', 'athlete_id': '648738', 'athlete_fname': 'Colin', 'athlete_lname': 'Deuel', 'graduate': '2028', 'event_name': '400 Int Hurdles', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '01:13.90', 'event_id': '49', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '650769', 'athlete_fname': 'Dominik', 'athlete_lname': 'Conley', 'graduate': '2027', 'event_name': '400m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '01:14.76', 'event_id': '49', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '646088', 'athlete_fname': 'Joey', 'athlete_lname': 'Kanada', 'graduate': '2028', 'event_name': '400m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '02:04.29', 'event_id': '50', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/19/2025', 'meet_id': '2043', 'resultType': '0', 'meet': 'Webster Invitational', 'athlete_id': '626265', 'athlete_fname': 'Jackson', 'athlete_lname': 'Hickey', 'graduate': '2026', 'event_name': '800m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '02:07.14', 'event_id': '50', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '626246', 'athlete_fname': 'Andrew', 'athlete_lname': 'Green', 'graduate': '2026', 'event_name': '800m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '02:09.22', 'event_id': '50', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/26/2025', 'meet_id': '2048', 'resultType': '0', 'meet': 'His & Her Invitational', 'athlete_id': '626245', 'athlete_fname': 'Ethan', 'athlete_lname': 'Leombrone', 'graduate': '2026', 'event_name': '800m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '02:12.64', 'event_id': '50', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/11/2025', 'meet_id': '0', 'resultType': '1', 'meet': 'Penfield', 'athlete_id': '626244', 'athlete_fname': 'Henry', 'athlete_lname': 'Hill', 'graduate': '2026', 'event_name': '800m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '02:13.98', 'event_id': '50', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '632848', 'athlete_fname': 'Tobin', 'athlete_lname': 'Ruder', 'graduate': '2028', 'event_name': '800m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '02:21.84', 'event_id': '50', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/11/2025', 'meet_id': '0', 'resultType': '1', 'meet': 'Penfield', 'athlete_id': '648746', 'athlete_fname': 'Patrick', 'athlete_lname': 'Rinefierd', 'graduate': '2027', 'event_name': '800m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '02:22.24', 'event_id': '50', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/11/2025', 'meet_id': '0', 'resultType': '1', 'meet': 'Penfield', 'athlete_id': '638367', 'athlete_fname': 'Tyler', 'athlete_lname': 'Ferri', 'graduate': '2025', 'event_name': '800m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '02:27.73', 'event_id': '50', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '646091', 'athlete_fname': 'Andrew', 'athlete_lname': 'Osinski', 'graduate': '2028', 'event_name': '800m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '02:30.27', 'event_id': '50', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '635726', 'athlete_fname': 'Andrew', 'athlete_lname': 'Kelly', 'graduate': '2025', 'event_name': '800m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '02:30.27', 'event_id': '50', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '635726', 'athlete_fname': 'Andrew', 'athlete_lname': 'Kelly', 'graduate': '2025', 'event_name': '800m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '02:32.48', 'event_id': '50', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '646090', 'athlete_fname': 'Ethan', 'athlete_lname': 'Osinski', 'graduate': '2028', 'event_name': '800m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '02:35.29', 'event_id': '50', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '647019', 'athlete_fname': 'Kaden', 'athlete_lname': 'Fuller', 'graduate': '2028', 'event_name': '800m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '02:35.44', 'event_id': '50', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/11/2025', 'meet_id': '0', 'resultType': '1', 'meet': 'Penfield', 'athlete_id': '641767', 'athlete_fname': 'Daniel', 'athlete_lname': 'Lax', 'graduate': '2027', 'event_name': '800m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '02:36.44', 'event_id': '50', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '632845', 'athlete_fname': 'T. J.', 'athlete_lname': 'Pasley', 'graduate': '2028', 'event_name': '800m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '02:36.68', 'event_id': '50', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '638365', 'athlete_fname': 'Ethan', 'athlete_lname': 'Burns', 'graduate': '2027', 'event_name': '800m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '02:37.32', 'event_id': '50', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '628879', 'athlete_fname': 'Ryan', 'athlete_lname': 'Moose', 'graduate': '2025', 'event_name': '800m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '02:37.73', 'event_id': '50', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '648744', 'athlete_fname': 'Elijah', 'athlete_lname': 'Pasley', 'graduate': '2028', 'event_name': '800m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '02:38.04', 'event_id': '50', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/11/2025', 'meet_id': '0', 'resultType': '1', 'meet': 'Penfield', 'athlete_id': '632853', 'athlete_fname': 'Vincent', 'athlete_lname': 'Teresi', 'graduate': '2028', 'event_name': '800m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '02:42.58', 'event_id': '50', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '632635', 'athlete_fname': 'Jack', 'athlete_lname': 'Shafer', 'graduate': '2026', 'event_name': '800m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '029-06.00', 'event_id': '14', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/11/2025', 'meet_id': '0', 'resultType': '1', 'meet': 'Penfield', 'athlete_id': '628745', 'athlete_fname': 'Ash', 'athlete_lname': 'Talma', 'graduate': '2025', 'event_name': 'Discus Throw', 'tf': 'F', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '03:39.46', 'event_id': '6', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/26/2025', 'meet_id': '2048', 'resultType': '0', 'meet': 'His & Her Invitational', 'athlete_id': '11578', 'athlete_fname': 'A', 'athlete_lname': 'Relay Team', 'graduate': '9999', 'event_name': '4x400 Relay', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '04:02.60', 'event_id': '9', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/26/2025', 'meet_id': '2048', 'resultType': '0', 'meet': 'His & Her Invitational', 'athlete_id': '11578', 'athlete_fname': 'A', 'athlete_lname': 'Relay Team', 'graduate': '9999', 'event_name': '1600 SMR (8-2-2-4)', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '04-06.00', 'event_id': '30', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/11/2025', 'meet_id': '0', 'resultType': '1', 'meet': 'Penfield', 'athlete_id': '648733', 'athlete_fname': 'Ben', 'athlete_lname': 'Blake', 'graduate': '2028', 'event_name': 'High Jump', 'tf': 'F', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '04-07.00', 'event_id': '30', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '632851', 'athlete_fname': 'Roscoe', 'athlete_lname': 'Broadbent', 'graduate': '2028', 'event_name': 'High Jump', 'tf': 'F', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '04-07.00', 'event_id': '30', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '650727', 'athlete_fname': 'Jack', 'athlete_lname': 'Hinchcliffe', 'graduate': '2025', 'event_name': 'High Jump', 'tf': 'F', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '04-07.00', 'event_id': '30', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '646089', 'athlete_fname': 'Zach', 'athlete_lname': 'King', 'graduate': '2028', 'event_name': 'High Jump', 'tf': 'F', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '04-09.00', 'event_id': '30', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/11/2025', 'meet_id': '0', 'resultType': '1', 'meet': 'Penfield', 'athlete_id': '647016', 'athlete_fname': 'Amare', 'athlete_lname': 'Bordley', 'graduate': '2028', 'event_name': 'High Jump', 'tf': 'F', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '04-10.00', 'event_id': '30', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '648741', 'athlete_fname': 'Eli', 'athlete_lname': 'Harrison', 'graduate': '2027', 'event_name': 'High Jump', 'tf': 'F', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '04:33.54', 'event_id': '26', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/26/2025', 'meet_id': '2048', 'resultType': '0', 'meet': 'His & Her Invitational', 'athlete_id': '626265', 'athlete_fname': 'Jackson', 'athlete_lname': 'Hickey', 'graduate': '2026', 'event_name': '1600m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '04:42.76', 'event_id': '26', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '626244', 'athlete_fname': 'Henry', 'athlete_lname': 'Hill', 'graduate': '2026', 'event_name': '1600m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '04:47.63', 'event_id': '26', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '634905', 'athlete_fname': 'Jacob', 'athlete_lname': 'Pacer', 'graduate': '2027', 'event_name': '1600m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '04:49.24', 'event_id': '26', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/11/2025', 'meet_id': '0', 'resultType': '1', 'meet': 'Penfield', 'athlete_id': '626252', 'athlete_fname': 'Andrew', 'athlete_lname': 'Hain', 'graduate': '2026', 'event_name': '1600m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '04:51.93', 'event_id': '26', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/19/2025', 'meet_id': '2043', 'resultType': '0', 'meet': 'Webster Invitational', 'athlete_id': '626245', 'athlete_fname': 'Ethan', 'athlete_lname': 'Leombrone', 'graduate': '2026', 'event_name': '1600m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '048-10.00', 'event_id': '14', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '639979', 'athlete_fname': 'Grady', 'athlete_lname': 'Tome', 'graduate': '2026', 'event_name': 'Discus Throw', 'tf': 'F', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '05-01.00', 'event_id': '30', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/04/2025', 'meet_id': '2051', 'resultType': '0', 'meet': 'Victor Pent / Steeple Invit', 'athlete_id': '639973', 'athlete_fname': 'Jared', 'athlete_lname': 'Mulley', 'graduate': '2027', 'event_name': 'High Jump', 'tf': 'F', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '05-01.00', 'event_id': '30', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/04/2025', 'meet_id': '2051', 'resultType': '0', 'meet': 'Victor Pent / Steeple Invit', 'athlete_id': '628873', 'athlete_fname': 'Frank', 'athlete_lname': "D'Angelo", 'graduate': '2025', 'event_name': 'High Jump', 'tf': 'F', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '05-03.00', 'event_id': '30', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '626259', 'athlete_fname': 'Sean', 'athlete_lname': 'Gossin', 'graduate': '2026', 'event_name': 'High Jump', 'tf': 'F', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '05-05.00', 'event_id': '30', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '641778', 'athlete_fname': 'Ethan', 'athlete_lname': 'Torres', 'graduate': '2027', 'event_name': 'High Jump', 'tf': 'F', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '05:06.27', 'event_id': '26', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '648746', 'athlete_fname': 'Patrick', 'athlete_lname': 'Rinefierd', 'graduate': '2027', 'event_name': '1600m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '05-07.00', 'event_id': '30', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/04/2025', 'meet_id': '2051', 'resultType': '0', 'meet': 'Victor Pent / Steeple Invit', 'athlete_id': '639977', 'athlete_fname': 'Leith', 'athlete_lname': 'Steele', 'graduate': '2027', 'event_name': 'High Jump', 'tf': 'F', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '05:07.24', 'event_id': '26', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/11/2025', 'meet_id': '0', 'resultType': '1', 'meet': 'Penfield', 'athlete_id': '632848', 'athlete_fname': 'Tobin', 'athlete_lname': 'Ruder', 'graduate': '2028', 'event_name': '1600m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '05:23.09', 'event_id': '26', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '638367', 'athlete_fname': 'Tyler', 'athlete_lname': 'Ferri', 'graduate': '2025', 'event_name': '1600m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '05:25.52', 'event_id': '26', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '632835', 'athlete_fname': 'Brandon', 'athlete_lname': 'Green', 'graduate': '2028', 'event_name': '1600m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '05:25.57', 'event_id': '26', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '626270', 'athlete_fname': 'Joseph', 'athlete_lname': 'Marafioti', 'graduate': '2027', 'event_name': '1600m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '05:27.33', 'event_id': '26', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '632832', 'athlete_fname': 'Anthony', 'athlete_lname': 'Bracco', 'graduate': '2028', 'event_name': '1600m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '05:29.05', 'event_id': '25', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/26/2025', 'meet_id': '2048', 'resultType': '0', 'meet': 'His & Her Invitational', 'athlete_id': '641778', 'athlete_fname': 'Ethan', 'athlete_lname': 'Torres', 'graduate': '2027', 'event_name': '1500m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '05:32.53', 'event_id': '26', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '641767', 'athlete_fname': 'Daniel', 'athlete_lname': 'Lax', 'graduate': '2027', 'event_name': '1600m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '05:38.13', 'event_id': '26', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '632853', 'athlete_fname': 'Vincent', 'athlete_lname': 'Teresi', 'graduate': '2028', 'event_name': '1600m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '054-10.00', 'event_id': '14', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/11/2025', 'meet_id': '0', 'resultType': '1', 'meet': 'Penfield', 'athlete_id': '634900', 'athlete_fname': 'Logan', 'athlete_lname': 'Fasy', 'graduate': '2026', 'event_name': 'Discus Throw', 'tf': 'F', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '05:45.74', 'event_id': '26', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/11/2025', 'meet_id': '0', 'resultType': '1', 'meet': 'Penfield', 'athlete_id': '647019', 'athlete_fname': 'Kaden', 'athlete_lname': 'Fuller', 'graduate': '2028', 'event_name': '1600m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '05:50.24', 'event_id': '26', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/11/2025', 'meet_id': '0', 'resultType': '1', 'meet': 'Penfield', 'athlete_id': '634901', 'athlete_fname': 'Sebastian', 'athlete_lname': 'Friedman', 'graduate': '2025', 'event_name': '1600m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '055-06.00', 'event_id': '14', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '650727', 'athlete_fname': 'Jack', 'athlete_lname': 'Hinchcliffe', 'graduate': '2025', 'event_name': 'Discus Throw', 'tf': 'F', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '05:52.34', 'event_id': '26', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/11/2025', 'meet_id': '0', 'resultType': '1', 'meet': 'Penfield', 'athlete_id': '646090', 'athlete_fname': 'Ethan', 'athlete_lname': 'Osinski', 'graduate': '2028', 'event_name': '1600m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '05:59.13', 'event_id': '26', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '632834', 'athlete_fname': 'Michael', 'athlete_lname': 'Gorman', 'graduate': '2028', 'event_name': '1600m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '060-04.00', 'event_id': '14', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '648734', 'athlete_fname': 'Caden', 'athlete_lname': 'Browne', 'graduate': '2028', 'event_name': 'Discus Throw', 'tf': 'F', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '06-02.00', 'event_id': '30', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/19/2025', 'meet_id': '2043', 'resultType': '0', 'meet': 'Webster Invitational', 'athlete_id': '648736', 'athlete_fname': 'Sir Joshuah', 'athlete_lname': 'Craddock', 'graduate': '2028', 'event_name': 'High Jump', 'tf': 'F', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '06:05.08', 'event_id': '25', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/04/2025', 'meet_id': '2051', 'resultType': '0', 'meet': 'Victor Pent / Steeple Invit', 'athlete_id': '639977', 'athlete_fname': 'Leith', 'athlete_lname': 'Steele', 'graduate': '2027', 'event_name': '1500m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '069-09.00', 'event_id': '14', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '650608', 'athlete_fname': 'Josh', 'athlete_lname': 'Casler', 'graduate': '2027', 'event_name': 'Discus Throw', 'tf': 'F', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '07-06.00', 'event_id': '32', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '648748', 'athlete_fname': 'Gabriel', 'athlete_lname': 'Vantucci', 'graduate': '2028', 'event_name': 'Pole Vault', 'tf': 'F', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '07-06.00', 'event_id': '32', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '648742', 'athlete_fname': 'Atticus', 'athlete_lname': 'Holzhacker', 'graduate': '2027', 'event_name': 'Pole Vault', 'tf': 'F', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '07-06.00', 'event_id': '32', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '648748', 'athlete_fname': 'Gabriel', 'athlete_lname': 'Vantucci', 'graduate': '2028', 'event_name': 'Pole Vault', 'tf': 'F', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '078-11.00', 'event_id': '14', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/11/2025', 'meet_id': '0', 'resultType': '1', 'meet': 'Penfield', 'athlete_id': '634907', 'athlete_fname': 'Tayvon', 'athlete_lname': 'Peterson', 'graduate': '2025', 'event_name': 'Discus Throw', 'tf': 'F', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '08-00.00', 'event_id': '32', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '648739', 'athlete_fname': 'Bruce', 'athlete_lname': 'Eggler', 'graduate': '2026', 'event_name': 'Pole Vault', 'tf': 'F', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '087-07.00', 'event_id': '14', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '648749', 'athlete_fname': 'Mason', 'athlete_lname': 'White', 'graduate': '2026', 'event_name': 'Discus Throw', 'tf': 'F', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '09-00.00', 'event_id': '32', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '641763', 'athlete_fname': 'Griffin', 'athlete_lname': 'Foster', 'graduate': '2027', 'event_name': 'Pole Vault', 'tf': 'F', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '090-00.00', 'event_id': '14', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '648732', 'athlete_fname': 'Ryan', 'athlete_lname': 'Bayley', 'graduate': '2028', 'event_name': 'Discus Throw', 'tf': 'F', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '09:13.51', 'event_id': '7', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '11578', 'athlete_fname': 'A', 'athlete_lname': 'Relay Team', 'graduate': '9999', 'event_name': '4x800 Relay', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '10:03.05', 'event_id': '54', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/26/2025', 'meet_id': '2048', 'resultType': '0', 'meet': 'His & Her Invitational', 'athlete_id': '626244', 'athlete_fname': 'Henry', 'athlete_lname': 'Hill', 'graduate': '2026', 'event_name': '3200m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '10:21.41', 'event_id': '54', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '626245', 'athlete_fname': 'Ethan', 'athlete_lname': 'Leombrone', 'graduate': '2026', 'event_name': '3200m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '10:30.16', 'event_id': '54', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/26/2025', 'meet_id': '2048', 'resultType': '0', 'meet': 'His & Her Invitational', 'athlete_id': '634905', 'athlete_fname': 'Jacob', 'athlete_lname': 'Pacer', 'graduate': '2027', 'event_name': '3200m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '10:32.17', 'event_id': '54', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/19/2025', 'meet_id': '2043', 'resultType': '0', 'meet': 'Webster Invitational', 'athlete_id': '626246', 'athlete_fname': 'Andrew', 'athlete_lname': 'Green', 'graduate': '2026', 'event_name': '3200m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '10:52.10', 'event_id': '12', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/04/2025', 'meet_id': '2051', 'resultType': '0', 'meet': 'Victor Pent / Steeple Invit', 'athlete_id': '626252', 'athlete_fname': 'Andrew', 'athlete_lname': 'Hain', 'graduate': '2026', 'event_name': '3000m Steeple', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '11:03.09', 'event_id': '54', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '626269', 'athlete_fname': 'Joshua', 'athlete_lname': 'Passalugo', 'graduate': '2027', 'event_name': '3200m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '11-06.00', 'event_id': '32', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/19/2025', 'meet_id': '2043', 'resultType': '0', 'meet': 'Webster Invitational', 'athlete_id': '626253', 'athlete_fname': 'Daniel', 'athlete_lname': 'Oyesiku', 'graduate': '2026', 'event_name': 'Pole Vault', 'tf': 'F', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '111-09.00', 'event_id': '14', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/26/2025', 'meet_id': '2048', 'resultType': '0', 'meet': 'His & Her Invitational', 'athlete_id': '633893', 'athlete_fname': 'Isaiah', 'athlete_lname': 'Collins', 'graduate': '2026', 'event_name': 'Discus Throw', 'tf': 'F', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '11:27.41', 'event_id': '12', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/26/2025', 'meet_id': '2048', 'resultType': '0', 'meet': 'His & Her Invitational', 'athlete_id': '632848', 'athlete_fname': 'Tobin', 'athlete_lname': 'Ruder', 'graduate': '2028', 'event_name': '3000m Steeple', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '11:39.14', 'event_id': '54', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/11/2025', 'meet_id': '0', 'resultType': '1', 'meet': 'Penfield', 'athlete_id': '626270', 'athlete_fname': 'Joseph', 'athlete_lname': 'Marafioti', 'graduate': '2027', 'event_name': '3200m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '11:42.75', 'event_id': '54', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '626267', 'athlete_fname': 'Brayden', 'athlete_lname': 'Vandeburg', 'graduate': '2026', 'event_name': '3200m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '11:55.54', 'event_id': '54', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/11/2025', 'meet_id': '0', 'resultType': '1', 'meet': 'Penfield', 'athlete_id': '632832', 'athlete_fname': 'Anthony', 'athlete_lname': 'Bracco', 'graduate': '2028', 'event_name': '3200m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '12-00.00', 'event_id': '32', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '631950', 'athlete_fname': 'Jacob', 'athlete_lname': 'Kolson', 'graduate': '2026', 'event_name': 'Pole Vault', 'tf': 'F', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '120-03.00', 'event_id': '14', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '641772', 'athlete_fname': 'Joseph', 'athlete_lname': 'Roselli', 'graduate': '2025', 'event_name': 'Discus Throw', 'tf': 'F', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '12:14.70', 'event_id': '54', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '634901', 'athlete_fname': 'Sebastian', 'athlete_lname': 'Friedman', 'graduate': '2025', 'event_name': '3200m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '12:19.43', 'event_id': '12', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/04/2025', 'meet_id': '2051', 'resultType': '0', 'meet': 'Victor Pent / Steeple Invit', 'athlete_id': '626270', 'athlete_fname': 'Joseph', 'athlete_lname': 'Marafioti', 'graduate': '2027', 'event_name': '3000m Steeple', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '12:29.39', 'event_id': '12', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/04/2025', 'meet_id': '2051', 'resultType': '0', 'meet': 'Victor Pent / Steeple Invit', 'athlete_id': '631950', 'athlete_fname': 'Jacob', 'athlete_lname': 'Kolson', 'graduate': '2026', 'event_name': '3000m Steeple', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '12:36.34', 'event_id': '54', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/19/2025', 'meet_id': '2043', 'resultType': '0', 'meet': 'Webster Invitational', 'athlete_id': '632835', 'athlete_fname': 'Brandon', 'athlete_lname': 'Green', 'graduate': '2028', 'event_name': '3200m', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '12:39.81', 'event_id': '12', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/04/2025', 'meet_id': '2051', 'resultType': '0', 'meet': 'Victor Pent / Steeple Invit', 'athlete_id': '626267', 'athlete_fname': 'Brayden', 'athlete_lname': 'Vandeburg', 'graduate': '2026', 'event_name': '3000m Steeple', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '124-08.00', 'event_id': '14', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '628873', 'athlete_fname': 'Frank', 'athlete_lname': "D'Angelo", 'graduate': '2025', 'event_name': 'Discus Throw', 'tf': 'F', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '13:07.47', 'event_id': '12', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/04/2025', 'meet_id': '2051', 'resultType': '0', 'meet': 'Victor Pent / Steeple Invit', 'athlete_id': '638365', 'athlete_fname': 'Ethan', 'athlete_lname': 'Burns', 'graduate': '2027', 'event_name': '3000m Steeple', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '13-10.50', 'event_id': '31', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/11/2025', 'meet_id': '0', 'resultType': '1', 'meet': 'Penfield', 'athlete_id': '648747', 'athlete_fname': 'Troy', 'athlete_lname': 'Sanchez', 'graduate': '2027', 'event_name': 'Long Jump', 'tf': 'F', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '13:47.87', 'event_id': '12', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/04/2025', 'meet_id': '2051', 'resultType': '0', 'meet': 'Victor Pent / Steeple Invit', 'athlete_id': '641767', 'athlete_fname': 'Daniel', 'athlete_lname': 'Lax', 'graduate': '2027', 'event_name': '3000m Steeple', 'tf': 'T', 'team_id': '85', 'team_name': 'Fairport', 'qual': ' <img src="http://yentiming.com/images/super.png" class="qual_img" title="Automatic Qualifier" />'}, {'performance': '14-04.75', 'event_id': '31', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/11/2025', 'meet_id': '0', 'resultType': '1', 'meet': 'Penfield', 'athlete_id': '632851', 'athlete_fname': 'Roscoe', 'athlete_lname': 'Broadbent', 'graduate': '2028', 'event_name': 'Long Jump', 'tf': 'F', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '14-08.00', 'event_id': '31', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '641758', 'athlete_fname': 'Ethan', 'athlete_lname': 'Betz', 'graduate': '2027', 'event_name': 'Long Jump', 'tf': 'F', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '15-03.25', 'event_id': '31', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/11/2025', 'meet_id': '0', 'resultType': '1', 'meet': 'Penfield', 'athlete_id': '626260', 'athlete_fname': 'Jaki', 'athlete_lname': 'Huang', 'graduate': '2026', 'event_name': 'Long Jump', 'tf': 'F', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '15-03.25', 'event_id': '31', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/19/2025', 'meet_id': '2043', 'resultType': '0', 'meet': 'Webster Invitational', 'athlete_id': '647029', 'athlete_fname': 'Brandon', 'athlete_lname': 'Wildrick', 'graduate': '2026', 'event_name': 'Long Jump', 'tf': 'F', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '16-05.50', 'event_id': '31', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '633907', 'athlete_fname': 'Peter', 'athlete_lname': 'Huang', 'graduate': '2026', 'event_name': 'Long Jump', 'tf': 'F', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '16-10.50', 'event_id': '31', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '648735', 'athlete_fname': 'Torstan', 'athlete_lname': 'Cardinal', 'graduate': '2026', 'event_name': 'Long Jump', 'tf': 'F', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '17-10.25', 'event_id': '31', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/26/2025', 'meet_id': '2048', 'resultType': '0', 'meet': 'His & Her Invitational', 'athlete_id': '641778', 'athlete_fname': 'Ethan', 'athlete_lname': 'Torres', 'graduate': '2027', 'event_name': 'Long Jump', 'tf': 'F', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '17-10.50', 'event_id': '31', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/11/2025', 'meet_id': '0', 'resultType': '1', 'meet': 'Penfield', 'athlete_id': '628875', 'athlete_fname': 'Bailey', 'athlete_lname': 'Frank', 'graduate': '2025', 'event_name': 'Long Jump', 'tf': 'F', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '18-02.00', 'event_id': '31', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/04/2025', 'meet_id': '2051', 'resultType': '0', 'meet': 'Victor Pent / Steeple Invit', 'athlete_id': '628873', 'athlete_fname': 'Frank', 'athlete_lname': "D'Angelo", 'graduate': '2025', 'event_name': 'Long Jump', 'tf': 'F', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '19-01.50', 'event_id': '29', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/11/2025', 'meet_id': '0', 'resultType': '1', 'meet': 'Penfield', 'athlete_id': '628745', 'athlete_fname': 'Ash', 'athlete_lname': 'Talma', 'graduate': '2025', 'event_name': 'Shot Put', 'tf': 'F', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '20-00.50', 'event_id': '31', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '633923', 'athlete_fname': 'Brayden', 'athlete_lname': 'Schlicker', 'graduate': '2026', 'event_name': 'Long Jump', 'tf': 'F', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '22-07.50', 'event_id': '29', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '639979', 'athlete_fname': 'Grady', 'athlete_lname': 'Tome', 'graduate': '2026', 'event_name': 'Shot Put', 'tf': 'F', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '22-08.00', 'event_id': '31', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/19/2025', 'meet_id': '2043', 'resultType': '0', 'meet': 'Webster Invitational', 'athlete_id': '639977', 'athlete_fname': 'Leith', 'athlete_lname': 'Steele', 'graduate': '2027', 'event_name': 'Long Jump', 'tf': 'F', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '2260', 'event_id': '13', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/04/2025', 'meet_id': '2051', 'resultType': '0', 'meet': 'Victor Pent / Steeple Invit', 'athlete_id': '639977', 'athlete_fname': 'Leith', 'athlete_lname': 'Steele', 'graduate': '2027', 'event_name': 'Pentathlon', 'tf': 'F', 'team_id': '85', 'team_name': 'Fairport', 'qual': '', 'results': '2260'}, {'performance': '23-02.00', 'event_id': '29', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '634900', 'athlete_fname': 'Logan', 'athlete_lname': 'Fasy', 'graduate': '2026', 'event_name': 'Shot Put', 'tf': 'F', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '23-11.75', 'event_id': '29', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '647031', 'athlete_fname': 'Nico', 'athlete_lname': 'Zukaitis', 'graduate': '2028', 'event_name': 'Shot Put', 'tf': 'F', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '2326', 'event_id': '13', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/26/2025', 'meet_id': '2048', 'resultType': '0', 'meet': 'His & Her Invitational', 'athlete_id': '641778', 'athlete_fname': 'Ethan', 'athlete_lname': 'Torres', 'graduate': '2027', 'event_name': 'Pentathlon', 'tf': 'F', 'team_id': '85', 'team_name': 'Fairport', 'qual': '', 'results': '2326'}, {'performance': '24-06.25', 'event_id': '29', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '641764', 'athlete_fname': 'Carson', 'athlete_lname': 'Gould', 'graduate': '2027', 'event_name': 'Shot Put', 'tf': 'F', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '25-09.00', 'event_id': '29', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/04/2025', 'meet_id': '2051', 'resultType': '0', 'meet': 'Victor Pent / Steeple Invit', 'athlete_id': '639977', 'athlete_fname': 'Leith', 'athlete_lname': 'Steele', 'graduate': '2027', 'event_name': 'Shot Put', 'tf': 'F', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '25-09.00', 'event_id': '29', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/04/2025', 'meet_id': '2051', 'resultType': '0', 'meet': 'Victor Pent / Steeple Invit', 'athlete_id': '639977', 'athlete_fname': 'Leith', 'athlete_lname': 'Steele', 'graduate': '2027', 'event_name': 'Shot Put', 'tf': 'F', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '27-02.50', 'event_id': '29', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '650608', 'athlete_fname': 'Josh', 'athlete_lname': 'Casler', 'graduate': '2027', 'event_name': 'Shot Put', 'tf': 'F', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '30-11.75', 'event_id': '29', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/26/2025', 'meet_id': '2048', 'resultType': '0', 'meet': 'His & Her Invitational', 'athlete_id': '641778', 'athlete_fname': 'Ethan', 'athlete_lname': 'Torres', 'graduate': '2027', 'event_name': 'Shot Put', 'tf': 'F', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '32-03.75', 'event_id': '29', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '648749', 'athlete_fname': 'Mason', 'athlete_lname': 'White', 'graduate': '2026', 'event_name': 'Shot Put', 'tf': 'F', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '32-10.00', 'event_id': '29', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/11/2025', 'meet_id': '0', 'resultType': '1', 'meet': 'Penfield', 'athlete_id': '648736', 'athlete_fname': 'Sir Joshuah', 'athlete_lname': 'Craddock', 'graduate': '2028', 'event_name': 'Shot Put', 'tf': 'F', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '33-11.00', 'event_id': '33', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/26/2025', 'meet_id': '2048', 'resultType': '0', 'meet': 'His & Her Invitational', 'athlete_id': '641758', 'athlete_fname': 'Ethan', 'athlete_lname': 'Betz', 'graduate': '2027', 'event_name': 'Triple Jump', 'tf': 'F', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '38-10.50', 'event_id': '29', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '641772', 'athlete_fname': 'Joseph', 'athlete_lname': 'Roselli', 'graduate': '2025', 'event_name': 'Shot Put', 'tf': 'F', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '39-07.50', 'event_id': '29', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '628873', 'athlete_fname': 'Frank', 'athlete_lname': "D'Angelo", 'graduate': '2025', 'event_name': 'Shot Put', 'tf': 'F', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '39-09.00', 'event_id': '29', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/19/2025', 'meet_id': '2043', 'resultType': '0', 'meet': 'Webster Invitational', 'athlete_id': '634907', 'athlete_fname': 'Tayvon', 'athlete_lname': 'Peterson', 'graduate': '2025', 'event_name': 'Shot Put', 'tf': 'F', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '41-06.25', 'event_id': '33', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/26/2025', 'meet_id': '2048', 'resultType': '0', 'meet': 'His & Her Invitational', 'athlete_id': '639977', 'athlete_fname': 'Leith', 'athlete_lname': 'Steele', 'graduate': '2027', 'event_name': 'Triple Jump', 'tf': 'F', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}, {'performance': '41-11.25', 'event_id': '29', 'classs': 'A', 'league': 'Monroe', 'meet_date': '04/23/2025', 'meet_id': '2110', 'resultType': '0', 'meet': 'Fairport @ RH', 'athlete_id': '633893', 'athlete_fname': 'Isaiah', 'athlete_lname': 'Collins', 'graduate': '2026', 'event_name': 'Shot Put', 'tf': 'F', 'team_id': '85', 'team_name': 'Fairport', 'qual': ''}]
+            self.data = sample_records()
+        elif from_archive:
+            self.data = archive.latest(self.year, self.season, self.gender, self.team)
         else:
             self.data = self.get_array()
+            archive.put(self.year, self.season, self.gender, self.data, self.team)
         self.athletes = self.organize_data()
 
 
 
     def organize_data(self):
-        """Organizes an array of athletes' performances into a dictionary"""
+        """Organizes an array of athletes' performances into athlete_id -> Athlete"""
+        with metrics.span('organize_data'):
+            return self._organize_data()
+
+    def _organize_data(self):
         organized_data = {}
         team_relays = {}
 
         for performance in self.data:
             ath_id = performance['athlete_id']
             if ath_id not in organized_data.keys():
-                organized_data[performance['athlete_id']] = {
-                    'name': f'{performance["athlete_fname"]} {performance["athlete_lname"]}',
-                    'team': performance['team_name'],
-                    'grade': (self.year + 12) - int(performance['graduate']),
-                    'performances': {}
-                }
-
-            organized_data[ath_id]['performances'][performance['event_name']] = {
-                'performance': performance['performance'],
-                'date': performance['meet_date'],
-                'meet': performance['meet'],
-                'type': 'track' if performance['tf'] == 'T' else 'field',
-                'fat': (int(performance['resultType']) == 0),
-                'converted': False,
-                'converted_from': None
-            }
+                organized_data[performance['athlete_id']] = Athlete(
+                f'{performance["athlete_fname"]} {performance["athlete_lname"]}',
+                performance['team_name'],
+                (self.year + 12) - int(performance['graduate'])
+            )
+
+            organized_data[ath_id].performances[model.intern(performance['event_name'])] = Performance(
+                performance['performance'],
+                performance['meet_date'],
+                performance['meet'],
+                EventType.TRACK if performance['tf'] == 'T' else EventType.FIELD,
+                int(performance['resultType']) == 0
+            )
 
         return organized_data
 
 
 
-    def get_array(self):
-        """Returns an array containing all athletes of the specific team's top performance in each event"""
-        page = 0
-        has_next = True
-        data = []
+    def merge(self, previous):
+        """Reuses a previously saved season for every athlete whose marks haven't changed
 
-        events = list(json.loads(requests.get('https://www.yentiming.com/results2/getEvents').text)[self.season].keys())
-        url = f'https://www.yentiming.com/leaderboard/get?limit=49&sex={self.gender}&teams[]={self.team}&season={self.season}&year={self.year}'
-        events_query = '&'.join([f'events[]={event}' for event in events])
-        url = f'{url}&{events_query}'
+        Athletes that are unchanged get their saved performances back, conversions included,
+        so only the changed ones need converting again.
 
-        while has_next:
-            page += 1
-            response = requests.get(f'{url}&page={page}').text
-            info = json.loads(json.loads(response))
-            has_next = info['hasNext']
-            data += info['results']
+        Args:
+            previous: the athletes the season was last saved with, athlete_id -> Athlete
 
-        return data
+        Returns:
+            set: the ids of the athletes that are new or whose marks changed
+        """
+        changed = set()
+        for athlete_id, athlete in self.athletes.items():
+            saved = previous.get(athlete_id)
+            if saved is None or not saved.same_athlete(athlete):
+                changed.add(athlete_id)
+                continue
 
-    def add_converted(self):
-        if self.season == 'indoor':
-            self.add_indoor_conversions()
-        elif self.season == 'outdoor':
-            self.add_outdoor_conversions()
+            saved_marks = {event: performance for event, performance in saved.performances.items()
+                           if not performance.converted}
+            if saved_marks != athlete.performances:
+                changed.add(athlete_id)
+                continue
 
+            athlete.performances = saved.performances
 
-    def add_converted_event(self, event_to, *event_from):
-        """Converts similar events to a single event using purdy point conversion
+        return changed
 
-        Args:
-            event_to: The event to convert to and add to the array
-            event_from: The events to convert from
+    def by_team(self):
+        """Splits the athletes of a season fetched for several teams by team
+
+        Returns:
+            dict: team_id -> athlete_id -> Athlete, for every team the season was fetched for
         """
+        teams = {team_id: {} for team_id in team_ids(self.team)}
+        for performance in self.data:
+            athlete_id = performance['athlete_id']
+            teams.setdefault(str(performance['team_id']), {})[athlete_id] = self.athletes[athlete_id]
+        return teams
+
+    @property
+    def watermark(self):
+        """The date and id of the latest meet in the season, as (yyyy-mm-dd, meet_id)"""
+        latest = None
+        for performance in self.data:
+            month, day, year = performance['meet_date'].split('/')
+            meet = (f'{year}-{month}-{day}', int(performance['meet_id']))
+            if latest is None or meet > latest:
+                latest = meet
+        return latest
+
+    def get_array(self):
+        """Returns an array containing all athletes of the teams' top performance in each event
 
-        event_from = list(event_from)
-        event_from.append(event_to)
+        Every team is asked for in the same leaderboard requests, so a league costs as many
+        pages as its records fill rather than a fetch per team.
+        """
+        with metrics.span('get_array'):
+            return self._get_array()
 
+    def _get_array(self):
+        events = get_events(self.season)
+        url = f'{BASE_URL}/leaderboard/get?limit=49&sex={self.gender}&season={self.season}&year={self.year}'
+        teams_query = '&'.join([f'teams[]={team_id}' for team_id in team_ids(self.team)])
+        events_query = '&'.join([f'events[]={event}' for event in events])
+        url = f'{url}&{teams_query}&{events_query}'
+
+        info = get_page(url, 1)
+        data = info['results']
+        page = 1
+        batch = 2
+
+        # We only learn that a page is the last one once we have it, so pages are requested in growing
+        # batches and anything past the last page is thrown away
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            while info['hasNext']:
+                pages = range(page + 1, page + 1 + batch)
+                for page, info in zip(pages, pool.map(lambda p: get_page(url, p), pages)):
+                    data += info['results']
+                    if not info['hasNext']:
+                        break
+                batch = min(batch * 2, self.concurrency)
 
-        for athlete_id in self.athletes.keys():
-            lowest_time = -1
-            converted_from = None
-            for event in self.athletes[athlete_id]["performances"].keys():
-                if event in event_from:
-                    conversion = (Purdy(event_to_dist(event),
-                                              format_time(self.athletes[athlete_id]["performances"][event]["performance"]))
-                                  .convert(event_to_dist(event_to)))
-                    if conversion < lowest_time or lowest_time == -1:
-                        lowest_time = conversion
-                        converted_from = event
+        return data
 
-            if converted_from and converted_from != event_to:
-                self.athletes[athlete_id]["performances"][event_to] = {
-                    'performance': format_time(lowest_time),
-                    'date': None,
-                    'meet': None,
-                    'type': 'track',
-                    'fat': self.athletes[athlete_id]['performances'][converted_from]['fat'],
-                    'converted': True,
-                    'converted_from': converted_from
-                }
+    def add_converted(self, athlete_ids=None):
+        """Adds the converted events of the season (see fairport_run.conversions)
 
+        Args:
+            athlete_ids: only convert these athletes (defaults to all of them)
+        """
+        graph = conversions.graph(self.season)
+        if graph is not None:
+            with metrics.span('add_converted', season=self.season):
+                graph.apply(self.athletes, athlete_ids)
 
+    def add_scores(self, athlete_ids=None):
+        """Adds the Purdy score of every flat race, converted ones included (see fairport_run.scores)
 
-    def add_indoor_conversions(self):
-        self.add_converted_event('200m', '300m')
-        self.add_converted_event('400m', '300m', '600m')
-        self.add_converted_event('800m', '600m', '1000m')
-        self.add_converted_event('1200m', '1000m', '1600m')
-        self.add_converted_event('1600m', '1500m')
-        self.add_converted_event('1609.34m', '1600m', '1500m')
+        Args:
+            athlete_ids: only score these athletes (defaults to all of them)
+        """
+        with metrics.span('add_scores'):
+            scores.score(self.athletes, athlete_ids)
 
+    def add_converted_event(self, event_to, *event_from, athlete_ids=None):
+        """Converts similar events to a single event using purdy point conversion
 
+        Args:
+            event_to: The event to convert to and add to the array
+            event_from: The events to convert from
+            athlete_ids: only convert these athletes (defaults to all of them)
+        """
+        with metrics.span('add_converted_event', event=event_to):
+            conversions.ConversionGraph([(event_to, event_from)]).apply(self.athletes, athlete_ids)
 
-    def add_outdoor_conversions(self):
-        self.add_converted_event('1200m', '1600m')
-        self.add_converted_event('1600m', '1500m')
-        self.add_converted_event('1609.34m', '1600m', '1500m')
+    def add_indoor_conversions(self, athlete_ids=None):
+        conversions.graph('indoor').apply(self.athletes, athlete_ids)
 
+    def add_outdoor_conversions(self, athlete_ids=None):
+        conversions.graph('outdoor').apply(self.athletes, athlete_ids)
 
     def save_athletes(self, path=None):
+        """Saves the athletes as a snapshot (see fairport_run.snapshot)"""
+        if not path:
+            path = season_path(self.year, self.season, self.gender, self.team)
+
+        path = pathlib.Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        snapshot.dump(self.athletes, path)
+
+    def export_json(self, path=None):
+        """Saves the athletes as JSON"""
         if not path:
-            path = f'{self.season}/{self.gender}/{self.year}.json'
+            path = season_path(self.year, self.season, self.gender, self.team, 'json')
 
         path = pathlib.Path(path)
         path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(path, 'w') as f:
-            f.write(json.dumps(self.athletes, indent=4))
+        atomic_write(path, json.dumps(model.to_dict(self.athletes), indent=4))
 
 
 
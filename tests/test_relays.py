@@ -0,0 +1,57 @@
+"""Relay.generate_relays against every relay of small random rosters"""
+import random
+from collections import Counter
+from itertools import combinations, product
+
+import pytest
+
+from fairport_run.index import EventIndex
+from fairport_run.relays import Relay
+
+LEGS = {
+    '4x200': ['200m'] * 4,
+    'SMR': ['800m', '200m', '200m', '400m'],
+    'DMR': ['1200m', '400m', '800m', '1600m'],
+}
+
+
+def roster(seed, size=9):
+    """Returns event -> [(time, athlete_id), ...], with some tied marks and some athletes missing events"""
+    rng = random.Random(seed)
+    marks = {}
+    for event, fastest in (('200m', 23), ('400m', 50), ('800m', 118), ('1200m', 190), ('1600m', 260)):
+        for athlete in range(size):
+            if rng.random() < 0.8:
+                marks.setdefault(event, []).append((fastest + rng.randint(0, 40) / 4, str(athlete)))
+    return marks
+
+
+def every_relay(marks, legs):
+    """Returns the total of every relay with a different athlete on each leg, fastest first"""
+    choices = [combinations(marks.get(event, []), n) for event, n in Counter(legs).items()]
+    totals = []
+    for picked in product(*choices):
+        runners = [athlete_id for group in picked for _, athlete_id in group]
+        if len(set(runners)) == len(runners):
+            totals.append(round(sum(time for group in picked for time, _ in group), 2))
+    return sorted(totals)
+
+
+@pytest.mark.parametrize('seed', range(10))
+@pytest.mark.parametrize('relay', LEGS)
+def test_relays_match_brute_force(seed, relay):
+    marks = roster(seed)
+    search = Relay(EventIndex({event: list(event_marks) for event, event_marks in marks.items()}), *LEGS[relay])
+    search.generate_relays(15)
+
+    found = []
+    for result in search.relays:
+        runners = [leg['athlete_id'] for leg in result['legs']]
+        assert len(set(runners)) == len(runners)
+        assert [leg['event'] for leg in result['legs']] == LEGS[relay]
+        found.append(round(sum(leg['time'] for leg in result['legs']), 2))
+
+    assert found == every_relay(marks, LEGS[relay])[:15]
+    # Each relay is found once, however its interchangeable legs are ordered
+    assert len({frozenset((leg['event'], leg['athlete_id']) for leg in result['legs'])
+                for result in search.relays}) == len(search.relays)
@@ -0,0 +1,43 @@
+"""Saving seasons as snapshots and reading them back"""
+import pytest
+
+from benchmarks import synthetic
+from fairport_run import model, snapshot
+from fairport_run.index import EventIndex
+
+
+@pytest.fixture(scope='module')
+def athletes():
+    """A synthetic season with its conversions and scores, and a mark with no date"""
+    yen = synthetic.yendata(synthetic.season(300, season='indoor'), season='indoor')
+    yen.add_converted()
+    yen.add_scores()
+    next(iter(next(iter(yen.athletes.values())).performances.values())).date = None
+    return yen.athletes
+
+
+def columns(athletes):
+    return {athlete_id: {event: (performance.time, performance.purdy)
+                         for event, performance in athlete.performances.items()}
+            for athlete_id, athlete in athletes.items()}
+
+
+def test_round_trip(athletes, tmp_path):
+    path = tmp_path / 'season.frs'
+    snapshot.dump(athletes, path)
+    loaded = snapshot.load(path)
+
+    assert model.to_dict(loaded) == model.to_dict(athletes)
+    assert columns(loaded) == columns(athletes)
+    assert list(loaded) == list(athletes)
+
+
+def test_index_matches_athletes(athletes):
+    season = snapshot.Snapshot(snapshot.dumps(athletes))
+    assert EventIndex.from_snapshot(season).marks == EventIndex.from_athletes(athletes).marks
+
+
+@pytest.mark.parametrize('data', [b'', b'FRSN', b'NOPE' + bytes(28)])
+def test_rejects_what_isnt_a_snapshot(data):
+    with pytest.raises(ValueError):
+        snapshot.Snapshot(data)
@@ -0,0 +1,58 @@
+"""YenData.get_array against the local fake yentiming server (benchmarks/fake_yentiming.py)"""
+import pytest
+
+from benchmarks.fake_yentiming import FakeYentiming
+from fairport_run import archive, yendata
+from fairport_run.yendata import YenData
+
+EVENTS = ('100m', '400m', '1600m')
+
+
+def records(count, team_id='85', start=0):
+    return [{
+        'athlete_id': str(start + i),
+        'event_name': EVENTS[i % len(EVENTS)],
+        'team_id': team_id,
+        'sex': 'm',
+        'season': 'outdoor',
+        'year': '2025',
+    } for i in range(count)]
+
+
+@pytest.fixture
+def fake(monkeypatch, tmp_path):
+    """Starts a fake yentiming with no records; tests fill in fake.records"""
+    monkeypatch.setattr(archive, 'ARCHIVE_DIR', str(tmp_path / 'archive'))
+    # The event list is cached across fetches, so each test starts without it
+    monkeypatch.setattr(yendata, '_events', {})
+    with FakeYentiming([], events={'indoor': [], 'outdoor': list(EVENTS)}) as server:
+        monkeypatch.setattr(yendata, 'BASE_URL', server.url)
+        yield server
+
+
+def fetch(team='85', concurrency=8):
+    yen = YenData(season='outdoor', year=2025, gender='m', team=team, testing=True, concurrency=concurrency)
+    return yen.get_array()
+
+
+@pytest.mark.parametrize('concurrency', [1, 8])
+@pytest.mark.parametrize('count', [0, 49, 50, 98, 500])
+def test_pages_come_back_complete_and_in_order(fake, count, concurrency):
+    fake.records = records(count)
+    assert [record['athlete_id'] for record in fetch(concurrency=concurrency)] == [str(i) for i in range(count)]
+
+
+def test_teams_are_fetched_in_the_same_requests(fake):
+    fake.records = records(60, '85') + records(60, '90', start=60) + records(60, '112', start=120)
+
+    league = fetch('90,85')
+    assert [record['athlete_id'] for record in league] == [str(i) for i in range(120)]
+    # 120 records are 3 pages of 49 whichever teams they belong to
+    assert fake.paths['/leaderboard/get'] <= 4
+
+
+def test_events_are_fetched_once(fake):
+    fake.records = records(100)
+    for team in ('85', '85', '90'):
+        fetch(team)
+    assert fake.paths['/results2/getEvents'] == 1